@@ -0,0 +1,114 @@
+"""
+Benchmark how long importing ktane takes, measured with python -X importtime.
+
+Each scenario runs in a fresh interpreter, and its time is the cumulative
+import time of every module it imports beyond those the interpreter starts
+with. Solver modules are imported on first use, so a mission's import time
+should grow with the modules it uses, not with the number of solvers there are.
+Exits with status 1 if any scenario's median goes over the budget.
+Run with ktane importable, e.g. PYTHONPATH=src python bench/bench_import.py
+"""
+
+import argparse
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+from statistics import median
+from typing import Dict, Final, List, Set, Tuple, Union
+
+SCENARIOS: Final = (
+    ("package", "import ktane"),
+    ("first mission", "from ktane.vanilla import Keypad, TheButton, Wires"),
+    ("one mod", "from ktane.mods.t_mods import TurnTheKeys"),
+    ("every solver", "from ktane.module_pools import ALL_SOLVABLE"),
+)
+_LIST_KTANE_MODULES: Final = (
+    "print(*sorted(m for m in sys.modules if m.startswith('ktane')))"
+)
+_US_PER_MS: Final = 1000
+
+Row = Dict[str, Union[str, float, bool]]
+
+
+def _cumulative_times(importtime: str) -> Dict[str, int]:
+    """Cumulative microseconds for each top-level import in -X importtime output."""
+    times: Dict[str, int] = {}
+    for line in importtime.splitlines()[1:]:  # skip the header
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):  # nested imports are already counted
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _import_times(code: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Cumulative microseconds for each top-level import made by running code,
+    and every ktane module loaded by the end of it.
+    """
+    code = "\n".join((code, "import sys", _LIST_KTANE_MODULES))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    # modules imported through a lazy package __getattr__ are timed, but not listed
+    return _cumulative_times(process.stderr), process.stdout.split()
+
+
+def time_imports(code: str, startup: Set[str]) -> Tuple[int, List[str]]:
+    """Microseconds spent importing for code, and the ktane modules it imports."""
+    times, ktane_modules = _import_times(code)
+    imported = times.keys() - startup
+    return sum(times[name] for name in imported), ktane_modules
+
+
+def _time_scenario(
+    scenario: str,
+    code: str,
+    startup: Set[str],
+    repeats: int,
+    budget_ms: float,
+) -> Row:
+    """Time one scenario, taking the median over repeated runs."""
+    timings = []
+    ktane_modules: List[str] = []
+    for _ in range(repeats):
+        microseconds, ktane_modules = time_imports(code, startup)
+        timings.append(microseconds)
+    median_ms = median(timings) / _US_PER_MS
+    return {
+        "scenario": scenario,
+        "code": code,
+        "ktane_modules": len(ktane_modules),
+        "median_ms": median_ms,
+        "within_budget": median_ms <= budget_ms,
+    }
+
+
+def run(repeats: int, budget_ms: float) -> List[Row]:
+    """Time every scenario, taking the median over repeated runs."""
+    startup = set(_import_times("pass")[0])
+    return [
+        _time_scenario(scenario, code, startup, repeats, budget_ms)
+        for scenario, code in SCENARIOS
+    ]
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=9)
+    parser.add_argument("--budget-ms", type=float, default=100)
+    args = parser.parse_args()
+    rows = run(args.repeats, args.budget_ms)
+    print(json.dumps(rows, indent=2))  # noqa: WPS421
+    if not all(row["within_budget"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
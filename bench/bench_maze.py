@@ -0,0 +1,158 @@
+"""
+Benchmark maze.solve_maze with tuple walls against BitMaze walls.
+
+Solves a random perfect maze corner to corner at each size. The tuple form
+checks walls by linear search, so it is only run up to --max-tuple-size.
+Run with ktane importable, e.g. PYTHONPATH=src python bench/bench_maze.py
+"""
+
+import argparse
+import json
+import random
+from functools import partial
+from time import perf_counter
+from typing import Callable, Dict, Final, List, Optional, Set, Tuple, Union
+
+from ktane.solverutils import grid, maze
+
+SIZES = (6, 10, 16, 32, 64, 100, 128, 256)
+DEFAULT_MAX_TUPLE_SIZE = 64
+DEFAULT_REPEATS = 3
+
+_Cell = Tuple[int, int]
+_Walls = Union[Tuple[maze.Wall, ...], maze.BitMaze]
+_MOVES: Final = (
+    (-1, 0),
+    (1, 0),
+    (0, -1),
+    (0, 1),
+)
+# One row of results: the maze size, and how each wall form did on it.
+_Row = Dict[str, Optional[float]]
+
+
+def _all_walls(size: int) -> Set[maze.Wall]:
+    """Every wall of a size by size grid, before any are carved away."""
+    below = {
+        maze.Wall(2 * row + 1, 2 * col)
+        for row in range(size - 1)
+        for col in range(size)
+    }
+    right = {
+        maze.Wall(2 * row, 2 * col + 1)
+        for row in range(size)
+        for col in range(size - 1)
+    }
+    return below | right
+
+
+def _unvisited_neighbors(cell: _Cell, size: int, visited: Set[_Cell]) -> List[_Cell]:
+    row, col = cell
+    neighbors = [
+        (row + d_row, col + d_col)
+        for d_row, d_col in _MOVES
+    ]
+    return [
+        neighbor
+        for neighbor in neighbors
+        if min(neighbor) >= 0 and max(neighbor) < size
+        and neighbor not in visited
+    ]
+
+
+def _wall_between(cell: _Cell, next_cell: _Cell) -> maze.Wall:
+    row, col = cell
+    next_row, next_col = next_cell
+    return maze.Wall(row + next_row, col + next_col)
+
+
+def _carve(walls: Set[maze.Wall], size: int, rng: random.Random) -> None:
+    """Remove walls from a full grid along an iterative depth-first search."""
+    visited = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        options = _unvisited_neighbors(stack[-1], size, visited)
+        if not options:
+            stack.pop()
+            continue
+        next_cell = rng.choice(options)
+        walls.discard(_wall_between(stack[-1], next_cell))
+        visited.add(next_cell)
+        stack.append(next_cell)
+
+
+def random_walls(size: int, seed: int) -> Tuple[maze.Wall, ...]:
+    """Carve a random perfect maze with an iterative depth-first search."""
+    walls = _all_walls(size)
+    _carve(walls, size, random.Random(seed))
+    return tuple(sorted(walls))
+
+
+def time_solve(
+    solve: Callable[[], List[str]], repeats: int,
+) -> Tuple[float, int]:
+    """Return the best time in seconds of several runs, and the path length."""
+    best = float("inf")
+    path: List[str] = []
+    for _ in range(repeats):
+        start = perf_counter()
+        path = solve()
+        best = min(best, perf_counter() - start)
+    return best, len(path)
+
+
+def _corner_solver(dims: grid.Dimensions) -> Callable[[_Walls], List[str]]:
+    """Solve mazes of a size from the top left corner to the bottom right."""
+    goal = maze.Node(dims.rows - 1, dims.cols - 1)
+    return partial(maze.solve_maze, dims, maze.Node(0, 0), goal)
+
+
+def _time_tuple_walls(
+    solve: Callable[[_Walls], List[str]],
+    walls: Tuple[maze.Wall, ...],
+    repeats: int,
+    path_len: int,
+) -> float:
+    """Time the tuple wall form, checking it finds as long a path as BitMaze did."""
+    tuple_time, tuple_len = time_solve(partial(solve, walls), repeats)
+    if tuple_len != path_len:
+        raise RuntimeError("The wall forms found different paths.")
+    return tuple_time
+
+
+def time_size(size: int, max_tuple_size: int, repeats: int) -> _Row:
+    """Time both wall forms on a maze of one size, corner to corner."""
+    dims = grid.Dimensions(size, size)
+    walls = random_walls(size, seed=size)
+    solve = _corner_solver(dims)
+    bit_time, path_len = time_solve(
+        partial(solve, maze.BitMaze.from_walls(dims, walls)), repeats,
+    )
+    return {
+        "size": size,
+        "walls": len(walls),
+        "path_length": path_len,
+        "tuple_seconds": (
+            None if size > max_tuple_size
+            else _time_tuple_walls(solve, walls, repeats, path_len)
+        ),
+        "bitmaze_seconds": bit_time,
+    }
+
+
+def run(max_tuple_size: int, repeats: int) -> List[_Row]:
+    """Time both wall forms at every size."""
+    return [time_size(size, max_tuple_size, repeats) for size in SIZES]
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-tuple-size", type=int, default=DEFAULT_MAX_TUPLE_SIZE)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args()
+    print(json.dumps(run(args.max_tuple_size, args.repeats), indent=2))  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark the BombSolver solve loop as the number of modules grows.
+
+Each bomb has one trivial single-stage solver per module, answered by a
+script that never strikes, so the time per pop is the queue overhead plus a
+constant amount of prompting. Bombs are solved both as they are and with a
+Turn The Keys added, which bans half the modules from being solved before it,
+so they wait in the solve order graph until it is solved.
+The legacy rows use the deque BombSolver kept before the solve order graph,
+passing copies of it through every solver before every pop.
+Run with ktane importable, e.g. PYTHONPATH=src python bench/bench_queue.py
+"""
+
+import argparse
+import json
+from collections import deque
+from itertools import cycle
+from time import perf_counter
+from typing import (  # noqa: WPS235
+    Deque,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from ktane import ask, questions
+from ktane.directors import BombSolver, ModuleSolver
+from ktane.mods.t_mods import TurnTheKeys
+
+SIZES = (10, 100, 1000, 5000)
+US_PER_SECOND: Final = 1e6
+
+
+class _Blank(ModuleSolver, register=False):
+    """A module with nothing to do."""
+
+    name: Final = "Blank"
+    id: Final = "Blank"
+    required_edgework: Final = ()
+
+    def stage(self) -> questions.Asking[None]:
+        """Ask nothing."""
+        yield from ()  # noqa: WPS353 # stages are generators
+
+
+class _Banned(ModuleSolver, register=False):
+    """A module with nothing to do, that Turn The Keys must be solved before."""
+
+    name: Final = "Banned"
+    id: Final = "Maze"
+    required_edgework: Final = ()
+
+    def stage(self) -> questions.Asking[None]:
+        """Ask nothing."""
+        yield from ()  # noqa: WPS353 # stages are generators
+
+
+def _legacy_resort(
+    solver: ModuleSolver, queue: Deque[ModuleSolver],
+) -> Deque[ModuleSolver]:
+    """Reorder the queue as solver.resort_queue used to, which only Turn The Keys did."""
+    if not isinstance(solver, TurnTheKeys):
+        return queue
+    new_queue = deque(
+        module for module in queue
+        if module.id not in solver.required_solves
+        and module.id not in solver.banned_solves
+    )
+    new_queue.extend(module for module in queue if module.id in solver.required_solves)
+    new_queue.extendleft(module for module in queue if module.id in solver.banned_solves)
+    return new_queue
+
+
+class _LegacyQueue:
+    """The deque of solvers BombSolver used to keep, resorted before every pop."""
+
+    def __init__(self, solvers: Iterable[ModuleSolver]) -> None:
+        self._queue = deque(solvers)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self) -> Iterator[ModuleSolver]:
+        return iter(self._queue)
+
+    def pop(self) -> ModuleSolver:
+        """Pass copies of the queue through every solver in it, then pop."""
+        new_queue = self._queue.copy()
+        for solver in self._queue:
+            new_queue = _legacy_resort(solver, new_queue.copy())
+        self._queue = new_queue.copy()
+        return self._queue.pop()
+
+    def append(self, solver: ModuleSolver) -> None:
+        """Put a solver with modules left to solve back on the right end."""
+        self._queue.append(solver)
+
+    def finish(self, solver: ModuleSolver) -> None:
+        """Do nothing, as a solved solver has already left the queue."""
+
+
+def _solvers(modules: int, turn_the_keys: bool) -> List[ModuleSolver]:
+    """Return the solvers of a bomb, half of them banned by Turn The Keys."""
+    blank = modules // 2
+    solvers: List[ModuleSolver] = [_Blank() for _ in range(blank)]
+    solvers.extend(_Banned() for _ in range(modules - blank))
+    if turn_the_keys:
+        solvers.insert(0, TurnTheKeys())  # the left end of the queue is popped last
+    return solvers
+
+
+def _time_solve(bomb: BombSolver) -> float:
+    """Return the seconds taken to solve a bomb whose modules never strike."""
+    # every module is asked "did it strike?" then "did it solve?"
+    answers = cycle(("n", "y"))
+    with ask.answer_source(lambda _: next(answers)):
+        with ask.output_sink(lambda _: None):
+            start = perf_counter()
+            bomb.solve(start_time_mins=60, max_strikes=3)
+            return perf_counter() - start
+
+
+def time_bomb(modules: int, turn_the_keys: bool, legacy: bool = False) -> float:
+    """Return the seconds per pop taken to solve a bomb."""
+    solvers = _solvers(modules, turn_the_keys)
+    bomb = BombSolver(*solvers)
+    if legacy:
+        bomb.queue = _LegacyQueue(solvers)  # type: ignore[assignment]
+    return _time_solve(bomb) / len(solvers)
+
+
+_Row = Dict[str, Union[int, bool, float, None]]
+
+
+def run(sizes: Tuple[int, ...], max_legacy_size: int) -> List[_Row]:
+    """Time both queues at every size, with and without Turn The Keys."""
+    rows: List[_Row] = []
+    for size in sizes:
+        for turn_the_keys in (False, True):
+            legacy: Optional[float] = None
+            if size <= max_legacy_size:
+                legacy = time_bomb(size, turn_the_keys, legacy=True)
+            rows.append({
+                "modules": size,
+                "turn_the_keys": turn_the_keys,
+                "legacy_us_per_pop": None if legacy is None else legacy * US_PER_SECOND,
+                "us_per_pop": time_bomb(size, turn_the_keys) * US_PER_SECOND,
+            })
+    return rows
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--max-legacy-size", type=int, default=1000)
+    args = parser.parse_args()
+    rows = run(tuple(args.sizes), args.max_legacy_size)
+    print(json.dumps(rows, indent=2))  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Benchmark the maze.find_path search modes on large open and corridor mazes.
+
+The legacy rows run the Dijkstra loop solve_maze used before the generic
+core, copied here unchanged apart from taking the same neighbor function as
+the others and returning points, so the comparison is against the code that
+was replaced.
+find_path is timed with no_heuristic (the same algorithm on the new core),
+with A* and the Manhattan heuristic, and with bidirectional search.
+Run with ktane importable, e.g. PYTHONPATH=src python bench/bench_search.py
+"""
+
+import argparse
+import heapq
+import json
+from functools import partial
+from time import perf_counter
+from types import MappingProxyType
+from typing import Callable, Dict, Final, List, Mapping, NamedTuple, Tuple, Union
+
+from ktane.solverutils import grid, maze
+
+SIZES = (32, 64, 128, 256)
+DEFAULT_REPEATS = 3
+
+# Finds a path of points from start to goal, given a neighbor function.
+_Search = Callable[
+    [maze.Point, maze.Point, maze.NeighborFunc], List[maze.Point],
+]
+# Makes a maze of a given size.
+_MakeMaze = Callable[[int], maze.BitMaze]
+# One row of results: the maze kind and size, and the time taken by each mode.
+_Row = Dict[str, Union[str, int, float]]
+
+
+def _legacy_dijkstra(  # noqa: WPS210 # kept as it was, to time the original
+    start: maze.Point, goal: maze.Point, neighbors: maze.NeighborFunc,
+) -> List[maze.Point]:
+    """The search solve_maze did before find_path, returning the points it passes."""
+    unvisited: List[Tuple[int, maze.Point]] = []
+    distances: Dict[maze.Point, int] = {}
+    # For node n, came_from[n] is the node immediately preceding it on
+    # the shortest path currently known.
+    came_from: Dict[maze.Point, maze.Point] = {}
+    distances[start] = 0
+    heapq.heappush(unvisited, (0, start))
+    while unvisited:  # Dijkstra's algorithm
+        distance, current = heapq.heappop(unvisited)
+        if current == goal:
+            return _legacy_unwind(current, came_from)
+        new_distance = distance + 1
+        for neighbor in neighbors(current):
+            if neighbor not in distances or distances[neighbor] > new_distance:
+                distances[neighbor] = new_distance
+                heapq.heappush(unvisited, (new_distance, neighbor))
+                came_from[neighbor] = current
+    return []  # no path found
+
+
+def _legacy_unwind(
+    current: maze.Point, came_from: Dict[maze.Point, maze.Point],
+) -> List[maze.Point]:
+    path = [current]
+    while current in came_from:
+        current = came_from[current]
+        path.append(current)
+    path.reverse()  # we unpacked the points in reverse order
+    return path
+
+
+MODES: Final[Mapping[str, _Search]] = MappingProxyType({
+    "legacy_dijkstra": _legacy_dijkstra,
+    "dijkstra": partial(maze.find_path, heuristic=maze.no_heuristic),
+    "a_star": maze.find_path,
+    "bidirectional": partial(maze.find_path, bidirectional=True),
+})
+
+
+def _no_walls(size: int) -> List[int]:
+    return [0 for _ in range(size)]
+
+
+def open_maze(size: int) -> maze.BitMaze:
+    """A maze with no walls at all."""
+    no_walls = _no_walls(size)
+    return maze.BitMaze(grid.Dimensions(size, size), no_walls, no_walls)
+
+
+def corridor_maze(size: int) -> maze.BitMaze:
+    """A single serpentine corridor, the worst case for a distance heuristic."""
+    full_row = (1 << size) - 1
+    down_walls = _no_walls(size)
+    for row in range(size - 1):
+        # leave one gap per row, alternating between the right and left ends
+        gap = 0 if row % 2 else size - 1
+        down_walls[row] = full_row ^ (1 << gap)
+    return maze.BitMaze(grid.Dimensions(size, size), down_walls, _no_walls(size))
+
+
+MAZE_KINDS: Final[Mapping[str, _MakeMaze]] = MappingProxyType({
+    "open": open_maze,
+    "corridor": corridor_maze,
+})
+
+
+def _blocked(bit_maze: maze.BitMaze, point: maze.Point, neighbor: maze.Point) -> bool:
+    """Whether a wall of bit_maze lies between two neighboring points."""
+    row, col = point
+    next_row, next_col = neighbor
+    if row != next_row:
+        walls = bit_maze.down_walls[min(row, next_row)]
+        return bool((walls >> col) & 1)
+    walls = bit_maze.right_walls[row]
+    return bool((walls >> min(col, next_col)) & 1)
+
+
+def bit_maze_neighbors(bit_maze: maze.BitMaze) -> maze.NeighborFunc:
+    """Adapt a BitMaze into a neighbor function for find_path."""
+    return maze.grid_neighbors(tuple(bit_maze.size), partial(_blocked, bit_maze))
+
+
+class _Timing(NamedTuple):
+    seconds: float  # the best of several runs
+    path_length: int
+
+
+def time_path(
+    search: _Search, neighbors: maze.NeighborFunc, size: int, repeats: int,
+) -> _Timing:
+    """Time a search from corner to corner of a maze, and find its path length."""
+    goal = (size - 1, size - 1)
+    best = float("inf")
+    path: List[maze.Point] = []
+    for _ in range(repeats):
+        start = perf_counter()
+        path = search((0, 0), goal, neighbors)
+        best = min(best, perf_counter() - start)
+    return _Timing(best, len(path))
+
+
+def time_maze(kind: str, size: int, repeats: int) -> _Row:
+    """Time every search mode on one maze."""
+    neighbors = bit_maze_neighbors(MAZE_KINDS[kind](size))
+    row: _Row = {"maze": kind, "size": size}
+    for mode, search in MODES.items():
+        timing = time_path(search, neighbors, size, repeats)
+        row["{0}_seconds".format(mode)] = timing.seconds
+        row["path_length"] = timing.path_length
+    return row
+
+
+def run(repeats: int) -> List[_Row]:
+    """Time every search mode on both kinds of maze at every size."""
+    return [time_maze(kind, size, repeats) for kind in MAZE_KINDS for size in SIZES]
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeats), indent=2))  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+"""
+Benchmark every solver in module_pools.ALL_SOLVABLE, one stage at a time.
+
+Each trial makes a fresh solver on a random bomb, and answers every stage
+from randomly generated module readings, with output discarded. For each
+solver this reports the compute latency of stage() in microseconds, and from
+a separate pass under tracemalloc, the memory each stage keeps allocated and
+its peak usage in bytes. Answering is instant, so all of the time measured
+is the solver's own work and the ask layer's.
+Run with ktane importable, e.g. PYTHONPATH=src python bench/bench_solvers.py
+"""
+
+import argparse
+import json
+import platform
+import random
+import tracemalloc
+from contextlib import contextmanager
+from functools import partial
+from statistics import mean, quantiles
+from string import ascii_lowercase, digits
+from time import perf_counter_ns
+from types import MappingProxyType
+from typing import (  # noqa: WPS235
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ktane import ask, module_pools, vanilla
+from ktane.directors import BombSolver, Edgework, ModuleSolver, Port
+from ktane.mods import a_mods, c_mods, f_mods, w_mods
+from ktane.solverutils import morse
+
+DEFAULT_TRIALS = 500
+
+# Called with all output since the last answer, returns the next answer.
+Responder = Callable[[str], str]
+# Makes the responder for one stage of a module, given the stage number.
+StageInputs = Callable[[random.Random, int], Responder]
+Stats = Dict[str, Union[int, float]]
+# Runs one stage, measuring it.
+_Measure = Callable[[Callable[[], None]], None]
+
+# quantiles cuts the values into 20 groups, so the cut points are every 5%
+_QUANTILES: Final = 20
+_P50_CUT: Final = 9
+_P95_CUT: Final = 18
+
+_WIRE_COLORS: Final = "rybwk"
+_MIN_WIRES: Final = 3
+_MAX_WIRES: Final = 6
+_KEYPAD_SYMBOLS: Final = 4
+_WHOS_ON_FIRST_BUTTONS: Final = 6
+_MEMORY_BUTTONS: Final = "1234"
+_COMPLICATED_WIRE_LETTERS: Final = "rbls"
+_MAX_PANEL_WIRES: Final = 6
+_SEQUENCE_COLORS: Final = ("red", "blue", "black")
+_SEQUENCE_LETTERS: Final = "abc"
+_MAZE_SIZE: Final = 6
+_MAZE_CELLS: Final = tuple(
+    (row, col) for row in range(_MAZE_SIZE) for col in range(_MAZE_SIZE)
+)
+_PASSWORD_COLUMN: Final = 6  # letters in each column of the Password module
+_COLOUR_FLASH_QUESTIONS: Final = 3
+_PLUG_COUNT: Final = 12
+_PLUGS: Final = tuple(range(1, _PLUG_COUNT + 1))  # Follow the Leader numbers from 1
+_MIN_LEAD_WIRES: Final = 4
+_MAX_LEAD_WIRES: Final = 8
+
+_SERIAL_LETTERS: Final = 20  # serial numbers use the letters a to t
+_SERIAL_CHARACTERS: Final = "{0}{1}".format(ascii_lowercase[:_SERIAL_LETTERS], digits)
+_SERIAL_LENGTH: Final = 6  # the last character is always a digit
+_MAX_BATTERIES: Final = 6
+_INDICATOR_LABELS: Final = ("car", "clr", "frk", "frq", "ind", "msa", "nsa")
+_INDICATORS: Final = 2
+_PORT_PLATES: Final = 2
+_PORT_CHANCE: Final = 0.3
+
+
+def _scripted(answers: List[str]) -> Responder:
+    """Give answers in order, whatever is asked. Answers left over are unused."""
+    answer_iter: Iterator[str] = iter(answers)
+    return lambda output: next(answer_iter)
+
+
+def _yes_no(rng: random.Random, count: int) -> List[str]:
+    return [rng.choice("yn") for _ in range(count)]
+
+
+def _coord(row: int, col: int) -> str:
+    return "{0}{1}".format(ascii_lowercase[col], row + 1)
+
+
+def _wires(rng: random.Random, stage: int) -> Responder:
+    count = rng.randint(_MIN_WIRES, _MAX_WIRES)
+    return _scripted(["".join(rng.choices(_WIRE_COLORS, k=count))])
+
+
+def _button(rng: random.Random, stage: int) -> Responder:
+    colors = sorted(vanilla.TheButton.valid_colors)
+    label = rng.choice(sorted(vanilla.TheButton.valid_labels))
+    return _scripted([rng.choice(colors), label, rng.choice(colors)])
+
+
+def _keypad(rng: random.Random, stage: int) -> Responder:
+    return _scripted(rng.sample(rng.choice(vanilla.Keypad.columns), _KEYPAD_SYMBOLS))
+
+
+def _simon(rng: random.Random, stage: int) -> Responder:
+    return _scripted([rng.choice(sorted(vanilla.SimonSays.valid_colors))])
+
+
+def _whos_on_first(rng: random.Random, stage: int) -> Responder:
+    display = rng.choice(sorted(vanilla.WhosOnFirst.valid_displays))
+    labels = rng.sample(
+        sorted(vanilla.WhosOnFirst.valid_labels), _WHOS_ON_FIRST_BUTTONS,
+    )
+    key_label = labels.pop(vanilla.WhosOnFirst.display_to_index[display])
+    return _scripted([display, key_label, *labels])
+
+
+def _memory(rng: random.Random, stage: int) -> Responder:
+    buttons = "".join(rng.sample(_MEMORY_BUTTONS, len(_MEMORY_BUTTONS)))
+    return _scripted([rng.choice(_MEMORY_BUTTONS), buttons])
+
+
+def _morse(rng: random.Random, stage: int) -> Responder:
+    word = rng.choice(sorted(vanilla.MorseCode.word_to_freq))
+    return _scripted([" ".join(morse.MORSE_ALPHABET[letter] for letter in word)])
+
+
+def _complicated_wire(rng: random.Random) -> str:
+    """A random complicated wire, white if it has none of the other letters."""
+    letters = "".join(
+        letter for letter in _COMPLICATED_WIRE_LETTERS if rng.getrandbits(1)
+    )
+    return letters or "w"
+
+
+def _complicated_wires(rng: random.Random, stage: int) -> Responder:
+    count = rng.randint(1, _MAX_PANEL_WIRES)
+    return _scripted([_complicated_wire(rng) for _ in range(count)] + [""])
+
+
+def _sequence_wire(rng: random.Random) -> str:
+    """A random Wire Sequence wire, as its color and the letter it goes to."""
+    return "{0} {1}".format(rng.choice(_SEQUENCE_COLORS), rng.choice(_SEQUENCE_LETTERS))
+
+
+def _wire_sequence(rng: random.Random, stage: int) -> Responder:
+    # at most 2 wires a panel, so no color appears more often than the table covers
+    wires = [_sequence_wire(rng) for _ in range(rng.randint(1, 2))]
+    return _scripted(wires + [""])
+
+
+def _maze(rng: random.Random, stage: int) -> Responder:
+    marking = rng.choice(sorted(vanilla.Maze.mark_to_maze))
+    start, goal = rng.sample(_MAZE_CELLS, 2)
+    return _scripted([_coord(*cell) for cell in (start, goal, marking)])
+
+
+def _password_column(rng: random.Random, letter: str) -> str:
+    """A random Password column that has the given letter."""
+    others = sorted(set(ascii_lowercase) - {letter})
+    column = [letter, *rng.sample(others, _PASSWORD_COLUMN - 1)]
+    return "".join(rng.sample(column, _PASSWORD_COLUMN))
+
+
+def _spells_one_password(columns: List[str]) -> bool:
+    """Whether the columns spell out only one password."""
+    index = vanilla.Password.word_index
+    candidates = index.all_words
+    for position, column in enumerate(columns):
+        candidates = index.matching(candidates, position, column)
+    return candidates.bit_count() == 1
+
+
+def _answer_column(columns: List[str], output: str) -> str:
+    """Answer with the Password column asked for."""
+    column_number = int(output.rsplit("column ", 1)[1].rstrip("?"))
+    return columns[column_number - 1]
+
+
+def _password(rng: random.Random, stage: int) -> Responder:
+    while True:  # make columns that only spell out one password
+        password = rng.choice(vanilla.Password.word_index.words)
+        columns = [_password_column(rng, letter) for letter in password]
+        if _spells_one_password(columns):
+            return partial(_answer_column, columns)
+
+
+def _anagrams(rng: random.Random, stage: int) -> Responder:
+    return _scripted([rng.choice(sorted(a_mods.Anagrams.words))])
+
+
+def _colour_flash(rng: random.Random, stage: int) -> Responder:
+    color = rng.choice(sorted(c_mods.ColourFlash.valid_colors))
+    return _scripted([color, *_yes_no(rng, _COLOUR_FLASH_QUESTIONS)])
+
+
+def _crazy_talk(rng: random.Random, stage: int) -> Responder:
+    return _scripted([rng.choice(sorted(c_mods.CrazyTalk.table)), "y"])
+
+
+def _follow_the_leader(rng: random.Random, stage: int) -> Responder:
+    count = rng.randint(_MIN_LEAD_WIRES, _MAX_LEAD_WIRES)
+    plugs = sorted(rng.sample(_PLUGS, count))
+    colors = rng.choices(sorted(f_mods.FollowTheLeader.valid_colors), k=count)
+    return _scripted([str(plug) for plug in plugs] + [""] + colors)
+
+
+def _no_inputs(rng: random.Random, stage: int) -> Responder:
+    return _scripted([])
+
+
+def _word_scramble(rng: random.Random, stage: int) -> Responder:
+    word = rng.choice(sorted(w_mods.WordScramble.words))
+    return _scripted(["".join(rng.sample(word, len(word)))])
+
+
+STAGE_INPUTS: Final[Mapping[str, StageInputs]] = MappingProxyType({
+    "Wires": _wires,
+    "BigButton": _button,
+    "Keypad": _keypad,
+    "Simon": _simon,
+    "WhosOnFirst": _whos_on_first,
+    "Memory": _memory,
+    "Morse": _morse,
+    "Venn": _complicated_wires,
+    "WireSequence": _wire_sequence,
+    "Maze": _maze,
+    "Password": _password,
+    "AnagramsModule": _anagrams,
+    "ColourFlash": _colour_flash,
+    "CrazyTalk": _crazy_talk,
+    "FollowTheLeaderModule": _follow_the_leader,
+    "TurnTheKeyAdvanced": _no_inputs,
+    "WordScrambleModule": _word_scramble,
+})
+
+
+def _random_serial(rng: random.Random) -> str:
+    serial = rng.choices(_SERIAL_CHARACTERS, k=_SERIAL_LENGTH - 1)
+    return "".join([*serial, rng.choice(digits)])
+
+
+def random_edgework(rng: random.Random) -> Edgework:
+    """Make edgework for a random bomb, without asking for any of it."""
+    edgework = Edgework()
+    edgework.serial = _random_serial(rng)
+    edgework.batteries = rng.randint(0, _MAX_BATTERIES)
+    edgework.indicators = tuple(
+        (label, bool(rng.getrandbits(1)))
+        for label in rng.sample(_INDICATOR_LABELS, _INDICATORS)
+    )
+    edgework.port_plates = tuple(
+        tuple(port for port in Port if rng.random() < _PORT_CHANCE)
+        for _ in range(_PORT_PLATES)
+    )
+    return edgework
+
+
+class _Console:
+    """Stands in for the expert, answering from a responder and discarding output."""
+
+    def __init__(self) -> None:
+        self.responder: Responder = _scripted([])
+        self._output: List[str] = []
+
+    def output(self, message: str) -> None:
+        self._output.append(message)
+
+    def answer(self, prompt: str) -> str:
+        if prompt != ask.PROMPT:  # yes/no questions are asked in the prompt
+            self._output.append(prompt)
+        answer = self.responder("\n".join(self._output))
+        self._output.clear()
+        return answer
+
+
+def _drive_stage(solver: ModuleSolver) -> None:
+    ask.drive(solver.stage())
+
+
+def _run_stages(
+    solver_type: Type[ModuleSolver],
+    rng: random.Random,
+    console: _Console,
+    measure: _Measure,
+) -> None:
+    """Solve every stage of one module on a fresh random bomb."""
+    solver = solver_type()
+    solver.post_init(random_edgework(rng), BombSolver(solver))
+    stage_inputs = STAGE_INPUTS[str(solver_type.id)]
+    while solver.do_stage():
+        console.responder = stage_inputs(rng, solver.current_stage)
+        measure(partial(_drive_stage, solver))
+
+
+def _run_trials(
+    solver_type: Type[ModuleSolver], trials: int, seed: int, measure: _Measure,
+) -> None:
+    """Solve a module over and over, on the random bombs the seed makes."""
+    console = _Console()
+    rng = random.Random(seed)
+    with ask.answer_source(console.answer):
+        with ask.output_sink(console.output):
+            for _ in range(trials):
+                _run_stages(solver_type, rng, console, measure)
+
+
+def _time_stage(latencies: List[float], stage: Callable[[], None]) -> None:
+    start = perf_counter_ns()
+    stage()
+    latencies.append((perf_counter_ns() - start) / 1000)
+
+
+def _trace_stage(
+    kept_bytes: List[float], peak_bytes: List[float], stage: Callable[[], None],
+) -> None:
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    stage()
+    after, peak = tracemalloc.get_traced_memory()
+    kept_bytes.append(after - before)
+    peak_bytes.append(peak - before)
+
+
+@contextmanager
+def _tracing_memory() -> Iterator[None]:
+    """Trace memory allocations for the duration of a with block."""
+    tracemalloc.start()
+    try:
+        yield
+    finally:
+        tracemalloc.stop()
+
+
+def _percentiles(samples: List[float]) -> Tuple[float, float]:
+    """The median and 95th percentile of one or more values."""
+    if len(samples) == 1:  # quantiles needs two values, and one value is every percentile
+        return samples[0], samples[0]
+    cut_points = quantiles(samples, n=_QUANTILES, method="inclusive")
+    return cut_points[_P50_CUT], cut_points[_P95_CUT]
+
+
+def _summarize(samples: List[float]) -> Stats:
+    if not samples:  # nothing was measured, so there is nothing to summarize
+        return {}
+    p50, p95 = _percentiles(samples)
+    return {"mean": mean(samples), "p50": p50, "p95": p95, "max": max(samples)}
+
+
+def bench_solver(
+    solver_type: Type[ModuleSolver], trials: int, seed: int,
+) -> Dict[str, object]:
+    """Time and measure the memory use of every stage of a solver over many trials."""
+    latencies: List[float] = []
+    kept_bytes: List[float] = []
+    peak_bytes: List[float] = []
+    _run_trials(solver_type, trials, seed, partial(_time_stage, latencies))
+    with _tracing_memory():  # the same inputs again, under tracemalloc
+        trace_stage = partial(_trace_stage, kept_bytes, peak_bytes)
+        _run_trials(solver_type, trials, seed, trace_stage)
+    return {
+        "id": str(solver_type.id),
+        "name": str(solver_type.name),
+        "stages": len(latencies),
+        "latency_us": _summarize(latencies),
+        "kept_bytes": _summarize(kept_bytes),
+        "peak_bytes": _summarize(peak_bytes),
+    }
+
+
+def run(
+    trials: int,
+    seed: int,
+    only: Optional[List[str]] = None,
+) -> Dict[str, object]:
+    """Benchmark every solver, or only those with the given IDs."""
+    solver_types = [
+        solver_type
+        for solver_type in module_pools.ALL_SOLVABLE
+        if only is None or str(solver_type.id) in only
+    ]
+    benchmarks = [
+        bench_solver(solver_type, trials, seed)  # type: ignore[type-abstract]
+        for solver_type in solver_types
+    ]
+    return {
+        "python": platform.python_version(),
+        "trials": trials,
+        "seed": seed,
+        "solvers": benchmarks,
+    }
+
+
+def main() -> None:
+    """Parse arguments, run the benchmark, and print JSON results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", help="IDs of the solvers to benchmark")
+    args = parser.parse_args()
+    report = run(args.trials, args.seed, args.only)
+    print(json.dumps(report, indent=2))  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    main()
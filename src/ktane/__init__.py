@@ -1,6 +1,9 @@
 """A bomb-solving toolkit for the video game Keep Talking and Nobody Explodes."""
 
-from ktane import ask, module_pools, vanilla
+from importlib import import_module
+from typing import TYPE_CHECKING, Final, FrozenSet, List
+
+from ktane import ask, questions, registry
 from ktane.directors import (
     BombSolver,
     EdgeFlag,
@@ -9,6 +12,9 @@ from ktane.directors import (
     modules_from_pool,
 )
 
+if TYPE_CHECKING:
+    from ktane import batch, mods, module_pools, vanilla  # noqa: F401
+
 __all__ = [
     "ask",
     "BombSolver",
@@ -17,5 +23,23 @@ __all__ = [
     "ModuleSolver",
     "modules_from_pool",
     "module_pools",
+    "questions",
+    "registry",
     "vanilla",
 ]
+
+# Submodules full of solvers and their tables, imported on first use.
+_LAZY_SUBMODULES: Final[FrozenSet[str]] = frozenset(
+    ("batch", "mods", "module_pools", "vanilla"),
+)
+
+
+def __getattr__(name: str) -> object:
+    """Import a lazy submodule the first time it is used."""
+    if name in _LAZY_SUBMODULES:
+        return import_module("{0}.{1}".format(__name__, name))
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)  # noqa: WPS421
@@ -1,13 +1,41 @@
 """Handles simple text-based I/O operations for the KTaNE solving toolkit."""
 
-from re import fullmatch
-from textwrap import wrap
-from typing import AbstractSet, Callable, Final, List
+from contextlib import contextmanager
+from typing import (  # noqa: WPS235
+    AbstractSet,
+    Callable,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    TextIO,
+    TypeVar,
+    Union,
+    cast,
+)
 from warnings import warn
 
+from ktane import questions, trace
+
 __all__ = [
     "PROMPT",
     "SEPARATOR",
+    "AnswerSource",
+    "set_answer_source",
+    "answer_source",
+    "scripted_answers",
+    "stream_answers",
+    "file_answers",
+    "recording_answers",
+    "drive",
+    "OutputSink",
+    "set_output_sink",
+    "output_sink",
+    "Validator",
+    "set_validator",
+    "regex_validator",
     "talk",
     "yes_no",
     "list_from_func",
@@ -23,55 +51,125 @@ PROMPT: Final = "> "
 SEPARATOR: Final = ", "
 # Making this larger is fine, but making it smaller may trigger warnings.
 MAX_LINE_PRINT_LENGTH: Final = 80
-# Debug stuff.
-_MAX_ITERATIONS: Final = 20
 
+_ReturnT = TypeVar("_ReturnT")
 
-def _from_func(
-    func: Callable[[str], bool], *, case_sensitive: bool, allow_empty: bool = False,
-) -> str:
+# Called with the prompt text, returns one line of user input without the newline.
+AnswerSource = Callable[[str], str]
+
+
+_answer_source: Optional[AnswerSource] = None  # None reads from the terminal
+
+
+def set_answer_source(source: Optional[AnswerSource] = None) -> None:
+    """
+    Set where user answers come from.
+    Passing None restores the default of reading from the terminal.
+    """
+    global _answer_source  # noqa: WPS420
+    _answer_source = source  # noqa: WPS122, WPS442
+
+
+@contextmanager
+def answer_source(source: AnswerSource) -> Iterator[None]:
+    """Take user answers from source for the duration of a with block."""
+    previous_source = _answer_source
+    set_answer_source(source)
+    try:
+        yield
+    finally:
+        set_answer_source(previous_source)
+
+
+def scripted_answers(answers: Iterable[str]) -> AnswerSource:
+    """
+    Make an answer source that replays pre-recorded answers in order.
+    Like input(), it raises EOFError once the answers run out.
+    """
+    answer_iter = iter(answers)
+
+    def source(prompt: str) -> str:  # noqa: WPS430
+        answer = next(answer_iter, None)
+        if answer is None:
+            raise EOFError("Ran out of scripted answers.")
+        return answer
+
+    return source
+
+
+def stream_answers(stream: TextIO) -> AnswerSource:
+    """Make an answer source that reads one answer per line from a text stream."""
+    return scripted_answers(line.rstrip("\r\n") for line in stream)
+
+
+def file_answers(path: str) -> AnswerSource:
+    """Make an answer source that replays the lines of a transcript file."""
+    with open(path, encoding="utf-8") as transcript:
+        answers = transcript.read().splitlines()
+    return scripted_answers(answers)
+
+
+@contextmanager
+def recording_answers(record: List[str]) -> Iterator[None]:
+    """Append every answer given to record, for the duration of a with block."""
+    source = _answer_source
+
+    def recording_source(prompt: str) -> str:  # noqa: WPS430
+        answer = (source or input)(prompt)
+        record.append(answer)
+        return answer
+
+    with answer_source(recording_source):
+        yield
+
+
+# Called with each line of output meant for the user.
+OutputSink = Callable[[str], None]
+
+
+_output_sink: Optional[OutputSink] = None  # None prints to the terminal
+_last_message = ""  # the last line of output, which usually asks the question
+
+
+def set_output_sink(sink: Optional[OutputSink] = None) -> None:
     """
-    Get a single string from the user that satisfies func,
-    respecting case_sensitive and allow_empty options.
+    Set where output for the user goes.
+    Passing None restores the default of printing to the terminal.
     """
-    count = 0
-    response = input(PROMPT)  # noqa: WPS421
-    if not case_sensitive:
-        response = response.lower()
-    while not (func(response) or (allow_empty and response == "")):
-        talk(
-            'Answer "{0}" is not a valid answer and will be ignored.'.format(response),
-            warning_bypass=True,
-        )
-        talk("Please try again.")
-        count += 1
-        if count >= _MAX_ITERATIONS:
-            raise RuntimeError("Too many invalid user inputs.")
-        response = input(PROMPT)  # noqa: WPS421
-        if not case_sensitive:
-            response = response.lower()
-    return response
-
-
-def _print_case(case_sensitive: bool) -> None:
-    """Print case sensitive warning if needed."""
-    if case_sensitive:
-        talk("(Inputs are case sensitive.)")
-
-
-def _print_set(strings: AbstractSet[str], *, case_sensitive: bool = False) -> None:
-    """Display a set in readable form across one or more lines."""
-    if not strings:  # empty set
-        return
-    if not case_sensitive:
-        strings = {string.upper() for string in strings}
-    for string in strings:
-        if len(string) >= MAX_LINE_PRINT_LENGTH:
-            warn('WARNING: String in set too long: "{0}"'.format(string))
-    paragraph: str = SEPARATOR.join(sorted(strings))
-    lines: List[str] = wrap(paragraph, width=MAX_LINE_PRINT_LENGTH)
-    for line in lines:
-        talk(line)
+    global _output_sink  # noqa: WPS420
+    _output_sink = sink  # noqa: WPS122, WPS442
+
+
+@contextmanager
+def output_sink(sink: OutputSink) -> Iterator[None]:
+    """Send output for the user to sink for the duration of a with block."""
+    previous_sink = _output_sink
+    set_output_sink(sink)
+    try:
+        yield
+    finally:
+        set_output_sink(previous_sink)
+
+
+# Called with an answer, returns something truthy if it's valid.
+Validator = questions.Validator
+set_validator = questions.set_validator
+regex_validator = questions.regex_validator
+
+
+def drive(asking: questions.Asking[_ReturnT]) -> _ReturnT:
+    """
+    Run the generator form of a solver or ask function to the end,
+    answering each question it asks from the answer source, and return its result.
+    """
+    step = questions.advance(asking)
+    while isinstance(step, questions.Question):
+        prompt = step.prompt
+        question = _last_message if prompt == PROMPT else prompt.strip()
+        with trace.span("answer", trace.INPUT, question=question):
+            answer = (_answer_source or input)(prompt)
+        step = questions.advance(asking, answer)
+    return cast(_ReturnT, step.value)
 
 
 def talk(message: str = "", *, warning_bypass: bool = False) -> None:
@@ -79,43 +177,31 @@ def talk(message: str = "", *, warning_bypass: bool = False) -> None:
     if not warning_bypass and len(message) > MAX_LINE_PRINT_LENGTH:
         warn('WARNING: Message too long: "{0}"'.format(message))
     if ENABLE_PRINTING:
-        print(message)  # noqa: WPS421
+        global _last_message  # noqa: WPS420
+        _last_message = message  # noqa: WPS122, WPS442
+        (_output_sink or print)(message)
 
 
 def yes_no(prompt: str) -> bool:
     """Ask the user a yes/no question."""
-    prompt = "{0} (y/n) ".format(prompt)
-    if len(prompt) > MAX_LINE_PRINT_LENGTH:
-        warn('WARNING: Prompt too long: "{0}"'.format(prompt))
-    return input(prompt).strip().lower() == "y"  # noqa: WPS421
+    return drive(questions.yes_no(prompt))
 
 
 def list_from_func(
-    func: Callable[[str], bool], *, case_sensitive: bool = False, expected_len: int = 0,
+    func: Validator, *, case_sensitive: bool = False, expected_len: int = 0,
 ) -> List[str]:
     """
     Prompt the user to enter a list of strings
     which when passed to func all return True.
     """
-    _print_case(case_sensitive)
-    responses: List[str] = []
-    if expected_len > 0:
-        talk("(One per line.)")
-        while len(responses) < expected_len:
-            responses.append(_from_func(func, case_sensitive=case_sensitive))
-    else:
-        talk("(One per line. End inputs by hitting ENTER without giving input.)")
-        ans = _from_func(func, case_sensitive=case_sensitive, allow_empty=True)
-        while ans:
-            responses.append(ans)
-            ans = _from_func(func, case_sensitive=case_sensitive, allow_empty=True)
-    return responses
-
-
-def str_from_func(func: Callable[[str], bool], *, case_sensitive: bool = False) -> str:
+    return drive(questions.list_from_func(
+        func, case_sensitive=case_sensitive, expected_len=expected_len,
+    ))
+
+
+def str_from_func(func: Validator, *, case_sensitive: bool = False) -> str:
     """Prompt the user to enter a string which when passed to func returns True."""
-    _print_case(case_sensitive)
-    return _from_func(func, case_sensitive=case_sensitive)
+    return drive(questions.str_from_func(func, case_sensitive=case_sensitive))
 
 
 def list_from_set(
@@ -125,16 +211,12 @@ def list_from_set(
     expected_len: int = 0,
 ) -> List[str]:
     """Prompt the user to enter a list of strings from valid_strings."""
-    if print_options:
-        talk("Accepted options are:")
-        _print_set(valid_strings, case_sensitive=case_sensitive)
-    if not case_sensitive:  # normalize
-        valid_strings = {string.lower() for string in valid_strings}
-    return list_from_func(
-        lambda string: string in valid_strings,
+    return drive(questions.list_from_set(
+        valid_strings,
         case_sensitive=case_sensitive,
+        print_options=print_options,
         expected_len=expected_len,
-    )
+    ))
 
 
 def str_from_set(
@@ -143,33 +225,27 @@ def str_from_set(
     print_options: bool = False,
 ) -> str:
     """Prompt the user to enter a string from valid_strings."""
-    if print_options:
-        talk("Accepted options are:")
-        _print_set(valid_strings, case_sensitive=case_sensitive)
-    if not case_sensitive:  # normalize
-        valid_strings = {string.lower() for string in valid_strings}
-    return str_from_func(
-        lambda string: string in valid_strings, case_sensitive=case_sensitive,
-    )
+    return drive(questions.str_from_set(
+        valid_strings, case_sensitive=case_sensitive, print_options=print_options,
+    ))
 
 
 def list_from_regex(
-    input_pattern: str, *, case_sensitive: bool = False, expected_len: int = 0,
+    input_pattern: Union[str, Pattern[str]], *,
+    case_sensitive: bool = False,
+    expected_len: int = 0,
 ) -> List[str]:
     """Prompt the user to enter a list of strings which match the input pattern."""
-    return list_from_func(
-        lambda string: bool(fullmatch(input_pattern, string)),
-        case_sensitive=case_sensitive,
-        expected_len=expected_len,
-    )
+    return drive(questions.list_from_regex(
+        input_pattern, case_sensitive=case_sensitive, expected_len=expected_len,
+    ))
 
 
-def str_from_regex(input_pattern: str, *, case_sensitive: bool = False) -> str:
+def str_from_regex(
+    input_pattern: Union[str, Pattern[str]], *, case_sensitive: bool = False,
+) -> str:
     """Prompt the user to enter a string which matches the input pattern."""
-    return str_from_func(
-        lambda string: bool(fullmatch(input_pattern, string)),
-        case_sensitive=case_sensitive,
-    )
+    return drive(questions.str_from_regex(input_pattern, case_sensitive=case_sensitive))
 
 
 # more specific ask functions
@@ -177,4 +253,4 @@ def str_from_regex(input_pattern: str, *, case_sensitive: bool = False) -> str:
 
 def positive_int() -> int:
     """Prompt the user to enter a positive integer (excluding 0)."""
-    return int(str_from_regex(r"[1-9][0-9]*"))
+    return drive(questions.positive_int())
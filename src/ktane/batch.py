@@ -0,0 +1,215 @@
+"""Solves many scripted bombs in parallel worker processes, without user interaction."""
+
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from time import perf_counter
+from typing import Final, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from ktane import ask, registry
+from ktane.directors import BombSolver, IndicatorList, ModuleSolver, Port, PortPlateList
+
+__all__ = ["BombSpec", "BombResult", "solve_bomb", "solve_bombs", "main"]
+
+DEFUSED: Final = "defused"
+EXPLODED: Final = "exploded"
+ERROR: Final = "error"
+
+# Lists of lists as read from JSON, like indicators and port plates.
+_JsonRows = List[List[object]]
+
+
+class BombSpec(NamedTuple):
+    """
+    Everything needed to solve one bomb without user interaction.
+
+    Modules are given by ID or name, once per instance on the bomb.
+    Answers are fed to the solvers in order, in place of user input.
+    Edgework left as None is asked for, so it must then be in the answers.
+    """
+
+    modules: Tuple[str, ...]
+    answers: Tuple[str, ...]
+    label: str = ""
+    start_time_mins: Optional[int] = None
+    max_strikes: Optional[int] = None
+    batteries: Optional[int] = None
+    indicators: Optional[IndicatorList] = None
+    port_plates: Optional[PortPlateList] = None
+    serial: Optional[str] = None
+
+
+class BombResult(NamedTuple):
+    """The outcome of solving one BombSpec."""
+
+    spec_index: int  # position of the spec in the input stream
+    label: str
+    outcome: str  # one of "defused", "exploded", or "error"
+    instructions: Tuple[str, ...]  # every line of output, in order
+    strikes: int
+    solves: int
+    wall_time: float  # in seconds
+    error: str = ""
+
+    def to_json(self) -> str:
+        """This result as a line of JSON, without the newline."""
+        return json.dumps(self._asdict())
+
+
+def _build_solvers(modules: Tuple[str, ...]) -> List[ModuleSolver]:
+    """Make one solver per distinct module, counting repeated modules."""
+    solver_types = []
+    for module in modules:
+        try:
+            solver_types.append(registry.get(module))
+        except KeyError:
+            raise ValueError("Unknown module: {0}".format(module)) from None
+    return [
+        solver_type(count) for solver_type, count in Counter(solver_types).items()
+    ]
+
+
+def _error_text(exc: Exception) -> str:
+    return "{0}: {1}".format(type(exc).__name__, exc)
+
+
+def _run_spec(spec: BombSpec) -> Tuple[BombSolver, str, str]:
+    """Build and solve the bomb for a spec, returning it, its outcome, and any error."""
+    try:
+        bomb = BombSolver(*_build_solvers(spec.modules))
+    except Exception as exc:  # noqa: B902 # one bad bomb can't stop the batch
+        return BombSolver(), ERROR, _error_text(exc)
+    try:
+        bomb.solve(
+            start_time_mins=spec.start_time_mins,
+            max_strikes=spec.max_strikes,
+            batteries=spec.batteries,
+            indicators=spec.indicators,
+            port_plates=spec.port_plates,
+            serial=spec.serial,
+        )
+    except SystemExit:  # Edgework.add_strike exits when the bomb explodes
+        return bomb, EXPLODED, ""
+    except Exception as solve_exc:  # noqa: B902
+        return bomb, ERROR, _error_text(solve_exc)
+    return bomb, DEFUSED, ""
+
+
+def solve_bomb(spec: BombSpec, index: int = 0) -> BombResult:
+    """Solve a single bomb in this process, capturing all of its output."""
+    instructions: List[str] = []
+    start = perf_counter()
+    with ask.answer_source(ask.scripted_answers(spec.answers)):
+        with ask.output_sink(instructions.append):
+            bomb, outcome, error = _run_spec(spec)
+    return BombResult(
+        spec_index=index,
+        label=spec.label,
+        outcome=outcome,
+        instructions=tuple(instructions),
+        strikes=bomb.edgework.strikes,
+        solves=bomb.edgework.solves,
+        wall_time=perf_counter() - start,
+        error=error,
+    )
+
+
+def solve_bombs(
+    specs: Iterable[BombSpec], *,
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+) -> Iterator[BombResult]:
+    """
+    Solve many bombs across a pool of worker processes.
+
+    Results are yielded as soon as each bomb finishes, so they may arrive
+    out of order; use BombResult.spec_index to match them to their specs.
+    At most max_pending bombs are queued at once, so specs can be a lazy stream.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _stream_results(
+            executor, specs, 4 * workers if max_pending is None else max_pending,
+        )
+
+
+def _stream_results(
+    executor: ProcessPoolExecutor, specs: Iterable[BombSpec], max_pending: int,
+) -> Iterator[BombResult]:
+    """Submit specs as room frees up, yielding results as each bomb finishes."""
+    pending: Set["Future[BombResult]"] = set()
+    for index, spec in enumerate(specs):
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (future.result() for future in done)
+        pending.add(executor.submit(solve_bomb, spec, index))
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        yield from (future.result() for future in done)
+
+
+def _spec_from_json(line: str) -> BombSpec:
+    """
+    Read a BombSpec from a line of JSON. Indicators are given as
+    [["car", true], ...] and port plates as [["parallel", "serial"], [], ...].
+    """
+    raw = json.loads(line)
+    serial = raw.get("serial")
+    return BombSpec(
+        modules=tuple(raw["modules"]),
+        answers=tuple(raw.get("answers", ())),
+        label=str(raw.get("label", "")),
+        start_time_mins=raw.get("start_time_mins"),
+        max_strikes=raw.get("max_strikes"),
+        batteries=raw.get("batteries"),
+        indicators=_indicators_from_json(raw.get("indicators")),
+        port_plates=_port_plates_from_json(raw.get("port_plates")),
+        serial=None if serial is None else str(serial).lower(),
+    )
+
+
+def _indicators_from_json(raw_indicators: Optional[_JsonRows]) -> Optional[IndicatorList]:
+    if raw_indicators is None:
+        return None
+    return tuple(
+        (str(name).lower(), bool(lit)) for name, lit in raw_indicators
+    )
+
+
+def _port_plates_from_json(raw_plates: Optional[_JsonRows]) -> Optional[PortPlateList]:
+    if raw_plates is None:
+        return None
+    return tuple(
+        tuple(Port[str(port).upper()] for port in plate) for plate in raw_plates
+    )
+
+
+def _read_specs(lines: Iterable[str]) -> Iterator[BombSpec]:
+    for line in lines:
+        if line.strip():
+            yield _spec_from_json(line)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Read bomb specs as JSON lines from the file named in argv (or stdin),
+    and write one JSON line per result to stdout as each bomb finishes.
+    """
+    args = sys.argv[1:] if argv is None else argv
+    if args:
+        with open(args[0], encoding="utf-8") as spec_file:
+            _write_results(_read_specs(spec_file))
+    else:
+        _write_results(_read_specs(sys.stdin))
+
+
+def _write_results(specs: Iterable[BombSpec]) -> None:
+    for bomb_result in solve_bombs(specs):
+        sys.stdout.write("{0}\n".format(bomb_result.to_json()))
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,59 @@
 """Contains coordinating structure and utility for bomb management and solvers."""
 
+import heapq
+import pickle  # noqa: S403 # checkpoints are only read back by their writer
 import sys
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import Counter
+from copy import deepcopy
 from enum import Enum, Flag, auto
-from typing import Deque, Final, List, Optional, Tuple, Type
-
-from ktane import ask
-
-__all__ = ["EdgeFlag", "Edgework", "ModuleSolver", "BombSolver", "modules_from_pool"]
+from types import MappingProxyType
+from typing import (  # noqa: WPS235
+    BinaryIO,
+    Callable,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ktane import ask, questions, registry, trace
+from ktane.solverutils.serial import SerialInfo
+
+__all__ = [
+    "EdgeFlag",
+    "Edgework",
+    "ModuleSolver",
+    "SolveQueue",
+    "BombSolver",
+    "modules_from_pool",
+    "choosing_from_pool",
+]
 
 IndicatorList = Tuple[Tuple[str, bool], ...]
 PortPlate = Tuple["Port", ...]
 PortPlateList = Tuple[PortPlate, ...]
 
+# how a checkpoint record refers to the bomb it belongs to; solvers are numbered
+_BOMB_REFERENCE: Final = "bomb"
+# what reading the partly written last record of a checkpoint file may raise
+_TORN_RECORD_ERRORS: Final = (
+    EOFError,
+    pickle.UnpicklingError,
+    ValueError,
+    AttributeError,
+    IndexError,
+)
+
 
 class Port(Enum):
     """Ports for edgework information."""
@@ -42,7 +82,143 @@ class EdgeFlag(Flag):
     SOLVES = auto()
 
 
-class Edgework:  # TODO: move the serial number processing to solverutils
+class _EdgeworkIndexes:
+    """
+    The serial number, indicators and port plates of a bomb, each worked out
+    into indexes as it is set, so that solvers can look things up directly.
+    """
+
+    serial_info: SerialInfo  # worked out whenever the serial is set
+    # Indexes worked out whenever the indicators or port plates are set.
+    _indicators: IndicatorList
+    _lit_indicators: FrozenSet[str]
+    _unlit_indicators: FrozenSet[str]
+    _indicator_counts: Mapping[bool, int]  # how many are lit and how many unlit
+    _port_plates: PortPlateList
+    _port_mask: int  # bit port.value is set if the port is present
+    _port_counts: Mapping["Port", int]
+    _plate_shapes: Mapping[FrozenSet["Port"], int]
+    # the indexes can't be pickled, so they are left out and rebuilt on load
+    _index_names: Final = (
+        "_lit_indicators",
+        "_unlit_indicators",
+        "_indicator_counts",
+        "_port_mask",
+        "_port_counts",
+        "_plate_shapes",
+    )
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Leave out the indexes, which can't be pickled and are rebuilt on load."""
+        return {
+            name: attribute
+            for name, attribute in self.__dict__.items()
+            if name not in self._index_names
+        }
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        """Restore the pickled fields, and rebuild the indexes from them."""
+        self.__dict__.update(state)
+        self.indicators = self._indicators
+        self.port_plates = self._port_plates
+
+    @property
+    def indicators(self) -> IndicatorList:
+        """The indicators on the bomb, as (lowercase label, whether lit) pairs."""
+        return self._indicators
+
+    @indicators.setter
+    def indicators(self, indicators: IndicatorList) -> None:
+        self._indicators = indicators
+        self._lit_indicators = frozenset(
+            label.lower() for label, lit in indicators if lit
+        )
+        self._unlit_indicators = frozenset(
+            label.lower() for label, lit in indicators if not lit
+        )
+        self._indicator_counts = MappingProxyType(
+            dict(Counter(lit for _, lit in indicators)),
+        )
+
+    @property
+    def port_plates(self) -> PortPlateList:
+        """The port plates on the bomb, each a tuple of the ports on it."""
+        return self._port_plates
+
+    @port_plates.setter
+    def port_plates(self, port_plates: PortPlateList) -> None:
+        self._port_plates = port_plates
+        port_counts = Counter(port for plate in port_plates for port in plate)
+        self._port_counts = MappingProxyType(dict(port_counts))
+        self._port_mask = 0
+        for port in port_counts:
+            self._port_mask |= 1 << port.value
+        self._plate_shapes = MappingProxyType(
+            dict(Counter(frozenset(plate) for plate in port_plates)),
+        )
+
+    def has_indicator(self, indicator: str, lit: bool) -> bool:
+        """Whether or not the bomb has the given indicator."""
+        if lit:
+            return indicator.lower() in self._lit_indicators
+        return indicator.lower() in self._unlit_indicators
+
+    def indicator_count(self, lit: Optional[bool] = None) -> int:
+        """How many indicators there are, optionally only lit or unlit ones."""
+        if lit is None:
+            return len(self._indicators)
+        return self._indicator_counts.get(lit, 0)
+
+    def has_port(self, port: Port) -> bool:
+        """Whether or not the bomb has the given port."""
+        return bool(self._port_mask & (1 << port.value))
+
+    def port_count(self, port: Optional[Port] = None) -> int:
+        """How many of the given port there are, or how many ports in total."""
+        if port is None:
+            return sum(self._port_counts.values())
+        return self._port_counts.get(port, 0)
+
+    def plate_count(self, ports: Optional[FrozenSet[Port]] = None) -> int:
+        """
+        How many port plates have exactly the given set of ports
+        (so an empty set counts empty plates), or how many plates in total.
+        """
+        if ports is None:
+            return len(self._port_plates)
+        return self._plate_shapes.get(ports, 0)
+
+    @property
+    def serial(self) -> str:
+        """The serial number."""
+        return self.serial_info.serial
+
+    @serial.setter
+    def serial(self, serial: str) -> None:
+        self.serial_info = SerialInfo.from_serial(serial)
+
+    @property
+    def serial_odd(self) -> bool:
+        """Whether or not the last digit of the serial number is odd."""
+        return self.serial_info.odd  # False if undefined
+
+    @property
+    def serial_vowel(self) -> bool:
+        """Whether or not the serial number contains a vowel."""
+        return self.serial_info.vowel
+
+    @property
+    def serial_first_digit(self) -> str:
+        """The first numeric digit of the serial number."""
+        return self.serial_info.first_digit  # "" if undefined
+
+    @property
+    def serial_first_letter(self) -> str:
+        """The first alphabetic character of the serial number."""
+        return self.serial_info.first_letter  # "" if undefined
+
+
+class Edgework(_EdgeworkIndexes):
     """Data object containing edgework information and bomb metadata."""
 
     def __init__(self) -> None:
@@ -50,9 +226,9 @@ class Edgework:  # TODO: move the serial number processing to solverutils
         self.total_modules: int = 0
         self.max_strikes: int = -1
         self.batteries: int = 0
-        self.indicators: IndicatorList = ()
-        self.serial: str = ""
-        self.port_plates: PortPlateList = ()
+        self.indicators = ()
+        self.serial = ""
+        self.port_plates = ()
         self.strikes: int = 0
         self.solves: int = 0
 
@@ -76,13 +252,38 @@ class Edgework:  # TODO: move the serial number processing to solverutils
         solves: Optional[int] = None,
     ) -> None:
         """Set all the fields, and ask the user to supply the readout if needed."""
-        self._get_start_time_mins(start_time_mins)
+        ask.drive(self.gathering(
+            start_time_mins=start_time_mins,
+            total_modules=total_modules,
+            max_strikes=max_strikes,
+            batteries=batteries,
+            indicators=indicators,
+            port_plates=port_plates,
+            serial=serial,
+            strikes=strikes,
+            solves=solves,
+        ))
+
+    def gathering(
+        self, *,
+        start_time_mins: Optional[int] = None,
+        total_modules: Optional[int] = None,
+        max_strikes: Optional[int] = None,
+        batteries: Optional[int] = None,
+        indicators: Optional[IndicatorList] = None,
+        port_plates: Optional[PortPlateList] = None,
+        serial: Optional[str] = None,
+        strikes: Optional[int] = None,
+        solves: Optional[int] = None,
+    ) -> questions.Asking[None]:
+        """The generator form of post_init."""
+        yield from self._get_start_time_mins(start_time_mins)
         self._get_total_modules(total_modules)
-        self._get_max_strikes(max_strikes)
-        self._get_batteries(batteries)
-        self._get_indicators(indicators)
-        self._get_ports(port_plates)
-        self._get_serial(serial)
+        yield from self._get_max_strikes(max_strikes)
+        yield from self._get_batteries(batteries)
+        yield from self._get_indicators(indicators)
+        yield from self._get_ports(port_plates)
+        yield from self._get_serial(serial)
         self._get_strikes(strikes)
         self._get_solves(solves)
 
@@ -97,14 +298,6 @@ class Edgework:  # TODO: move the serial number processing to solverutils
         """Add a solve."""
         self.solves += 1
 
-    def has_indicator(self, indicator: str, lit: bool) -> bool:
-        """Whether or not the bomb has the given indicator."""
-        return (indicator.lower(), lit) in self.indicators
-
-    def has_port(self, port: Port) -> bool:
-        """Whether or not the bomb has the given port."""
-        return any(port in plate for plate in self.port_plates)
-
     @property
     def hit_strike_limit(self) -> bool:
         """Whether the bomb has hit or breached the strike limit."""
@@ -117,36 +310,7 @@ class Edgework:  # TODO: move the serial number processing to solverutils
         """Whether the bomb has been defused, aka all present modules are solved."""
         return self.solves >= self.total_modules
 
-    @property
-    def serial_odd(self) -> bool:
-        """Whether or not the last digit of the serial number is odd."""
-        if self.serial:
-            last_serial_digit = [char for char in self.serial if char.isdigit()][-1]
-            return last_serial_digit in "13579"
-        return False  # undefined behavior
-
-    @property
-    def serial_vowel(self) -> bool:
-        """Whether or not the serial number contains a vowel."""
-        if self.serial:
-            return any(vowel in self.serial for vowel in "aeiou")
-        return False
-
-    @property
-    def serial_first_digit(self) -> str:
-        """The first numeric digit of the serial number."""
-        if self.serial:
-            return [char for char in self.serial if char.isdigit()][0]
-        return ""  # undefined behavior
-
-    @property
-    def serial_first_letter(self) -> str:
-        """The first alphabetic character of the serial number."""
-        if self.serial:
-            return [char for char in self.serial if char.isalpha()][0]
-        return ""  # undefined behavior
-
-    _port_names: Final = {"dvid", "parallel", "ps2", "rj45", "serial", "rca"}
+    _port_names: Final = frozenset(("dvid", "parallel", "ps2", "rj45", "serial", "rca"))
     _port_name_to_enum: Final = {
         "dvid": Port.DVID,
         "parallel": Port.PARALLEL,
@@ -156,37 +320,42 @@ class Edgework:  # TODO: move the serial number processing to solverutils
         "rca": Port.RCA,
     }
 
-    def _get_start_time_mins(self, start_time_mins: Optional[int]) -> None:
+    def _get_start_time_mins(
+        self, start_time_mins: Optional[int],
+    ) -> questions.Asking[None]:
         if start_time_mins is not None and start_time_mins > 0:
             self.start_time_mins = start_time_mins
         elif EdgeFlag.START_TIME_MINS in self._required_edgework_flag:
             ask.talk("What is the starting time on the bomb, in minutes?")
             ask.talk("(In Zen mode, this is the time the bomb was generated with.)")
-            self.start_time_mins = ask.positive_int()
+            self.start_time_mins = yield from questions.positive_int()
 
-    def _get_max_strikes(self, max_strikes: Optional[int]) -> None:
+    def _get_max_strikes(self, max_strikes: Optional[int]) -> questions.Asking[None]:
         if max_strikes is not None and max_strikes > 0:
             self.max_strikes = max_strikes
         elif EdgeFlag.MAX_STRIKES in self._required_edgework_flag:
             ask.talk("How many strikes will cause the bomb to detonate?")
-            self.max_strikes = ask.positive_int()
+            self.max_strikes = yield from questions.positive_int()
 
-    def _get_batteries(self, batteries: Optional[int]) -> None:
+    def _get_batteries(self, batteries: Optional[int]) -> questions.Asking[None]:
         if batteries is not None and batteries >= 0:
             self.batteries = batteries
         elif EdgeFlag.BATTERIES in self._required_edgework_flag:
             ask.talk("How many batteries are on the bomb?")
-            self.batteries = int(ask.str_from_regex(r"[0-9]+"))
+            answer = yield from questions.str_from_regex(r"[0-9]+")
+            self.batteries = int(answer)
 
-    def _get_indicators(self, indicators: Optional[IndicatorList]) -> None:
+    def _get_indicators(
+        self, indicators: Optional[IndicatorList],
+    ) -> questions.Asking[None]:
         if indicators is not None:
             self.indicators = indicators
         elif EdgeFlag.INDICATORS in self._required_edgework_flag:
-            if ask.yes_no("Are there any indicators?"):
+            if (yield from questions.yes_no("Are there any indicators?")):
                 ask.talk("Input each indicator, one per line.")
                 ask.talk("Lowercase means unlit and uppercase means lit,")
                 ask.talk('so "CAR" is a lit CAR, and "frk" is an unlit FRK.')
-                indicator_list_raw = ask.list_from_regex(
+                indicator_list_raw = yield from questions.list_from_regex(
                     r"[a-z]{3}|[A-Z]{3}", case_sensitive=True,
                 )
                 self.indicators = tuple(
@@ -194,12 +363,13 @@ class Edgework:  # TODO: move the serial number processing to solverutils
                 )
             # otherwise, the default is no indicators and will do
 
-    def _get_serial(self, serial: Optional[str]) -> None:
+    def _get_serial(self, serial: Optional[str]) -> questions.Asking[None]:
         if serial is not None and self._serial_valid(serial):
             self.serial = serial
         elif EdgeFlag.SERIAL in self._required_edgework_flag:
             ask.talk("What is the serial number?")
-            self.serial = ask.str_from_func(self._serial_valid).lower()
+            serial = yield from questions.str_from_func(self._serial_valid)
+            self.serial = serial.lower()
 
     def _serial_valid(self, serial: str) -> bool:
         """Check if a potential serial number is valid."""
@@ -209,17 +379,19 @@ class Edgework:  # TODO: move the serial number processing to solverutils
             and not (serial.isalpha() or serial.isdigit())
         )
 
-    def _get_ports(self, port_plates: Optional[PortPlateList]) -> None:
+    def _get_ports(self, port_plates: Optional[PortPlateList]) -> questions.Asking[None]:
         if port_plates is not None:
             self.port_plates = port_plates
         elif EdgeFlag.PORTS in self._required_edgework_flag:
-            if ask.yes_no("Are there any port plates?"):
+            if (yield from questions.yes_no("Are there any port plates?")):
                 plate_list: List[PortPlate] = []
                 ask.talk("How many port plates are there?")
-                plate_count = ask.positive_int()
+                plate_count = yield from questions.positive_int()
                 for plate_id in range(plate_count):
                     ask.talk("What ports, if any, are on plate {0}?".format(plate_id + 1))
-                    plate = ask.list_from_set(self._port_names, print_options=True)
+                    plate = yield from questions.list_from_set(
+                        self._port_names, print_options=True,
+                    )
                     plate_list.append(
                         tuple(self._port_name_to_enum[port] for port in plate),
                     )
@@ -249,8 +421,69 @@ class Edgework:  # TODO: move the serial number processing to solverutils
             self.solves = solves
 
 
+class _StageCheckpoints:
+    """
+    Snapshots of a solver's checkpoint_fields before each stage, and the
+    answers given to each stage, to roll back to and replay after a strike.
+    """
+
+    checkpoint_fields: Tuple[str, ...]
+    current_stage: int
+    # checkpoint_fields as they were before each stage, and its answers
+    _snapshots: Dict[int, Dict[str, object]]
+    _stage_answers: Dict[int, List[str]]
+    stage: Callable[[], questions.Asking[None]]
+
+    def run_stage(self) -> questions.Asking[None]:
+        """
+        Solve the current stage. If the solver has checkpoint_fields, snapshot
+        them first, and if the stage is being redone after its module reset,
+        offer to reuse the answers given to it last time, so it takes a single
+        keypress.
+        """
+        with trace.span("stage", stage=self.current_stage):
+            if not self.checkpoint_fields:
+                yield from self.stage()
+                return
+            start_stage = self.current_stage
+            self._snapshots[start_stage] = {
+                field: deepcopy(getattr(self, field)) for field in self.checkpoint_fields
+            }
+            previous = self._stage_answers.get(start_stage, [])
+            answers: List[str] = []
+            stage = questions.recorded(self.stage(), answers)
+            if previous and (yield from self._confirm_answers(previous)):
+                stage = questions.replayed(stage, previous)
+            yield from stage
+            # a stage may skip ahead, so file everything under the stage it ended on
+            self._snapshots[self.current_stage] = self._snapshots.pop(start_stage)
+            self._stage_answers[self.current_stage] = answers
+
+    def rollback(self, stage: int) -> None:
+        """Restore checkpoint_fields to how they were before the given stage."""
+        snapshot = self._snapshots.get(stage)
+        if snapshot is not None:
+            for field, saved in snapshot.items():
+                setattr(self, field, saved)
+        self._snapshots = {
+            earlier_stage: fields
+            for earlier_stage, fields in self._snapshots.items()
+            if earlier_stage < stage
+        }
+
+    def _confirm_answers(self, previous: List[str]) -> questions.Asking[bool]:
+        """Ask whether this stage is the same as when it was last answered."""
+        ask.talk(
+            "Last time this stage was answered with: {0}".format(
+                ask.SEPARATOR.join(previous),
+            ),
+            warning_bypass=True,
+        )
+        return (yield from questions.yes_no("Is it still the same?"))
+
+
 # this is an abstract base class, the stuff to override is more important than __init__
-class ModuleSolver(ABC):  # noqa: WPS338
+class ModuleSolver(_StageCheckpoints, ABC):  # noqa: WPS338
     """Prototype class for regular module solvers."""
 
     bomb: Edgework  # Should be assigned directly by managing BombSolver
@@ -259,6 +492,10 @@ class ModuleSolver(ABC):  # noqa: WPS338
     # The following may be defined statically by subclasses as needed:
     total_stages: int = 1
     reset_stages_on_strike: bool = False
+    solve_after: Tuple[str, ...] = ()  # IDs of modules to solve before this one
+    solve_before: Tuple[str, ...] = ()  # IDs of modules to solve after this one
+    checkpoint_fields: Tuple[str, ...] = ()  # custom data to roll back on a strike
+    aliases: Tuple[str, ...] = ()  # other names the module can be looked up by
 
     @property
     @abstractmethod
@@ -285,15 +522,44 @@ class ModuleSolver(ABC):  # noqa: WPS338
         """
 
     @abstractmethod
-    def stage(self) -> None:
-        """Solve a single stage (the entire module if unstaged)."""
+    def stage(self) -> questions.Asking[None]:
+        """
+        Solve a single stage (the entire module if unstaged).
+        This is a generator, asking its questions through ktane.questions.
+        """
 
     # region: default handling
 
+    def __init_subclass__(cls, register: bool = True, **kwargs: object) -> None:
+        """
+        Add the solver to the registry, unless register=False is passed.
+        Raise TypeError if the solver still defines the removed resort_queue hook,
+        or overrides solve without solving, which is what the bomb solver runs.
+        """
+        super().__init_subclass__(**kwargs)
+        if "resort_queue" in cls.__dict__:
+            raise TypeError(
+                "{0} defines resort_queue, which is no longer called;".format(
+                    cls.__name__,
+                )
+                + " declare solve_after and solve_before instead",
+            )
+        if "solve" in cls.__dict__ and "solving" not in cls.__dict__:
+            raise TypeError(
+                "{0} overrides solve, which the bomb solver doesn't call;".format(
+                    cls.__name__,
+                )
+                + " override solving instead",
+            )
+        if register:
+            registry.register(cls)
+
     def __init__(self, count: int = 1):
         self.total_count: Final[int] = count
         self.solved_count: int = 0
         self.current_stage: int = 0
+        self._snapshots = {}
+        self._stage_answers = {}
         self.custom_data_init()
 
     def post_init(self, edgework: Edgework, bomb_solver: "BombSolver") -> None:
@@ -333,48 +599,58 @@ class ModuleSolver(ABC):  # noqa: WPS338
 
     def solve(self) -> None:
         """Solve one instance of this module in its entirety."""
+        ask.drive(self.solving())
+
+    def solving(self) -> questions.Asking[None]:
+        """The generator form of solve."""
         self.announce()
         while self.do_stage():
-            self.stage()
-            self.check_strike()
-        if not self.check_solve():
+            yield from self.run_stage()
+            yield from self.check_strike()
+            self.bomb_solver.handle_stage()
+        if not (yield from self.check_solve()):
             self.reset_stages()  # undefined behavior
 
-    def check_strike(self) -> None:
+    def check_strike(self) -> questions.Asking[None]:
         """Ask whether a strike occurred, and handle it if so."""
-        if ask.yes_no("Did the module strike?"):
-            self.bomb.add_strike()
-            self.on_this_struck()
-            self.bomb_solver.handle_strike()
+        with trace.span("check strike"):
+            if (yield from questions.yes_no("Did the module strike?")):
+                self.bomb.add_strike()
+                self.on_this_struck()
+                self.bomb_solver.handle_strike()
 
-    def check_solve(self) -> bool:
+    def check_solve(self) -> questions.Asking[bool]:
         """
         Ask whether a solve occurred, and handle it if so.
         Return whether a solve in fact occurred.
         """
-        if ask.yes_no("Did the module solve?"):
-            self.bomb.add_solve()
-            self.on_this_solved()
-            self.bomb_solver.handle_solve()
-            return True
-        return False
+        with trace.span("check solve"):
+            if (yield from questions.yes_no("Did the module solve?")):
+                self.bomb.add_solve()
+                self.on_this_solved()
+                self.bomb_solver.handle_solve()
+                return True
+            return False
 
     def on_this_struck(self) -> None:
         """Handle when this module produces a strike."""
+        struck_stage = self.current_stage
         if self.reset_stages_on_strike:
             self.reset_stages()
+            self.rollback(1)
         else:
             self.current_stage -= 1
+            self.rollback(struck_stage)
+            # the stage is asked afresh, as its answers are what struck
+            self._stage_answers.pop(struck_stage, None)
 
     def on_this_solved(self) -> None:
         """Handle when this module produces a solve."""
         self.reset_stages()
+        self._snapshots.clear()
+        self._stage_answers.clear()
         self.solved_count += 1
 
-    def resort_queue(self, queue: Deque["ModuleSolver"]) -> Deque["ModuleSolver"]:
-        """Adjust the solve queue, if needed."""
-        return queue
-
     # endregion
 
     @property
@@ -383,6 +659,176 @@ class ModuleSolver(ABC):  # noqa: WPS338
         return self.solved_count >= self.total_count
 
 
+class SolveQueue:
+    """
+    Queue of solvers that respects their solve_after and solve_before constraints.
+
+    Like a deque that is popped and appended on the right, the last solver
+    given comes out first, and appending a solver puts it next in line. But a
+    solver is only popped once every solver it must come after is all solved:
+    the constraints are merged into one graph, and the solvers whose
+    predecessors are done wait in a heap keyed by their place in line.
+    """
+
+    def __init__(self, solvers: Iterable[ModuleSolver]) -> None:
+        # higher ranks are popped sooner
+        self._ranks: Dict[ModuleSolver, int] = {
+            solver: rank for rank, solver in enumerate(solvers)
+        }
+        self._next_rank = len(self._ranks)
+        # the graph has an edge from each solver to those that must come after it
+        self._successors = self._constraint_graph()
+        self._blockers = self._count_blockers()  # unsolved solvers to wait for
+        self._check_acyclic()
+        # ranks are unique, so solvers themselves are never compared
+        self._ready: List[Tuple[int, ModuleSolver]] = []
+        for ready, blockers in self._blockers.items():
+            if not blockers:
+                self._push_ready(ready)
+
+    def __len__(self) -> int:
+        """The number of solvers in the queue, whether ready or not."""
+        return len(self._ranks)
+
+    def __iter__(self) -> Iterator[ModuleSolver]:
+        """Iterate over the solvers in the queue, in no particular order."""
+        return iter(self._ranks)
+
+    def pop(self) -> ModuleSolver:
+        """Remove and return the next solver whose constraints are met."""
+        if not self._ready:
+            raise IndexError("pop from an empty SolveQueue")
+        _, solver = heapq.heappop(self._ready)
+        self._ranks.pop(solver)
+        return solver
+
+    def append(self, solver: ModuleSolver) -> None:
+        """Put a popped solver with modules left to solve next in line."""
+        self._ranks[solver] = self._next_rank
+        self._next_rank += 1
+        self._push_ready(solver)
+
+    def finish(self, solver: ModuleSolver) -> None:
+        """Record that a popped solver is all solved, freeing those waiting on it."""
+        for successor in self._successors.pop(solver):
+            self._blockers[successor] -= 1
+            if not self._blockers[successor]:
+                self._push_ready(successor)
+        self._blockers.pop(solver)
+
+    def _constraint_graph(self) -> Dict[ModuleSolver, Set[ModuleSolver]]:
+        """Map each solver to the solvers that must come after it."""
+        by_id = self._solvers_by_id()
+        successors: Dict[ModuleSolver, Set[ModuleSolver]] = {
+            earlier: set() for earlier in self._ranks
+        }
+        for solver in self._ranks:
+            for earlier, later in self._constraints(solver, by_id):
+                if earlier is not later:
+                    successors[earlier].add(later)
+        return successors
+
+    def _solvers_by_id(self) -> Dict[str, List[ModuleSolver]]:
+        """Group the solvers by module ID, which is what constraints name."""
+        by_id: Dict[str, List[ModuleSolver]] = {}
+        for solver in self._ranks:
+            by_id.setdefault(str(solver.id), []).append(solver)
+        return by_id
+
+    def _constraints(
+        self, solver: ModuleSolver, by_id: Mapping[str, List[ModuleSolver]],
+    ) -> Iterator[Tuple[ModuleSolver, ModuleSolver]]:
+        """Yield (earlier, later) pairs for the constraints the solver declares."""
+        for after_id in solver.solve_after:
+            yield from ((earlier, solver) for earlier in by_id.get(after_id, ()))
+        for before_id in solver.solve_before:
+            yield from ((solver, later) for later in by_id.get(before_id, ()))
+
+    def _count_blockers(self) -> Dict[ModuleSolver, int]:
+        """Count how many solvers each solver must wait for."""
+        blockers = dict.fromkeys(self._ranks, 0)
+        for successors in self._successors.values():
+            for successor in successors:
+                blockers[successor] += 1
+        return blockers
+
+    def _check_acyclic(self) -> None:
+        """Raise ValueError if the constraints can't all be satisfied."""
+        stuck = self._unreachable()
+        if stuck:
+            raise ValueError(
+                "Solve order constraints form a cycle among: {0}".format(
+                    ", ".join(sorted(str(solver.name) for solver in stuck)),
+                ),
+            )
+
+    def _unreachable(self) -> List[ModuleSolver]:
+        """Walk the graph in a valid order, returning the solvers it never reaches."""
+        blockers = self._blockers.copy()
+        free = [solver for solver, waiting in blockers.items() if not waiting]
+        while free:
+            for successor in self._successors[free.pop()]:
+                blockers[successor] -= 1
+                if not blockers[successor]:
+                    free.append(successor)
+        return [solver for solver, waiting in blockers.items() if waiting]
+
+    def _push_ready(self, solver: ModuleSolver) -> None:
+        heapq.heappush(self._ready, (-self._ranks[solver], solver))
+
+
+class _Changes(NamedTuple):
+    """
+    A checkpoint record of everything a stage, strike or solve can change:
+    the edgework, the queue, and the state of the solver being solved.
+    """
+
+    edgework: Edgework
+    queue: Optional[SolveQueue]  # None if unchanged since the last record
+    current_solver: Optional[ModuleSolver]
+    solver_state: Dict[str, object]  # empty if there is no current solver
+
+    def apply_to(self, bomb: "BombSolver") -> None:
+        """Bring a bomb read from an earlier checkpoint up to date."""
+        bomb.edgework.__dict__.update(self.edgework.__dict__)
+        if self.queue is not None:
+            bomb.queue = self.queue
+        bomb.current_solver = self.current_solver
+        if self.current_solver is not None:
+            self.current_solver.__dict__.update(self.solver_state)
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """Pickler that writes the bomb and its solvers as references to them."""
+
+    def __init__(self, checkpoint_file: BinaryIO, bomb: "BombSolver") -> None:
+        super().__init__(checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._references: Dict[int, Union[int, str]] = {
+            id(solver): index for index, solver in enumerate(bomb.solvers)
+        }
+        self._references[id(bomb)] = _BOMB_REFERENCE
+
+    def persistent_id(self, obj: object) -> Optional[Union[int, str]]:  # noqa: WPS110
+        """Refer to the bomb or one of its solvers, or pickle anything else."""
+        return self._references.get(id(obj))
+
+
+class _CheckpointUnpickler(pickle.Unpickler):  # noqa: S301
+    """Unpickler that resolves the references written by _CheckpointPickler."""
+
+    def __init__(self, checkpoint_file: BinaryIO, bomb: Optional["BombSolver"]) -> None:
+        super().__init__(checkpoint_file)
+        self._bomb = bomb
+
+    def persistent_load(self, pid: Union[int, str]) -> object:
+        """Look up a reference in the bomb read so far."""
+        if self._bomb is None:
+            raise pickle.UnpicklingError("Checkpoint changes come before any bomb")
+        if pid == _BOMB_REFERENCE:
+            return self._bomb
+        return self._bomb.solvers[int(pid)]
+
+
 class BombSolver:
     """
     Object that handles bomb-scale tasks, like boss modules, strike and
@@ -390,14 +836,24 @@ class BombSolver:
     """
 
     edgework: Edgework
-    queue: Deque[ModuleSolver]  # for now this must contain every module
+    queue: SolveQueue  # for now this must contain every module
     # eventually it will be split into one for regular modules and one for bosses
 
     def __init__(self, *queue: ModuleSolver):
-        self.queue = deque(queue)
+        self.solvers: Final = queue  # every solver, in the order first given
+        self.queue = SolveQueue(queue)
         self.edgework = Edgework()
+        self.current_solver: Optional[ModuleSolver] = None  # popped and being solved
+        self._checkpoint_file: Optional[BinaryIO] = None
+        self._queue_changed = False  # since the last checkpoint was written
         self.initialize_solvers()
 
+    def __getstate__(self) -> Dict[str, object]:
+        """Leave out the open checkpoint file when pickling."""
+        state = self.__dict__.copy()
+        state["_checkpoint_file"] = None
+        return state
+
     def count_modules(self) -> int:
         """
         Determine how many individual modules are on the bomb.
@@ -414,52 +870,225 @@ class BombSolver:
             solver.post_init(self.edgework, self)
 
     def initialize_edgework(
-        self, *, start_time_mins: Optional[int] = None, max_strikes: Optional[int] = None,
+        self, *,
+        start_time_mins: Optional[int] = None,
+        max_strikes: Optional[int] = None,
+        batteries: Optional[int] = None,
+        indicators: Optional[IndicatorList] = None,
+        port_plates: Optional[PortPlateList] = None,
+        serial: Optional[str] = None,
     ) -> None:
-        """Initialize the edgework object and acquire all edgework info."""
-        self.edgework.post_init(
+        """
+        Initialize the edgework object and acquire all edgework info.
+        Any edgework not given here is asked for if a solver needs it.
+        """
+        ask.drive(self.initializing_edgework(
+            start_time_mins=start_time_mins,
+            max_strikes=max_strikes,
+            batteries=batteries,
+            indicators=indicators,
+            port_plates=port_plates,
+            serial=serial,
+        ))
+
+    def initializing_edgework(
+        self, *,
+        start_time_mins: Optional[int] = None,
+        max_strikes: Optional[int] = None,
+        batteries: Optional[int] = None,
+        indicators: Optional[IndicatorList] = None,
+        port_plates: Optional[PortPlateList] = None,
+        serial: Optional[str] = None,
+    ) -> questions.Asking[None]:
+        """The generator form of initialize_edgework."""
+        yield from self.edgework.gathering(
             start_time_mins=start_time_mins,
             total_modules=self.count_modules(),
             max_strikes=max_strikes,
+            batteries=batteries,
+            indicators=indicators,
+            port_plates=port_plates,
+            serial=serial,
         )
 
     def handle_strike(self) -> None:
         """Do any processing that needs to be done after each strike."""
+        self.write_checkpoint()
 
     def handle_solve(self) -> None:
         """Do any processing that needs to be done after each solve."""
+        self.write_checkpoint()
 
-    def resort_queue(self) -> None:
+    def handle_stage(self) -> None:
+        """Do any processing that needs to be done after each stage."""
+        self.write_checkpoint()
+
+    def write_checkpoint(self) -> None:
         """
-        Pass the queue through every solver subscribed to this event
-        to ensure that the solve queue is in an acceptable state.
+        Append what may have changed since the last checkpoint to the checkpoint
+        file, if one is open: the edgework, the queue if a solver was popped or
+        put back since, and the current solver. Other solvers are written
+        as references, so each record stays small.
         """
-        new_queue = self.queue.copy()
-        for solver in self.queue:
-            new_queue = solver.resort_queue(new_queue.copy())  # just in case
-        self.queue = new_queue.copy()  # just in case!!!
+        if self._checkpoint_file is None or self._checkpoint_file.closed:
+            return
+        solver_state: Dict[str, object] = {}
+        if self.current_solver is not None:
+            solver_state = {
+                name: attribute
+                for name, attribute in self.current_solver.__dict__.items()
+                if name not in {"bomb", "bomb_solver"}
+            }
+        queue = self.queue if self._queue_changed else None
+        changes = _Changes(self.edgework, queue, self.current_solver, solver_state)
+        _CheckpointPickler(self._checkpoint_file, self).dump(changes)
+        self._checkpoint_file.flush()
+        self._queue_changed = False
+
+    @classmethod
+    def load_checkpoint(cls, path: str) -> "BombSolver":
+        """
+        Read the bomb from a checkpoint file, with every complete change after it.
+        A partly written last record, as left by a crash mid-write, is ignored.
+        """
+        bomb: Optional[BombSolver] = None
+        with open(path, "rb") as checkpoint_file:
+            while True:
+                try:
+                    record = _CheckpointUnpickler(checkpoint_file, bomb).load()
+                except _TORN_RECORD_ERRORS:  # the end, or a partly written record
+                    break
+                if isinstance(record, BombSolver):
+                    bomb = record
+                elif bomb is not None:
+                    record.apply_to(bomb)
+        if bomb is None:
+            raise ValueError("No checkpoint found in {0}".format(path))
+        return bomb
+
+    @classmethod
+    def resume(cls, path: str) -> "BombSolver":
+        """
+        Continue solving a bomb from the last checkpoint in path,
+        carrying on writing checkpoints to it.
+        """
+        bomb = cls.load_checkpoint(path)
+        ask.drive(bomb.resuming(path))
+        return bomb
+
+    def resuming(self, path: str) -> questions.Asking[None]:
+        """The generator form of resume, for a bomb read with load_checkpoint."""
+        # checkpoints are skipped once the file is closed, however the run ends
+        with open(path, "ab") as checkpoint_file:
+            self._checkpoint_file = checkpoint_file
+            yield from self._run()
+        self._checkpoint_file = None
 
     def solve(
-        self, *, start_time_mins: Optional[int] = None, max_strikes: Optional[int] = None,
+        self, *,
+        start_time_mins: Optional[int] = None,
+        max_strikes: Optional[int] = None,
+        batteries: Optional[int] = None,
+        indicators: Optional[IndicatorList] = None,
+        port_plates: Optional[PortPlateList] = None,
+        serial: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
     ) -> None:
         """
         Get edgework information, call each solver in turn,
-        and do associated handling.
-        """
-        self.initialize_edgework(start_time_mins=start_time_mins, max_strikes=max_strikes)
-        while self.queue:
-            if self.edgework.defused:
-                raise RuntimeError("Bomb defused with items on the queue.")
-            self.resort_queue()
-            solver = self.queue.pop()
-            solver.solve()
-            if not solver.all_solved:
-                self.queue.append(solver)
+        and do associated handling. If checkpoint_path is given, the bomb is
+        written to it once the edgework is known, and what changed is appended
+        after every stage, strike, and solve, so that the bomb can be picked up
+        again with resume().
+        """
+        ask.drive(self.solving(
+            start_time_mins=start_time_mins,
+            max_strikes=max_strikes,
+            batteries=batteries,
+            indicators=indicators,
+            port_plates=port_plates,
+            serial=serial,
+            checkpoint_path=checkpoint_path,
+        ))
+
+    def solving(
+        self, *,
+        start_time_mins: Optional[int] = None,
+        max_strikes: Optional[int] = None,
+        batteries: Optional[int] = None,
+        indicators: Optional[IndicatorList] = None,
+        port_plates: Optional[PortPlateList] = None,
+        serial: Optional[str] = None,
+        checkpoint_path: Optional[str] = None,
+    ) -> questions.Asking[None]:
+        """
+        The generator form of solve, which can be driven without blocking,
+        e.g. by a questions.Conversation.
+        """
+        if checkpoint_path is None:
+            yield from self.initializing_edgework(
+                start_time_mins=start_time_mins,
+                max_strikes=max_strikes,
+                batteries=batteries,
+                indicators=indicators,
+                port_plates=port_plates,
+                serial=serial,
+            )
+            self._write_full_checkpoint()
+            yield from self._run()
+            return
+        # checkpoints are skipped once the file is closed, however the run ends
+        with open(checkpoint_path, "wb") as checkpoint_file:
+            self._checkpoint_file = checkpoint_file
+            yield from self.solving(
+                start_time_mins=start_time_mins,
+                max_strikes=max_strikes,
+                batteries=batteries,
+                indicators=indicators,
+                port_plates=port_plates,
+                serial=serial,
+            )
+        self._checkpoint_file = None
+
+    def _write_full_checkpoint(self) -> None:
+        """Start off the checkpoint file, if one is open, with the whole bomb."""
+        if self._checkpoint_file is not None:
+            pickle.dump(self, self._checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._checkpoint_file.flush()
+            self._queue_changed = False
+
+    def _run(self) -> questions.Asking[None]:
+        """Call each solver in turn, starting with any solver left partway done."""
+        if self.current_solver is not None:
+            self._requeue(self.current_solver)
+        with trace.span("bomb", modules=self.edgework.total_modules):
+            while self.queue:
+                if self.edgework.defused:
+                    raise RuntimeError("Bomb defused with items on the queue.")
+                solver = self.queue.pop()
+                self.current_solver = solver
+                self._queue_changed = True
+                with trace.span(
+                    str(solver.name),
+                    module_id=str(solver.id),
+                    number=solver.solved_count + 1,
+                ):
+                    yield from solver.solving()
+                self._requeue(solver)
         if self.edgework.defused:
             ask.talk("Bomb defused!")
         else:
             raise RuntimeError("Queue empty but bomb not defused.")
 
+    def _requeue(self, solver: ModuleSolver) -> None:
+        """Put a popped solver back in the queue, or drop it if it's all solved."""
+        self.current_solver = None
+        self._queue_changed = True
+        if solver.all_solved:
+            self.queue.finish(solver)
+        else:
+            self.queue.append(solver)
+
 
 def modules_from_pool(
     *modules: Type[ModuleSolver], count: int = 1, print_options: bool = True,
@@ -468,18 +1097,24 @@ def modules_from_pool(
     Ask the user which of the modules in the pool is present on the bomb,
     and return the associated solvers.
     """
+    return ask.drive(choosing_from_pool(
+        *modules, count=count, print_options=print_options,
+    ))
+
+
+def choosing_from_pool(
+    *modules: Type[ModuleSolver], count: int = 1, print_options: bool = True,
+) -> questions.Asking[List[ModuleSolver]]:
+    """The generator form of modules_from_pool."""
     module_names = {str(module.name) for module in modules}
     if print_options:
         ask.talk("Which of the following modules are present on the bomb?")
     else:
         ask.talk("Which modules in the pool are present on the bomb?")
-    modules_present = ask.list_from_set(
+    modules_present = yield from questions.list_from_set(
         module_names, print_options=print_options, expected_len=count,
     )
-    final_modules = []
-    for module_name in set(modules_present):
-        for module in modules:
-            if str(module.name).lower() == module_name:  # module.name will be lowercase
-                final_modules.append(module(modules_present.count(module_name)))
-                break
-    return final_modules
+    return [  # module names will be lowercase, which the registry still finds
+        registry.get(module_name)(modules_present.count(module_name))
+        for module_name in set(modules_present)
+    ]
@@ -1,6 +1,10 @@
-"""Solvers for modded modules."""
+"""Solvers for modded modules, each file imported on first use."""
 
-from ktane.mods import a_mods, c_mods, f_mods, t_mods, w_mods
+from importlib import import_module
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from ktane.mods import a_mods, c_mods, f_mods, t_mods, w_mods  # noqa: F401
 
 __all__ = [
     "a_mods",
@@ -9,3 +13,14 @@ __all__ = [
     "t_mods",
     "w_mods",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a solver file the first time it is used."""
+    if name in __all__:
+        return import_module("{0}.{1}".format(__name__, name))
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))  # noqa: WPS421
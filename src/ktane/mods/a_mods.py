@@ -2,8 +2,9 @@
 
 from typing import Final
 
-from ktane import ask
+from ktane import ask, questions
 from ktane.directors import ModuleSolver
+from ktane.solverutils import lexicon
 
 __all__ = [
     "Anagrams",
@@ -17,7 +18,7 @@ class Anagrams(ModuleSolver):
     id: Final = "AnagramsModule"
     required_edgework: Final = ()
 
-    words: Final = {
+    words: Final = frozenset((
         "stream",
         "master",
         "tamers",
@@ -42,11 +43,13 @@ class Anagrams(ModuleSolver):
         "duster",
         "rusted",
         "rudest",
-    }
+    ))
 
-    def stage(self) -> None:
+    anagram_index: Final = lexicon.AnagramIndex(words)
+
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What word is on the display?")
-        word = ask.str_from_set(self.words)
-        for possible_word in self.words:
-            if set(possible_word) == set(word) and possible_word != word:
+        word = yield from questions.str_from_set(self.words)
+        for possible_word in self.anagram_index.anagrams(word):
+            if possible_word != word:
                 ask.talk('Type in the word "{0}".'.format(possible_word))
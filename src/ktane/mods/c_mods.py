@@ -1,9 +1,11 @@
 """Modded modules whose names begin with the letter C."""
 
-from typing import Final
+from string import punctuation, whitespace
+from typing import Final, Optional
 
-from ktane import ask
+from ktane import ask, questions
 from ktane.directors import ModuleSolver
+from ktane.solverutils import lexicon
 
 __all__ = [
     "ColourFlash",
@@ -18,22 +20,28 @@ class ColourFlash(ModuleSolver):
     id: Final = "ColourFlash"
     required_edgework: Final = ()
 
-    valid_colors: Final = {"red", "yellow", "green", "blue", "magenta", "white"}
+    valid_colors: Final = frozenset(
+        ("red", "yellow", "green", "blue", "magenta", "white"),
+    )
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What color is the last word in the sequence?")
-        last_color = ask.str_from_set(self.valid_colors)
+        last_color = yield from questions.str_from_set(self.valid_colors)
         if last_color == "red":
-            if ask.yes_no("Does the word Green appear at least three times?"):
+            if (yield from questions.yes_no(  # noqa: WPS337
+                "Does the word Green appear at least three times?",
+            )):
                 ask.talk("Press Yes on the third word whose color or text is green.")
-            elif ask.yes_no("Is there exactly one blue-colored word?"):
+            elif (yield from questions.yes_no("Is there exactly one blue-colored word?")):
                 ask.talk("Press No on the word Magenta.")
             else:
                 ask.talk("Press Yes on the last word whose color or text is white.")
         elif last_color == "yellow":
-            if ask.yes_no("Does the word Blue appear colored green?"):
+            if (yield from questions.yes_no("Does the word Blue appear colored green?")):
                 ask.talk("Press Yes on the first word colored green.")
-            elif ask.yes_no("Does the word White appear colored white or red?"):
+            elif (yield from questions.yes_no(  # noqa: WPS337
+                "Does the word White appear colored white or red?",
+            )):
                 ask.talk(
                     "Press Yes on the second word whose color doesn't match its text.",
                 )
@@ -41,39 +49,49 @@ class ColourFlash(ModuleSolver):
                 ask.talk("Count the number of words whose color or text is magenta.")
                 ask.talk("Press No that many words into the sequence.")
         elif last_color == "green":
-            if ask.yes_no("Does a word appear twice in a row with different colors?"):
+            if (yield from questions.yes_no(  # noqa: WPS337
+                "Does a word appear twice in a row with different colors?",
+            )):
                 ask.talk("Press No on the fifth word in the sequence.")
-            elif ask.yes_no("Does the word Magenta appear at least three times?"):
+            elif (yield from questions.yes_no(  # noqa: WPS337
+                "Does the word Magenta appear at least three times?",
+            )):
                 ask.talk("Press No on the first word whose color or text is yellow.")
             else:
                 ask.talk("Press Yes on any word whose text matches its color.")
         elif last_color == "blue":
-            if ask.yes_no(  # noqa: WPS337
+            if (yield from questions.yes_no(  # noqa: WPS337
                 "Are there at least three words whose color doesn't match their text?",
-            ):
+            )):
                 ask.talk("Press Yes on the first such word.")
-            elif ask.yes_no("Does the word Red appear colored yellow?"):
+            elif (yield from questions.yes_no(  # noqa: WPS337
+                "Does the word Red appear colored yellow?",
+            )):
                 ask.talk("Press No on the word White that is colored red.")
-            elif ask.yes_no("Does the word Yellow appear colored white?"):
+            elif (yield from questions.yes_no(  # noqa: WPS337
+                "Does the word Yellow appear colored white?",
+            )):
                 ask.talk("Press No on the word White that is colored red.")
             else:
                 ask.talk("Press Yes on the last word whose color or text is green.")
         elif last_color == "magenta":
-            if ask.yes_no("Do two words in a row share a color?"):
+            if (yield from questions.yes_no("Do two words in a row share a color?")):
                 ask.talk("Press Yes on the third word.")
-            elif ask.yes_no(  # noqa: WPS337
+            elif (yield from questions.yes_no(  # noqa: WPS337
                 "Are there more words reading Yellow than words colored blue?",
-            ):
+            )):
                 ask.talk("Press No on the last word whose text is Yellow.")
             else:
                 ask.talk("Note the text of the seventh word.")
                 ask.talk("Press No on the first word with that color.")
         else:  # white
-            if ask.yes_no(  # noqa: WPS337
+            if (yield from questions.yes_no(  # noqa: WPS337
                 "Does the third word's color match the fourth or fifth words' text?",
-            ):
+            )):
                 ask.talk("Press No on the first word whose color or text is blue.")
-            elif ask.yes_no("Does the word Yellow appear colored red?"):
+            elif (yield from questions.yes_no(  # noqa: WPS337
+                "Does the word Yellow appear colored red?",
+            )):
                 ask.talk("Press Yes on the last word colored blue.")
             else:
                 ask.talk("Press No at any time.")
@@ -200,10 +218,19 @@ class CrazyTalk(ModuleSolver):
         "fullstop fullstop": (8, 4),
     }
 
-    def stage(self) -> None:
-        ask.talk("What is on the display? Type it exactly as written.")
-        ask.talk("Include any typos. Type arrows as angle brackets.")
-        phrase = ask.str_from_set(self.table.keys())
+    # periods and arrows are the only punctuation that tells phrases apart
+    phrase_index: Final = lexicon.PhraseIndex(
+        table.keys(),
+        ignored="".join(
+            char for char in whitespace + punctuation if char not in ".<>"
+        ),
+    )
+
+    def stage(self) -> questions.Asking[None]:
+        ask.talk("What is on the display? Type it from the start, including typos,")
+        ask.talk("until it's clear which phrase it is. Type arrows as angle brackets.")
+        ask.talk("(Spaces and punctuation other than periods can be left out.)")
+        phrase = yield from self._ask_phrase()
         down, up = self.table[phrase]
         ask.talk(
             "Flip the switch down when the bomb timer"
@@ -213,3 +240,24 @@ class CrazyTalk(ModuleSolver):
             "Then, flip the switch up when the bomb timer"
             + " has a {0} in the seconds column.".format(up),
         )
+
+    def _ask_phrase(self) -> questions.Asking[str]:
+        """Ask for more of the phrase until only one phrase fits."""
+        while True:
+            typed = yield from questions.str_from_func(self.phrase_index.has_prefix)
+            phrase: Optional[str] = self.phrase_index.resolve(typed)
+            if phrase is not None:
+                return phrase
+            phrase = self.phrase_index.exact(typed)
+            if phrase is not None:  # a whole phrase, but the start of others too
+                ask.talk(
+                    '"{0}" is a phrase, but also the start of others.'.format(phrase),
+                )
+                if (yield from questions.yes_no("Is that the whole display?")):
+                    return phrase
+            ask.talk(
+                "{0} phrases start like that.".format(
+                    self.phrase_index.completion_count(typed),
+                ),
+            )
+            ask.talk("Please type more of the display, from the start.")
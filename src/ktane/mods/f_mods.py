@@ -3,7 +3,7 @@
 from string import ascii_lowercase
 from typing import Final, List
 
-from ktane import ask
+from ktane import ask, questions
 from ktane.directors import EdgeFlag, ModuleSolver, Port
 
 __all__ = [
@@ -20,18 +20,20 @@ class FollowTheLeader(ModuleSolver):
         EdgeFlag.PORTS, EdgeFlag.SERIAL, EdgeFlag.BATTERIES, EdgeFlag.INDICATORS,
     )
 
-    valid_colors: Final = {"red", "yellow", "green", "blue", "black", "white"}
+    valid_colors: Final = frozenset(("red", "yellow", "green", "blue", "black", "white"))
+    plug_count: Final = 12  # numbered from 1
+    valid_plugs: Final = frozenset(str(plug) for plug in range(1, plug_count + 1))
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What plugs are the wires connected to, in numeric order?")
-        wire_plugs = ask.list_from_set(
-            {"1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"},
-        )
+        wire_plugs = yield from questions.list_from_set(self.valid_plugs)
         ask.talk(
             "Starting from plug {0}, ".format(wire_plugs[0])
             + "what colors are the wires in clockwise order?",
         )
-        wire_colors = ask.list_from_set(self.valid_colors, expected_len=len(wire_plugs))
+        wire_colors = yield from questions.list_from_set(
+            self.valid_colors, expected_len=len(wire_plugs),
+        )
         start_index: int
         if self.bomb.has_port(Port.RJ45) and ("4" in wire_plugs and "5" in wire_plugs):
             start_index = wire_plugs.index("4")
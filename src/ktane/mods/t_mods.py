@@ -1,9 +1,8 @@
 """Modded modules whose names begin with the letter T."""
 
-from collections import deque  # TurnTheKeys
-from typing import Deque, Final
+from typing import Final
 
-from ktane import ask
+from ktane import ask, questions
 from ktane.directors import ModuleSolver
 
 __all__ = [
@@ -17,6 +16,7 @@ class TurnTheKeys(ModuleSolver):
     name: Final = "Turn The Keys"
     id: Final = "TurnTheKeyAdvanced"
     required_edgework: Final = ()
+    aliases = ("TTK",)
 
     required_solves: Final = (
         # vanilla modules
@@ -50,20 +50,12 @@ class TurnTheKeys(ModuleSolver):
         "switchModule",  # Switches
     )
 
-    right_keys_turned: bool
+    # modules that must be solved before the right keys are turned
+    solve_after = required_solves
+    # modules that can't be solved until the left keys are turned
+    solve_before = banned_solves
 
-    def resort_queue(self, queue: Deque[ModuleSolver]) -> Deque[ModuleSolver]:
-        # TODO: only resort if needed
-        new_queue = deque(
-            module for module in queue
-            if module.id not in self.required_solves
-            and module.id not in self.banned_solves
-        )
-        new_queue.extend(module for module in queue if module.id in self.required_solves)
-        new_queue.extendleft(
-            module for module in queue if module.id in self.banned_solves
-        )
-        return new_queue
+    right_keys_turned: bool
 
     def custom_data_init(self) -> None:
         self.right_keys_turned: bool = False
@@ -72,7 +64,7 @@ class TurnTheKeys(ModuleSolver):
         self.right_keys_turned = True
         super().on_this_solved()
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         if not self.right_keys_turned:
             ask.talk(
                 "This module and others like it have a"
@@ -83,3 +75,4 @@ class TurnTheKeys(ModuleSolver):
                 + " type, in descending order of priority.",
             )
         ask.talk("Turn the lowest priority left key that hasn't already been turned.")
+        yield from ()  # noqa: WPS353 # nothing to ask, but stages are generators
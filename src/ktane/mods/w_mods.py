@@ -2,8 +2,9 @@
 
 from typing import Final
 
-from ktane import ask
+from ktane import ask, questions
 from ktane.directors import ModuleSolver
+from ktane.solverutils import lexicon
 
 __all__ = [
     "WordScramble",
@@ -17,7 +18,7 @@ class WordScramble(ModuleSolver):
     id: Final = "WordScrambleModule"
     required_edgework: Final = ()
 
-    words: Final = {
+    words: Final = frozenset((
         "module",
         "ottawa",
         "banana",
@@ -48,14 +49,16 @@ class WordScramble(ModuleSolver):
         "button",
         "robots",
         "kevlar",
-    }
+    ))
 
-    def stage(self) -> None:
+    anagram_index: Final = lexicon.AnagramIndex(words)
+
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What is displayed on the module?")
-        scramble = ask.str_from_regex(r"[a-z]{6}")
-        while set(scramble) not in {set(word) for word in self.words}:
+        scramble = yield from questions.str_from_regex(r"[a-z]{6}")
+        while not self.anagram_index.is_scramble(scramble):
             ask.talk("Those letters don't correspond to a known word.")
             ask.talk("What is displayed on the module?")
-            scramble = ask.str_from_regex(r"[a-z]{6}")
-        answer = [word for word in self.words if set(word) == set(scramble)][0]
+            scramble = yield from questions.str_from_regex(r"[a-z]{6}")
+        answer = self.anagram_index.anagrams(scramble)[0]
         ask.talk('Type in the word "{0}".'.format(answer))
@@ -0,0 +1,387 @@
+"""
+Generator forms of the ask functions, so solvers never block on input.
+
+Each function here yields a Question whenever it needs an answer from the
+user, and must be sent the answer back, finally returning what the blocking
+function in ask would have. Solvers built from them with yield from can be
+driven by anything that can supply answers: ask.drive() for the terminal or
+an answer source, or a Conversation stepped one answer at a time, e.g. for
+many bombs in one thread. Output for the user still goes through ask.talk,
+to whatever output sink is set while the generator runs.
+"""
+
+import operator
+import re
+from functools import lru_cache, partial
+from textwrap import wrap
+from time import perf_counter_ns
+from typing import (  # noqa: WPS235
+    AbstractSet,
+    Callable,
+    Final,
+    FrozenSet,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+from warnings import warn
+
+from ktane import ask, trace  # ask is only used once called, as it uses this module too
+
+__all__ = [
+    "TEXT",
+    "YES_NO",
+    "Validator",
+    "Question",
+    "Asking",
+    "Conversation",
+    "advance",
+    "recorded",
+    "replayed",
+    "set_validator",
+    "regex_validator",
+    "yes_no",
+    "list_from_func",
+    "str_from_func",
+    "list_from_set",
+    "str_from_set",
+    "list_from_regex",
+    "str_from_regex",
+    "positive_int",
+]
+
+TEXT: Final = "text"  # a line of text, checked by the validator
+YES_NO: Final = "yes/no"  # "y" for yes, anything else for no
+# Debug stuff.
+_MAX_ITERATIONS: Final = 20
+# Enough for every option set and pattern the solvers use, with room to spare.
+_VALIDATOR_CACHE_SIZE: Final = 256
+_NO_OPTIONS: Final[FrozenSet[str]] = frozenset()
+
+_ReturnT = TypeVar("_ReturnT")
+
+# Called with an answer, returns something truthy if it's valid.
+Validator = Callable[[str], object]
+
+
+class Question(NamedTuple):
+    """A request for one answer from the user."""
+
+    kind: str
+    prompt: str  # what to show where the answer is typed, as input() would
+    options: FrozenSet[str] = frozenset()  # the accepted answers, if there's a set
+    validator: Optional[Validator] = None  # None if anything is accepted
+    case_sensitive: bool = False  # if not, answers are lowercased before validating
+    allow_empty: bool = False  # an empty answer is accepted too
+
+
+# Yields questions, is sent each answer, and returns the result.
+Asking = Generator[Question, str, _ReturnT]
+
+
+class Conversation:
+    """
+    Steps an Asking generator one answer at a time, collecting its output,
+    so that any number of them can be interleaved in a single thread.
+    """
+
+    def __init__(self, asking: Asking[object]) -> None:
+        self.output: List[str] = []  # output since the last question, cleared on send
+        self.question: Optional[Question] = None  # None once finished
+        self.returned: object = None  # what the generator returned, once finished
+        self.finished = False
+        self._asking: Final = asking
+        self._asked_ns = 0  # when the question was asked, as a perf_counter_ns() time
+        self._step(None)
+
+    def send(self, answer: str) -> Optional[Question]:
+        """Answer the current question, and return the next one, or None if finished."""
+        if self.finished:
+            raise RuntimeError("The conversation has already finished.")
+        # the time since the question was asked was spent waiting on the user
+        with trace.on_track(id(self)):
+            trace.span_since(
+                self._asked_ns, "answer", trace.INPUT, question=self._question_text(),
+            )
+        self.output = []
+        self._step(answer)
+        return self.question
+
+    def _step(self, answer: Optional[str]) -> None:
+        with ask.output_sink(self.output.append):
+            with trace.on_track(id(self)):
+                self._advance(answer)
+        self._asked_ns = perf_counter_ns()
+
+    def _question_text(self) -> str:
+        """The current question, as the last output line if its prompt is generic."""
+        prompt = cast(Question, self.question).prompt
+        if prompt == ask.PROMPT and self.output:
+            return self.output[-1]
+        return prompt.strip()
+
+    def _advance(self, answer: Optional[str]) -> None:
+        step = advance(self._asking, answer)
+        if isinstance(step, Question):
+            self.question = step
+        else:
+            self.question = None
+            self.returned = step.value
+            self.finished = True
+
+
+def advance(
+    asking: Asking[_ReturnT], answer: Optional[str] = None,
+) -> Union[Question, StopIteration]:
+    """
+    Start asking, or send it the answer to its last question, and return
+    its next question, or the StopIteration holding what it returned.
+    """
+    try:
+        return next(asking) if answer is None else asking.send(answer)
+    except StopIteration as stop:
+        return stop
+
+
+def recorded(asking: Asking[_ReturnT], record: List[str]) -> Asking[_ReturnT]:
+    """Pass on every question asked, appending each answer to record."""
+    step = advance(asking)
+    while isinstance(step, Question):
+        answer = yield step
+        record.append(answer)
+        step = advance(asking, answer)
+    return cast(_ReturnT, step.value)
+
+
+def replayed(asking: Asking[_ReturnT], answers: Iterable[str]) -> Asking[_ReturnT]:
+    """
+    Answer questions with answers in order without asking them,
+    passing on any questions left once they run out.
+    """
+    answer_iter = iter(answers)
+    step = advance(asking)
+    while isinstance(step, Question):
+        answer = next(answer_iter, None)
+        if answer is None:
+            answer = yield step
+        step = advance(asking, answer)
+    return cast(_ReturnT, step.value)
+
+
+def _make_set_validator(
+    valid_strings: FrozenSet[str], case_sensitive: bool,
+) -> Tuple[FrozenSet[str], Validator]:
+    """The strings accepted from a set, as the validator sees them, and the validator."""
+    if case_sensitive:
+        options = valid_strings
+    else:
+        options = frozenset(string.lower() for string in valid_strings)
+    return options, partial(operator.contains, options)
+
+
+_cached_set_validator: Final = lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)(
+    _make_set_validator,
+)
+
+
+def _set_validator(
+    valid_strings: AbstractSet[str], case_sensitive: bool,
+) -> Tuple[FrozenSet[str], Validator]:
+    if isinstance(valid_strings, frozenset):
+        return _cached_set_validator(valid_strings, case_sensitive)
+    return _make_set_validator(frozenset(valid_strings), case_sensitive)
+
+
+def set_validator(
+    valid_strings: AbstractSet[str], *, case_sensitive: bool = False,
+) -> Validator:
+    """
+    Make a validator accepting the strings in valid_strings, lowercased unless
+    case_sensitive. Validators for frozensets are cached, so solvers should keep
+    their options in class-level frozensets to build each validator only once.
+    """
+    return _set_validator(valid_strings, case_sensitive)[1]
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def regex_validator(input_pattern: Union[str, Pattern[str]]) -> Validator:
+    """Make a cached validator accepting strings that fully match the pattern."""
+    return re.compile(input_pattern).fullmatch
+
+
+def _print_set(strings: AbstractSet[str], *, case_sensitive: bool = False) -> None:
+    """Display a set in readable form across one or more lines."""
+    if not strings:  # empty set
+        return
+    if not case_sensitive:
+        strings = {string.upper() for string in strings}
+    for string in strings:
+        if len(string) >= ask.MAX_LINE_PRINT_LENGTH:
+            warn('WARNING: String in set too long: "{0}"'.format(string))
+    paragraph: str = ask.SEPARATOR.join(sorted(strings))
+    lines: List[str] = wrap(paragraph, width=ask.MAX_LINE_PRINT_LENGTH)
+    for line in lines:
+        ask.talk(line)
+
+
+def _from_func(
+    func: Validator, *,
+    case_sensitive: bool,
+    allow_empty: bool = False,
+    options: FrozenSet[str] = _NO_OPTIONS,
+) -> Asking[str]:
+    """
+    Get a single string from the user that satisfies func,
+    respecting case_sensitive and allow_empty options.
+    """
+    question = Question(TEXT, ask.PROMPT, options, func, case_sensitive, allow_empty)
+    count = 0
+    response = yield question
+    if not case_sensitive:
+        response = response.lower()
+    while not (func(response) or (allow_empty and response == "")):
+        ask.talk(
+            'Answer "{0}" is not a valid answer and will be ignored.'.format(response),
+            warning_bypass=True,
+        )
+        ask.talk("Please try again.")
+        count += 1
+        if count >= _MAX_ITERATIONS:
+            raise RuntimeError("Too many invalid user inputs.")
+        response = yield question
+        if not case_sensitive:
+            response = response.lower()
+    return response
+
+
+def yes_no(prompt: str) -> Asking[bool]:
+    """Ask the user a yes/no question."""
+    prompt = "{0} (y/n) ".format(prompt)
+    if len(prompt) > ask.MAX_LINE_PRINT_LENGTH:
+        warn('WARNING: Prompt too long: "{0}"'.format(prompt))
+    answer = yield Question(YES_NO, prompt)
+    return answer.strip().lower() == "y"
+
+
+def _list_from(
+    func: Validator, *,
+    case_sensitive: bool,
+    expected_len: int,
+    options: FrozenSet[str] = _NO_OPTIONS,
+) -> Asking[List[str]]:
+    """Get a list of strings satisfying func, a fixed number of them if given."""
+    if case_sensitive:
+        ask.talk("(Inputs are case sensitive.)")
+    responses: List[str] = []
+    if expected_len > 0:
+        ask.talk("(One per line.)")
+        while len(responses) < expected_len:
+            response = yield from _from_func(
+                func, case_sensitive=case_sensitive, options=options,
+            )
+            responses.append(response)
+    else:
+        ask.talk("(One per line. End inputs by hitting ENTER without giving input.)")
+        response = yield from _from_func(
+            func, case_sensitive=case_sensitive, allow_empty=True, options=options,
+        )
+        while response:
+            responses.append(response)
+            response = yield from _from_func(
+                func, case_sensitive=case_sensitive, allow_empty=True, options=options,
+            )
+    return responses
+
+
+def list_from_func(
+    func: Validator, *, case_sensitive: bool = False, expected_len: int = 0,
+) -> Asking[List[str]]:
+    """
+    Prompt the user to enter a list of strings
+    which when passed to func all return True.
+    """
+    return (yield from _list_from(
+        func, case_sensitive=case_sensitive, expected_len=expected_len,
+    ))
+
+
+def str_from_func(func: Validator, *, case_sensitive: bool = False) -> Asking[str]:
+    """Prompt the user to enter a string which when passed to func returns True."""
+    if case_sensitive:
+        ask.talk("(Inputs are case sensitive.)")
+    return (yield from _from_func(func, case_sensitive=case_sensitive))
+
+
+def list_from_set(
+    valid_strings: AbstractSet[str], *,
+    case_sensitive: bool = False,
+    print_options: bool = False,
+    expected_len: int = 0,
+) -> Asking[List[str]]:
+    """Prompt the user to enter a list of strings from valid_strings."""
+    if print_options:
+        ask.talk("Accepted options are:")
+        _print_set(valid_strings, case_sensitive=case_sensitive)
+    options, validator = _set_validator(valid_strings, case_sensitive)
+    return (yield from _list_from(
+        validator,
+        case_sensitive=case_sensitive,
+        expected_len=expected_len,
+        options=options,
+    ))
+
+
+def str_from_set(
+    valid_strings: AbstractSet[str], *,
+    case_sensitive: bool = False,
+    print_options: bool = False,
+) -> Asking[str]:
+    """Prompt the user to enter a string from valid_strings."""
+    if print_options:
+        ask.talk("Accepted options are:")
+        _print_set(valid_strings, case_sensitive=case_sensitive)
+    if case_sensitive:
+        ask.talk("(Inputs are case sensitive.)")
+    options, validator = _set_validator(valid_strings, case_sensitive)
+    return (yield from _from_func(
+        validator, case_sensitive=case_sensitive, options=options,
+    ))
+
+
+def list_from_regex(
+    input_pattern: Union[str, Pattern[str]], *,
+    case_sensitive: bool = False,
+    expected_len: int = 0,
+) -> Asking[List[str]]:
+    """Prompt the user to enter a list of strings which match the input pattern."""
+    return (yield from list_from_func(
+        regex_validator(input_pattern),
+        case_sensitive=case_sensitive,
+        expected_len=expected_len,
+    ))
+
+
+def str_from_regex(
+    input_pattern: Union[str, Pattern[str]], *, case_sensitive: bool = False,
+) -> Asking[str]:
+    """Prompt the user to enter a string which matches the input pattern."""
+    return (yield from str_from_func(
+        regex_validator(input_pattern),
+        case_sensitive=case_sensitive,
+    ))
+
+
+# more specific ask functions
+
+
+def positive_int() -> Asking[int]:
+    """Prompt the user to enter a positive integer (excluding 0)."""
+    answer = yield from str_from_regex(r"[1-9][0-9]*")
+    return int(answer)
@@ -0,0 +1,125 @@
+"""
+Index of every ModuleSolver subclass, by module ID and by name.
+
+Solvers are added as their classes are created. Looking up a module that
+isn't indexed yet imports the built-in solver modules, then any solvers
+installed under the "ktane.solvers" entry point group, before giving up.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, Final, Optional, Set, Tuple, Type
+
+if TYPE_CHECKING:
+    from ktane.directors import ModuleSolver
+
+__all__ = [
+    "ENTRY_POINT_GROUP",
+    "BUILTIN_MODULES",
+    "normalize",
+    "register",
+    "get",
+    "load_all",
+    "solvers",
+]
+
+ENTRY_POINT_GROUP: Final = "ktane.solvers"
+BUILTIN_MODULES: Final = (
+    "ktane.vanilla",
+    "ktane.mods.a_mods",
+    "ktane.mods.c_mods",
+    "ktane.mods.f_mods",
+    "ktane.mods.t_mods",
+    "ktane.mods.w_mods",
+)
+
+_by_id: Dict[str, Type["ModuleSolver"]] = {}
+_by_key: Dict[str, Type["ModuleSolver"]] = {}  # normalized IDs, names, and aliases
+_loaded_all = False
+
+
+def normalize(name: str) -> str:
+    """Reduce a module name to lowercase letters and digits, e.g. "whosonfirst"."""
+    return "".join(char for char in name.casefold() if char.isalnum())
+
+
+def _qualified_name(solver: Type["ModuleSolver"]) -> str:
+    return "{0}.{1}".format(solver.__module__, solver.__qualname__)
+
+
+def register(solver: Type["ModuleSolver"]) -> None:
+    """
+    Index a solver by its ID, name, and aliases. Solvers that are still abstract are
+    skipped. Raises ValueError if any of them already belong to a different solver.
+    """
+    # a subclass's abstract properties are only found after __init_subclass__ runs
+    module_id: object = solver.id
+    name: object = solver.name
+    if not isinstance(module_id, str) or not isinstance(name, str):
+        return  # name or id is still an abstract property
+    keys = {
+        normalize(alias) for alias in (module_id, name, *solver.aliases)
+    }
+    _check_unclaimed(solver, module_id, keys)
+    _by_id[module_id] = solver
+    for key in keys:
+        _by_key[key] = solver
+
+
+def _check_unclaimed(
+    solver: Type["ModuleSolver"], module_id: str, keys: Set[str],
+) -> None:
+    """Raise ValueError if the ID or any key already belongs to a different solver."""
+    claimed = [(module_id, _by_id.get(module_id))]
+    claimed.extend(
+        (normalized, _by_key.get(normalized)) for normalized in sorted(keys)
+    )
+    for key, existing in claimed:
+        # the same class made again, e.g. by reloading its module, replaces itself
+        if existing is not None and _qualified_name(existing) != _qualified_name(solver):
+            raise ValueError("{0} can't be registered as {1!r}, {2} already is".format(
+                _qualified_name(solver), key, _qualified_name(existing),
+            ))
+
+
+def _find(key: str) -> Optional[Type["ModuleSolver"]]:
+    solver = _by_id.get(key)
+    if solver is None:
+        solver = _by_key.get(normalize(key))
+    return solver
+
+
+def get(key: str) -> Type["ModuleSolver"]:
+    """
+    The solver for a module ID, or for a name or alias in any case or spacing.
+    Raises KeyError if no solver matches, even after loading every solver.
+    """
+    solver = _find(key)
+    if solver is None and not _loaded_all:
+        load_all()
+        solver = _find(key)
+    if solver is None:
+        raise KeyError(key)
+    return solver
+
+
+def load_all() -> None:
+    """Import every built-in solver module, and every solver entry point installed."""
+    # imported here, as importlib.metadata is slow to import
+    from importlib.metadata import entry_points  # noqa: WPS433
+
+    # looked up here, as directors imports this module
+    solver_base = import_module("ktane.directors").ModuleSolver
+    for module_name in BUILTIN_MODULES:
+        import_module(module_name)
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        loaded = entry_point.load()  # a solver class, or a module of them
+        if isinstance(loaded, type) and issubclass(loaded, solver_base):
+            register(loaded)
+    global _loaded_all  # noqa: WPS420
+    _loaded_all = True  # noqa: WPS122, WPS442
+
+
+def solvers() -> Tuple[Type["ModuleSolver"], ...]:
+    """Every solver there is, in the order they were registered."""
+    load_all()
+    return tuple(_by_id.values())
@@ -1,9 +1,29 @@
-"""Utilities that can be used by ModuleSolvers for computing various things."""
+"""
+Utilities that can be used by ModuleSolvers for computing various things.
+Each is imported on first use, so solvers only pay for the ones they need.
+"""
 
-from ktane.solverutils import grid, maze, morse
+from importlib import import_module
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    from ktane.solverutils import grid, lexicon, maze, morse, serial  # noqa: F401
 
 __all__ = [
     "grid",
+    "lexicon",
     "maze",
     "morse",
+    "serial",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import a utility module the first time it is used."""
+    if name in __all__:
+        return import_module("{0}.{1}".format(__name__, name))
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))  # noqa: WPS421
@@ -3,11 +3,11 @@
 from string import ascii_lowercase
 from typing import NamedTuple
 
-from ktane import ask
+from ktane import ask, questions
 
 talk = ask.talk
 
-__all__ = ["Dimensions", "Coord", "ask_coord"]
+__all__ = ["Dimensions", "Coord", "ask_coord", "asking_coord"]
 
 
 class Dimensions(NamedTuple):
@@ -31,17 +31,22 @@ def ask_coord(*, alpha: bool = True) -> Coord:
     If alpha is set (the default), the expected form is like "A5",
     otherwise, row and column are asked separately.
     """
+    return ask.drive(asking_coord(alpha=alpha))
+
+
+def asking_coord(*, alpha: bool = True) -> questions.Asking[Coord]:
+    """The generator form of ask_coord."""
     col: int
     row: int
     if alpha:
         talk('(Submit a coordinate like "B4", where the letter is the column')
         talk("and the number is the row.)")
-        alpha_coord = ask.str_from_regex(r"[a-z][1-9][0-9]*")
+        alpha_coord = yield from questions.str_from_regex(r"[a-z][1-9][0-9]*")
         col = ascii_lowercase.index(alpha_coord[0]) + 1
         row = int(alpha_coord[1:])
     else:
         talk("Row number:")
-        row = ask.positive_int()
+        row = yield from questions.positive_int()
         talk("Column number:")
-        col = ask.positive_int()
+        col = yield from questions.positive_int()
     return Coord(row - 1, col - 1)
@@ -0,0 +1,187 @@
+"""Utilities for indexing and searching the word lists of word-based modules."""
+
+from math import log2
+from string import punctuation, whitespace
+from typing import Dict, Final, Iterable, List, Optional, Tuple
+
+__all__ = [
+    "DEFAULT_IGNORED",
+    "PositionIndex",
+    "letter_signature",
+    "AnagramIndex",
+    "PhraseIndex",
+]
+
+# Characters PhraseIndex leaves out of phrases unless told otherwise.
+DEFAULT_IGNORED: Final = whitespace + punctuation
+
+
+class PositionIndex:
+    """
+    Index of same-length words by the letter at each position.
+
+    Sets of candidate words are stored as ints, where bit i stands for
+    words[i], so narrowing down the candidates is a few ORs and one AND.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.words: Final = tuple(sorted(set(words)))
+        if not self.words:
+            raise ValueError("Cannot index an empty word list.")
+        self.length: Final = len(self.words[0])
+        if any(len(word) != self.length for word in self.words):
+            raise ValueError("All indexed words must be the same length.")
+        self.all_words: Final = (1 << len(self.words)) - 1
+        # _masks[position][letter] is the set of words with letter at position
+        self._masks: Tuple[Dict[str, int], ...] = tuple({} for _ in range(self.length))
+        for bit_index, word in enumerate(self.words):
+            for position, letter in enumerate(word):
+                masks = self._masks[position]
+                masks[letter] = masks.get(letter, 0) | (1 << bit_index)
+
+    def matching(self, candidates: int, position: int, letters: Iterable[str]) -> int:
+        """Narrow candidates to words with one of letters at position."""
+        allowed = 0
+        masks = self._masks[position]
+        for letter in letters:
+            allowed |= masks.get(letter, 0)
+        return candidates & allowed
+
+    def split_entropy(self, candidates: int, position: int) -> float:
+        """
+        How evenly the letter at position splits the candidates, in bits.
+        Higher means that learning the letters there narrows things down more.
+        """
+        total = candidates.bit_count()
+        entropy: float = 0
+        for mask in self._masks[position].values():
+            count = (candidates & mask).bit_count()
+            if count:
+                entropy -= count / total * log2(count / total)
+        return entropy
+
+    def best_position(self, candidates: int, positions: Iterable[int]) -> int:
+        """Of the given positions, the one that best splits the candidates."""
+        return max(
+            positions, key=lambda position: self.split_entropy(candidates, position),
+        )
+
+    def words_in(self, candidates: int) -> List[str]:
+        """List the words in a set of candidates."""
+        return [
+            word
+            for bit_index, word in enumerate(self.words)
+            if candidates >> bit_index & 1
+        ]
+
+
+def letter_signature(letters: str) -> str:
+    """The letters of a word in sorted order, the same for all its anagrams."""
+    return "".join(sorted(letters))
+
+
+class AnagramIndex:
+    """Index of words by the multiset of their letters, for unscrambling words."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        groups: Dict[str, List[str]] = {}
+        for word in sorted(set(words)):
+            groups.setdefault(letter_signature(word), []).append(word)
+        self._groups: Final = {
+            signature: tuple(group) for signature, group in groups.items()
+        }
+
+    def anagrams(self, letters: str) -> Tuple[str, ...]:
+        """All indexed words made of exactly these letters, in any order."""
+        return self._groups.get(letter_signature(letters), ())
+
+    def is_scramble(self, letters: str) -> bool:
+        """Whether these letters unscramble to at least one indexed word."""
+        return letter_signature(letters) in self._groups
+
+
+class _TrieNode:
+    """A node of a prefix tree over normalized phrases."""
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.phrase: Optional[str] = None  # the phrase ending exactly here, if any
+        self.phrase_count = 0  # how many phrases end here or below
+
+
+class PhraseIndex:
+    """
+    Index of phrases that can be looked up from a partially typed prefix.
+
+    Phrases are normalized by lowercasing them and removing the ignored
+    characters (by default whitespace and punctuation), so these don't need
+    to be typed exactly. Normalized phrases must all be distinct.
+    """
+
+    def __init__(
+        self, phrases: Iterable[str], *, ignored: str = DEFAULT_IGNORED,
+    ) -> None:
+        self._deletions: Final = str.maketrans("", "", ignored)
+        self._root: Final = _TrieNode()
+        for phrase in phrases:
+            self._insert(phrase)
+
+    def normalize(self, text: str) -> str:
+        """Reduce text to the form phrases are indexed by."""
+        return text.lower().translate(self._deletions)
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Whether any phrase starts with prefix, once both are normalized."""
+        return self.completion_count(prefix) > 0
+
+    def exact(self, text: str) -> Optional[str]:
+        """The phrase that text is a normalized form of, if any."""
+        node = self._find(text)
+        return None if node is None else node.phrase
+
+    def completions(self, prefix: str) -> List[str]:
+        """All phrases starting with prefix, once both are normalized."""
+        node = self._find(prefix)
+        found: List[str] = []
+        stack = [] if node is None else [node]
+        while stack:
+            node = stack.pop()
+            if node.phrase is not None:
+                found.append(node.phrase)
+            stack.extend(node.children.values())
+        return found
+
+    def completion_count(self, prefix: str) -> int:
+        """How many phrases start with prefix, once both are normalized."""
+        node = self._find(prefix)
+        return 0 if node is None else node.phrase_count
+
+    def resolve(self, prefix: str) -> Optional[str]:
+        """The phrase starting with prefix, if exactly one does."""
+        if self.completion_count(prefix) != 1:
+            return None
+        return self.completions(prefix)[0]
+
+    def _insert(self, phrase: str) -> None:
+        key = self.normalize(phrase)
+        path = [self._root]
+        for char in key:
+            path.append(path[-1].children.setdefault(char, _TrieNode()))
+        if path[-1].phrase is not None:
+            raise ValueError(
+                'Phrases "{0}" and "{1}" are the same once normalized.'.format(
+                    path[-1].phrase, phrase,
+                ),
+            )
+        path[-1].phrase = phrase
+        for node in path:
+            node.phrase_count += 1
+
+    def _find(self, prefix: str) -> Optional[_TrieNode]:
+        node = self._root
+        for char in self.normalize(prefix):
+            child = node.children.get(char)
+            if child is None:
+                return None
+            node = child
+        return node
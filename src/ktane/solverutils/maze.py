@@ -1,11 +1,36 @@
 """Utilities for processing, converting, and solving mazes of any type."""
 
 import heapq
-from typing import Dict, Iterator, List, Tuple
+from array import array
+from functools import lru_cache
+from typing import (  # noqa: WPS235
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from ktane.solverutils.grid import Coord, Dimensions
 
-__all__ = ["Node", "Wall", "solve_maze"]
+__all__ = [
+    "Node",
+    "Wall",
+    "BitMaze",
+    "GRID_DIRECTIONS",
+    "manhattan",
+    "no_heuristic",
+    "grid_neighbors",
+    "find_path",
+    "path_directions",
+    "solve_maze",
+    "solve_maze_cached",
+]
 
 # A maze is a set of nodes plus a set of walls (prohibited connections)
 # A node is simply a point in N-dimensional space (N-tuple)
@@ -30,6 +55,105 @@ class Wall(Coord):
     """
 
 
+class BitMaze:
+    """
+    Compact wall storage for large 2D square grid mazes.
+
+    Walls are packed into one integer bitmask per row: bit c of down_walls[r]
+    is set if there is a wall below node (r, c), and bit c of right_walls[r]
+    is set if there is a wall to its right.
+    """
+
+    def __init__(
+        self, size: Dimensions, down_walls: Sequence[int], right_walls: Sequence[int],
+    ) -> None:
+        if len(down_walls) != size.rows or len(right_walls) != size.rows:
+            raise ValueError("BitMaze needs one wall bitmask of each kind per row.")
+        self.size: Final = size
+        self.down_walls: Final = tuple(down_walls)
+        self.right_walls: Final = tuple(right_walls)
+
+    @classmethod
+    def from_walls(cls, size: Dimensions, walls: Iterable[Wall]) -> "BitMaze":
+        """Pack a collection of walls into a BitMaze."""
+        down_walls = [0 for _ in range(size.rows)]
+        right_walls = [0 for _ in range(size.rows)]
+        for wall in walls:
+            if wall.row % 2:  # horizontal wall below node (row // 2, col // 2)
+                down_walls[wall.row // 2] |= 1 << (wall.col // 2)
+            elif wall.col % 2:  # vertical wall right of node (row // 2, col // 2)
+                right_walls[wall.row // 2] |= 1 << (wall.col // 2)
+        return cls(size, down_walls, right_walls)
+
+    def solve(self, start: Node, goal: Node) -> List[str]:
+        """Breadth-first search from start to goal, with nodes numbered row-major."""
+        if not (_in_bounds(start, self.size) and _in_bounds(goal, self.size)):
+            return []
+        cols = self.size.cols
+        goal_cell = goal.row * cols + goal.col
+        # came_by[n] is the index of the direction moved in to first reach node n
+        came_by = bytearray((_UNREACHED,)) * (self.size.rows * cols)
+        start_cell = start.row * cols + start.col
+        came_by[start_cell] = 0
+        frontier = array("l", (start_cell,))
+        read_index = 0
+        while read_index < len(frontier):
+            cell = frontier[read_index]
+            read_index += 1
+            if cell == goal_cell:
+                return self._unwind_path(start_cell, goal_cell, came_by)
+            self._expand(cell, came_by, frontier)
+        return []  # no path found
+
+    def next_hops(self, goal: Node) -> Tuple[int, ...]:
+        """
+        For every node, numbered row-major, the index of the direction to move in
+        to get one step closer to goal, or -1 if goal can't be reached from it.
+        """
+        goal_cell = goal.row * self.size.cols + goal.col
+        # came_by[n] is the index of the direction moved in to first reach node n
+        came_by = bytearray((_UNREACHED,)) * (self.size.rows * self.size.cols)
+        came_by[goal_cell] = 0
+        frontier = array("l", (goal_cell,))
+        read_index = 0
+        while read_index < len(frontier):
+            self._expand(frontier[read_index], came_by, frontier)
+            read_index += 1
+        came_by[goal_cell] = _UNREACHED
+        # the way back is the opposite direction: Up/Down and Left/Right pair up
+        return tuple(_NO_HOP if way == _UNREACHED else way ^ 1 for way in came_by)
+
+    def _expand(self, cell: int, came_by: bytearray, frontier: "array[int]") -> None:
+        """Add the unreached neighbors of a node to the frontier, noting the way in."""
+        cols = self.size.cols
+        row, col = divmod(cell, cols)
+        bit = 1 << col
+        moves = (
+            row > 0 and not self.down_walls[row - 1] & bit,  # up
+            row < self.size.rows - 1 and not self.down_walls[row] & bit,  # down
+            col > 0 and not self.right_walls[row] & (bit >> 1),  # left
+            col < cols - 1 and not self.right_walls[row] & bit,  # right
+        )
+        for direction, offset in enumerate((-cols, cols, -1, 1)):
+            if moves[direction] and came_by[cell + offset] == _UNREACHED:
+                came_by[cell + offset] = direction
+                frontier.append(cell + offset)
+
+    def _unwind_path(
+        self, start_cell: int, goal_cell: int, came_by: bytearray,
+    ) -> List[str]:
+        """Follow the directions nodes were reached by back from goal to start."""
+        offsets = _cell_offsets(self.size.cols)
+        directions: List[str] = []
+        cell = goal_cell
+        while cell != start_cell:
+            direction = came_by[cell]
+            directions.append(_DIRECTION_NAMES[direction])
+            cell -= offsets[direction]
+        directions.reverse()  # we unpacked the directions in reverse order
+        return directions
+
+
 def _neighbors(
     current: Node, size: Dimensions, walls: Tuple[Wall, ...],
 ) -> Iterator[Node]:
@@ -48,52 +172,257 @@ def _neighbors(
             yield Node(current.row, current.col + 1)
 
 
-def _get_direction(previous: Node, current: Node) -> str:
-    if previous.row > current.row and previous.col == current.col:  # up
-        return "Up"
-    if previous.row < current.row and previous.col == current.col:  # down
-        return "Down"
-    if previous.col > current.col and previous.row == current.row:  # left
-        return "Left"
-    if previous.col < current.col and previous.row == current.row:  # right
-        return "Right"
-    raise RuntimeError("Invalid maze solution direction produced.")
+# Generic search core. Points are N-tuples, and each move between
+# neighboring points costs 1, so these work for mazes of any shape.
+Point = Tuple[int, ...]
+NeighborFunc = Callable[[Point], Iterable[Point]]
+Heuristic = Callable[[Point, Point], int]
+# For each axis, the names of moving down and up along it
+DirectionNames = Tuple[Tuple[str, str], ...]
+
+GRID_DIRECTIONS: Final[DirectionNames] = (("Up", "Down"), ("Left", "Right"))
+
+
+def manhattan(point: Point, goal: Point) -> int:
+    """Manhattan distance, admissible for mazes with unit moves along one axis."""
+    return sum(abs(coord - goal_coord) for coord, goal_coord in zip(point, goal))
+
+
+def no_heuristic(point: Point, goal: Point) -> int:
+    """Zero heuristic, turning A* into plain Dijkstra."""
+    return 0
+
+
+def grid_neighbors(
+    shape: Point, blocked: Optional[Callable[[Point, Point], bool]] = None,
+) -> NeighborFunc:
+    """
+    Make a neighbor function for an N-dimensional grid of the given shape,
+    allowing unit moves along each axis unless blocked(point, neighbor) is True.
+    """
+    def neighbors(point: Point) -> Iterator[Point]:  # noqa: WPS430
+        for neighbor in _grid_steps(point, shape):
+            if blocked is None or not blocked(point, neighbor):
+                yield neighbor
+    return neighbors
+
+
+def _grid_steps(point: Point, shape: Point) -> Iterator[Point]:
+    """Every point one unit move from point, inside a grid of the given shape."""
+    for axis, axis_len in enumerate(shape):
+        coord = point[axis]
+        if coord > 0:
+            yield point[:axis] + (coord - 1,) + point[axis + 1:]
+        if coord < axis_len - 1:
+            yield point[:axis] + (coord + 1,) + point[axis + 1:]
+
+
+def find_path(
+    start: Point,
+    goal: Point,
+    neighbors: NeighborFunc,
+    *,
+    heuristic: Heuristic = manhattan,
+    bidirectional: bool = False,
+) -> List[Point]:
+    """
+    Find a shortest path from start to goal, including both ends.
+    Return an empty list if there is no path.
+
+    By default this is A* with the given heuristic, which must never
+    overestimate the remaining distance. With bidirectional set, it instead
+    searches outward from both ends at once (ignoring the heuristic),
+    which needs moves to be reversible.
+    """
+    if bidirectional:
+        return _bidirectional_search(start, goal, neighbors)
+    return _a_star(start, goal, neighbors, heuristic)
+
+
+def _a_star(
+    start: Point, goal: Point, neighbors: NeighborFunc, heuristic: Heuristic,
+) -> List[Point]:
+    # Entries are (estimated total distance, -distance so far, point).
+    # Among equal estimates, the point furthest along is expanded first.
+    unvisited: List[Tuple[int, int, Point]] = [(heuristic(start, goal), 0, start)]
+    distances: Dict[Point, int] = {start: 0}
+    # For point p, came_from[p] is the point immediately preceding it on
+    # the shortest path currently known, or None for the start.
+    came_from: Dict[Point, Optional[Point]] = {start: None}
+    while unvisited:
+        _, negative_distance, current = heapq.heappop(unvisited)
+        if current == goal:
+            path = _unwind_links(current, came_from)
+            path.reverse()  # we unpacked the points in reverse order
+            return path
+        if distances[current] < -negative_distance:
+            continue  # stale entry, a shorter way here was already expanded
+        new_distance = distances[current] + 1
+        for neighbor in neighbors(current):
+            if distances.get(neighbor, new_distance + 1) > new_distance:
+                distances[neighbor] = new_distance
+                came_from[neighbor] = current
+                heapq.heappush(
+                    unvisited,
+                    (new_distance + heuristic(neighbor, goal), -new_distance, neighbor),
+                )
+    return []  # no path found
+
+
+def _bidirectional_search(
+    start: Point, goal: Point, neighbors: NeighborFunc,
+) -> List[Point]:
+    """Breadth-first search from both ends, one whole level at a time."""
+    if start == goal:
+        return [start]
+    forward: Dict[Point, Optional[Point]] = {start: None}
+    backward: Dict[Point, Optional[Point]] = {goal: None}
+    forward_level, backward_level = [start], [goal]
+    while forward_level and backward_level:
+        # grow the smaller side, so the two searches stay balanced
+        if len(forward_level) <= len(backward_level):
+            forward_level, meeting = _expand_level(
+                forward_level, forward, backward, neighbors,
+            )
+        else:
+            backward_level, meeting = _expand_level(
+                backward_level, backward, forward, neighbors,
+            )
+        if meeting is not None:
+            path = _unwind_links(meeting, forward)
+            path.reverse()
+            path.extend(_unwind_links(meeting, backward)[1:])
+            return path
+    return []  # no path found
+
+
+def _expand_level(
+    level: List[Point],
+    links: Dict[Point, Optional[Point]],
+    other_links: Dict[Point, Optional[Point]],
+    neighbors: NeighborFunc,
+) -> Tuple[List[Point], Optional[Point]]:
+    """
+    Expand one level of a breadth-first search. Return the next level, and
+    the point where it met the other search, if it did.
+    """
+    next_level: List[Point] = []
+    for current in level:
+        for neighbor in neighbors(current):
+            if neighbor in links:
+                continue
+            links[neighbor] = current
+            if neighbor in other_links:
+                # every point of a level is equally far from this search's end,
+                # so the first meeting found completes a shortest path
+                return next_level, neighbor
+            next_level.append(neighbor)
+    return next_level, None
+
+
+def _unwind_links(point: Point, links: Dict[Point, Optional[Point]]) -> List[Point]:
+    """Follow links from point back to the end its search started at."""
+    path = [point]
+    link = links[point]
+    while link is not None:
+        path.append(link)
+        link = links[link]
+    return path
 
 
-def _unwind_path(current: Node, came_from: Dict[Node, Node]) -> List[str]:
+def path_directions(
+    path: Sequence[Point], names: DirectionNames = GRID_DIRECTIONS,
+) -> List[str]:
+    """Convert a path of points into the names of the moves between them."""
     directions: List[str] = []
-    while current in came_from:
-        previous = came_from[current]
-        directions.append(_get_direction(previous, current))
-        current = previous
-    directions.reverse()  # we unpacked the directions in reverse order
+    for previous, current in zip(path, path[1:]):
+        moved_axes = [
+            axis for axis, (old, new) in enumerate(zip(previous, current)) if old != new
+        ]
+        if len(moved_axes) != 1:
+            raise RuntimeError("Invalid maze solution direction produced.")
+        axis = moved_axes[0]
+        if abs(current[axis] - previous[axis]) != 1:
+            raise RuntimeError("Invalid maze solution direction produced.")
+        directions.append(names[axis][current[axis] > previous[axis]])
     return directions
 
 
 def solve_maze(
-    size: Dimensions, start: Node, goal: Node, walls: Tuple[Wall, ...],
+    size: Dimensions, start: Node, goal: Node, walls: Union[Tuple[Wall, ...], BitMaze],
 ) -> List[str]:
     """
     Solve a maze.
 
     Given maze dimensions, starting and ending points, and a list of walls,
     return a list of directions to move from the start to the end.
+    The walls may also be given as a BitMaze, which is much faster for large mazes.
     """
-    unvisited: List[Tuple[int, Node]] = []
-    distances: Dict[Node, int] = {}
-    # For node n, came_from[n] is the node immediately preceding it on
-    # the shortest path currently known.
-    came_from: Dict[Node, Node] = {}
-    distances[start] = 0
-    heapq.heappush(unvisited, (0, start))
-    while unvisited:  # Dijkstra's algorithm
-        distance, current = heapq.heappop(unvisited)
-        if current == goal:
-            return _unwind_path(current, came_from)
-        new_distance = distance + 1
-        for neighbor in _neighbors(current, size, walls):
-            if neighbor not in distances or distances[neighbor] > new_distance:
-                distances[neighbor] = new_distance
-                heapq.heappush(unvisited, (new_distance, neighbor))
-                came_from[neighbor] = current
-    return []  # no path found
+    if isinstance(walls, BitMaze):
+        return walls.solve(start, goal)
+    wall_tuple = walls
+    path = find_path(
+        start, goal, lambda point: _neighbors(Node(*point), size, wall_tuple),
+    )
+    return path_directions(path)
+
+
+# Directions in the order _neighbors generates them, and the matching unit moves.
+_DIRECTION_NAMES: Final = ("Up", "Down", "Left", "Right")
+_DIRECTION_MOVES: Final = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_NO_HOP: Final = -1
+_UNREACHED: Final = 0xFF  # in BitMaze.solve, for nodes not reached yet
+
+# For each goal cell, for each cell, the index of the direction to move in
+# to get one step closer to that goal (or _NO_HOP). Cells are numbered row-major.
+NextHopTable = Tuple[Tuple[int, ...], ...]
+
+
+def _in_bounds(node: Node, size: Dimensions) -> bool:
+    return 0 <= node.row < size.rows and 0 <= node.col < size.cols
+
+
+@lru_cache(maxsize=None)
+def _cell_offsets(cols: int) -> Tuple[int, ...]:
+    """How far each direction moves in row-major cell numbers, for a row length."""
+    return tuple(row * cols + col for row, col in _DIRECTION_MOVES)
+
+
+@lru_cache(maxsize=None)
+def _next_hop_table(bit_maze: BitMaze) -> NextHopTable:
+    """
+    Build (once per maze) the next step from every cell to every goal.
+    BitMazes hash by identity, so looking up a table never reads the walls.
+    """
+    return tuple(
+        bit_maze.next_hops(Node(row, col))
+        for row in range(bit_maze.size.rows)
+        for col in range(bit_maze.size.cols)
+    )
+
+
+def solve_maze_cached(
+    size: Dimensions, start: Node, goal: Node, walls: BitMaze,
+) -> List[str]:
+    """
+    Solve a maze using a table of shortest paths built on first use.
+
+    Takes the same arguments as solve_maze, with the walls as a BitMaze, and is
+    meant for small fixed mazes that are solved many times: keep one BitMaze
+    per maze, as the table is looked up by which BitMaze it is. After the first
+    call for a given maze, each solve is a walk along the path with no searching.
+    """
+    if not (_in_bounds(start, size) and _in_bounds(goal, size)):
+        return []
+    hops = _next_hop_table(walls)[goal.row * size.cols + goal.col]
+    offsets = _cell_offsets(size.cols)
+    cell = start.row * size.cols + start.col
+    goal_cell = goal.row * size.cols + goal.col
+    directions: List[str] = []
+    while cell != goal_cell:
+        hop = hops[cell]
+        if hop == _NO_HOP:
+            return []  # no path found
+        directions.append(_DIRECTION_NAMES[hop])
+        cell += offsets[hop]
+    return directions
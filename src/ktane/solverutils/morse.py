@@ -1,11 +1,18 @@
 """Utilities for asking for and processing Morse Code signals."""
 
 from types import MappingProxyType
-from typing import Final
+from typing import Final, Iterable, Optional, Tuple
 
-from ktane import ask
+from ktane import ask, questions
 
-__all__ = ["valid_morse", "decode", "ask_word"]
+__all__ = [
+    "valid_morse",
+    "decode",
+    "ask_word",
+    "asking_word",
+    "TimingDecoder",
+    "decode_timings",
+]
 
 MORSE_ALPHABET: Final = MappingProxyType({
     "a": ".-",
@@ -65,5 +72,149 @@ def decode(code: str) -> str:
 
 def ask_word() -> str:
     """Get a Morse code string from the user and convert it to a word."""
-    code = ask.str_from_func(valid_morse)
+    return ask.drive(asking_word())
+
+
+def asking_word() -> questions.Asking[str]:
+    """The generator form of ask_word."""
+    code = yield from questions.str_from_func(valid_morse)
     return decode(code)
+
+
+# Durations in the signal, measured in units (the length of one dot).
+# Anything shorter than a limit is rounded down to the shorter element.
+_DASH_LIMIT: Final = 2  # dots are 1 unit and dashes are 3
+_LETTER_GAP_LIMIT: Final = 2  # gaps inside letters are 1 unit, between letters 3
+_WORD_GAP_LIMIT: Final = 5  # gaps between words (or repeats) are 7
+# How far each newly measured element moves the unit estimate.
+_UNIT_ADAPT_RATE: Final = 0.2
+
+
+class TimingDecoder:
+    """
+    Decodes a live Morse code signal from how long it stays on and off,
+    narrowing a list of possible words down as each dot and dash arrives.
+
+    The unit length is learned from the signal as it goes, so the signal
+    needs no particular speed, and may drift. Unless synced is set, the
+    decoder assumes it started listening partway through a word, and ignores
+    everything before the first gap between words. Only the current letter
+    and the remaining words are stored, so it can listen indefinitely.
+    """
+
+    def __init__(
+        self, words: Iterable[str], *, unit: Optional[float] = None, synced: bool = False,
+    ) -> None:
+        self.words: Final = tuple(word.lower() for word in words)
+        self.candidates: Tuple[str, ...] = self.words
+        self.unit = unit
+        self.synced = synced
+        self._letter_index = 0  # letters fully received in the current word
+        self._code = ""  # dots and dashes received so far in the current letter
+        self._pending_on: Optional[float] = None  # waiting for a gap to measure against
+
+    def feed(self, lit: bool, duration: float) -> Optional[str]:
+        """
+        Take the next stretch of the signal, either lit or unlit,
+        and return the word if it is now the only one that fits.
+        """
+        if lit:
+            if self._pending_on is not None:  # two lit stretches in a row
+                self._pending_on += duration
+            else:
+                self._pending_on = duration
+            return None
+        self._learn_unit(duration)
+        if self._pending_on is not None:
+            self._take_symbol(self._pending_on)
+            self._pending_on = None
+        self._take_gap(duration)
+        return self.word
+
+    @property
+    def word(self) -> Optional[str]:
+        """The word being signaled, once only one word fits."""
+        if self.synced and len(self.candidates) == 1:
+            return self.candidates[0]
+        return None
+
+    def _learn_unit(self, gap: float) -> None:
+        """Use the shortest element seen so far as the first guess of the unit."""
+        shortest = gap if self._pending_on is None else min(gap, self._pending_on)
+        if self.unit is None or shortest < self.unit / _DASH_LIMIT:
+            self.unit = shortest
+
+    def _units(self, duration: float, short: int, long: int, limit: int) -> int:
+        """Round duration to short or long units, and adapt the unit estimate."""
+        unit = self.unit or duration
+        units = short if duration < limit * unit else long
+        self.unit = unit + _UNIT_ADAPT_RATE * (duration / units - unit)
+        return units
+
+    def _take_symbol(self, duration: float) -> None:
+        symbol = "." if self._units(duration, 1, 3, _DASH_LIMIT) == 1 else "-"
+        if not self.synced:
+            return
+        self._code += symbol
+        index = self._letter_index
+        code = self._code
+        self._narrow(
+            word
+            for word in self.candidates
+            if len(word) > index and MORSE_ALPHABET[word[index]].startswith(code)
+        )
+
+    def _take_gap(self, duration: float) -> None:
+        if duration < _LETTER_GAP_LIMIT * (self.unit or duration):
+            self._units(duration, 1, 3, _LETTER_GAP_LIMIT)
+            return  # gap inside a letter
+        if duration >= _WORD_GAP_LIMIT * (self.unit or duration):
+            self._end_letter()
+            self._end_word()
+        else:
+            self._units(duration, 1, 3, _LETTER_GAP_LIMIT)
+            self._end_letter()
+
+    def _end_letter(self) -> None:
+        if not (self.synced and self._code):
+            return
+        index, code = self._letter_index, self._code
+        self._narrow(
+            word
+            for word in self.candidates
+            if len(word) > index and MORSE_ALPHABET[word[index]] == code
+        )
+        self._letter_index += 1
+        self._code = ""
+
+    def _end_word(self) -> None:
+        if self.synced:
+            index = self._letter_index
+            self._narrow(word for word in self.candidates if len(word) == index)
+        else:
+            self.synced = True  # the next word starts from its beginning
+        self._letter_index = 0
+        self._code = ""
+
+    def _narrow(self, candidates: Iterable[str]) -> None:
+        self.candidates = tuple(candidates)
+        if not self.candidates:  # misheard, so start over at the next word
+            self.candidates = self.words
+            self.synced = False
+            self._letter_index = 0
+            self._code = ""
+
+
+def decode_timings(
+    timings: Iterable[Tuple[bool, float]], words: Iterable[str],
+) -> Optional[str]:
+    """
+    Listen to a signal given as (lit, duration) pairs until only one of words
+    fits it, and return that word (or None if the signal ends first).
+    """
+    decoder = TimingDecoder(words)
+    for lit, duration in timings:
+        word = decoder.feed(lit, duration)
+        if word is not None:
+            return word
+    return None
@@ -0,0 +1,46 @@
+"""Utilities for analyzing the serial number on the bomb's edgework."""
+
+from string import ascii_lowercase, digits
+from typing import NamedTuple, Tuple
+
+__all__ = ["SerialInfo"]
+
+
+class SerialInfo(NamedTuple):
+    """
+    Facts about a serial number that solvers need, all worked out up front.
+    Facts that need a digit or letter to exist are falsy if there isn't one.
+    Only the ASCII digits 0-9 count as digits.
+    """
+
+    serial: str
+    digits: str
+    letters: str
+    digit_sum: int
+    # position of each letter in the alphabet, A being 1 (0 if not A-Z)
+    letter_positions: Tuple[int, ...]
+    first_digit: str
+    last_digit: str
+    first_letter: str
+    odd: bool  # whether the last digit is odd
+    vowel: bool  # whether any letter is a vowel
+
+    @classmethod
+    def from_serial(cls, serial: str) -> "SerialInfo":
+        """Analyze a serial number."""
+        serial_digits = "".join(char for char in serial if char in digits)
+        letters = "".join(char for char in serial if char.isalpha())
+        return cls(
+            serial=serial,
+            digits=serial_digits,
+            letters=letters,
+            digit_sum=sum(int(digit) for digit in serial_digits),
+            letter_positions=tuple(
+                ascii_lowercase.find(letter.lower()) + 1 for letter in letters
+            ),
+            first_digit=serial_digits[:1],
+            last_digit=serial_digits[-1:],
+            first_letter=letters[:1],
+            odd=serial_digits[-1:] in {"1", "3", "5", "7", "9"},
+            vowel=any(vowel in letters.lower() for vowel in "aeiou"),
+        )
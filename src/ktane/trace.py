@@ -0,0 +1,215 @@
+"""Optional timing spans for solving, exported in Chrome's trace event format."""
+
+import json
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from time import perf_counter_ns
+from typing import (
+    ContextManager,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+__all__ = [
+    "INPUT",
+    "COMPUTE",
+    "Span",
+    "Tracer",
+    "enable",
+    "disable",
+    "tracing",
+    "on_track",
+    "span",
+    "span_since",
+]
+
+INPUT: Final = "input"  # waiting on the expert to answer
+COMPUTE: Final = "compute"  # everything else
+
+SpanArg = Union[str, int, float, bool]
+
+_NULL_SPAN: Final = nullcontext()
+_US_PER_SECOND: Final = 1e6
+
+
+class Span(NamedTuple):
+    """One recorded span. Times are in microseconds since tracing started."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: int  # the track set with on_track, or else the thread it ran on
+    args: Dict[str, SpanArg]
+
+    def to_event(self, pid: int) -> Dict[str, object]:
+        """This span as a Chrome trace complete event."""
+        return {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": self.start,
+            "dur": self.duration,
+            "pid": pid,
+            "tid": self.thread,
+            "args": self.args,
+        }
+
+
+class Tracer:
+    """
+    Records nested wall-clock spans as Chrome trace events.
+    Load the exported JSON in chrome://tracing or https://ui.perfetto.dev.
+    """
+
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+        self._start_ns: Final = perf_counter_ns()
+        self._pid: Final = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, category: str, args: Dict[str, SpanArg]) -> Iterator[None]:
+        """Record the time spent inside a with block."""
+        start_ns = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, category, start_ns, args)
+
+    def add(
+        self, name: str, category: str, start_ns: int, args: Dict[str, SpanArg],
+    ) -> None:
+        """Record a span from start_ns, a perf_counter_ns() time, until now."""
+        end_ns = perf_counter_ns()
+        self.spans.append(Span(
+            name,
+            category,
+            (start_ns - self._start_ns) / 1000,
+            (end_ns - start_ns) / 1000,
+            threading.get_ident() if _track is None else _track,
+            args,
+        ))
+
+    def totals(self) -> Dict[str, float]:
+        """
+        Seconds spent waiting on input, and computing, across all recorded spans.
+        Compute time is the time covered by top-level spans, less the input time.
+        """
+        input_us = sum(
+            recorded.duration for recorded in self.spans if recorded.category == INPUT
+        )
+        covered_us = _covered_time(self.spans)
+        return {
+            INPUT: input_us / _US_PER_SECOND,
+            COMPUTE: (covered_us - input_us) / _US_PER_SECOND,
+        }
+
+    def to_json(self) -> str:
+        """The recorded spans as a Chrome trace JSON document."""
+        events = [span.to_event(self._pid) for span in self.spans]
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+    def write(self, path: str) -> None:
+        """Write the recorded spans to a Chrome trace JSON file."""
+        with open(path, "w", encoding="utf-8") as trace_file:
+            trace_file.write(self.to_json())
+
+
+def _covered_time(spans: List[Span]) -> float:
+    """The microseconds covered by at least one of the spans."""
+    covered_us: float = 0
+    covered_until = float("-inf")
+    intervals = sorted(
+        (recorded.start, recorded.start + recorded.duration) for recorded in spans
+    )
+    for start, end in intervals:
+        if end > covered_until:
+            covered_us += end - max(start, covered_until)
+            covered_until = end
+    return covered_us
+
+
+_tracer: Optional[Tracer] = None
+_track: Optional[int] = None
+
+
+def enable(tracer: Optional[Tracer] = None) -> Tracer:
+    """Start recording spans, into a new Tracer unless one is given."""
+    if tracer is None:
+        tracer = Tracer()
+    global _tracer  # noqa: WPS420
+    _tracer = tracer  # noqa: WPS122, WPS442
+    return tracer
+
+
+def disable() -> None:
+    """Stop recording spans."""
+    global _tracer  # noqa: WPS420
+    _tracer = None  # noqa: WPS122, WPS442
+
+
+@contextmanager
+def tracing(path: Optional[str] = None) -> Iterator[Tracer]:
+    """
+    Record spans for the duration of a with block,
+    writing them to a Chrome trace JSON file at path afterwards if given.
+    """
+    previous_tracer = _tracer
+    tracer = enable()
+    try:
+        yield tracer
+    finally:
+        if previous_tracer is None:
+            disable()
+        else:
+            enable(previous_tracer)
+        if path is not None:
+            tracer.write(path)
+
+
+def _set_track(track: Optional[int]) -> None:
+    global _track  # noqa: WPS420
+    _track = track  # noqa: WPS122, WPS442
+
+
+@contextmanager
+def on_track(track: int) -> Iterator[None]:
+    """
+    Record spans that end inside a with block on the given track instead of
+    the thread's, so that generators stepped in turn on one thread, like
+    questions.Conversation, each get properly nested spans of their own.
+    """
+    previous_track = _track
+    _set_track(track)
+    try:
+        yield
+    finally:
+        _set_track(previous_track)
+
+
+def span(name: str, category: str = COMPUTE, **args: SpanArg) -> ContextManager[None]:
+    """
+    Time a with block as a span, if tracing is enabled.
+    When it isn't, this returns a shared do-nothing context manager.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(name, category, args)
+
+
+def span_since(
+    start_ns: int, name: str, category: str = COMPUTE, **args: SpanArg,
+) -> None:
+    """
+    Record a span from start_ns, a perf_counter_ns() time, until now, if tracing
+    is enabled. This is for spans that can't be a with block, like the wait for
+    the answer to a questions.Conversation's question.
+    """
+    if _tracer is not None:
+        _tracer.add(name, category, start_ns, args)
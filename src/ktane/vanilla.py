@@ -1,10 +1,12 @@
 """Solver scripts for all vanilla modules."""
 
-from typing import Counter, Dict, Final, List, NamedTuple, Tuple
+import re
+from types import MappingProxyType
+from typing import Counter, Dict, Final, Iterable, List, NamedTuple, Optional, Tuple
 
-from ktane import ask
-from ktane.directors import EdgeFlag, ModuleSolver, Port
-from ktane.solverutils import grid, maze, morse  # MorseCode, Maze
+from ktane import ask, questions
+from ktane.directors import BombSolver, EdgeFlag, Edgework, ModuleSolver, Port
+from ktane.solverutils import grid, lexicon, maze, morse  # MorseCode, Maze, Password
 
 __all__ = [
     "Wires",
@@ -28,12 +30,12 @@ class Wires(ModuleSolver):
     id: Final = "Wires"
     required_edgework: Final = (EdgeFlag.SERIAL,)
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What color wires are on the module, from top to bottom?")
         ask.talk(
             "Type R for red, Y for yellow, B for blue, W for white, and K for black.",
         )
-        wirelist = ask.str_from_regex(r"[rybwk]{3,6}").lower()
+        wirelist = (yield from questions.str_from_regex(r"[rybwk]{3,6}")).lower()
         wire: str
         if len(wirelist) == 3:
             if "r" not in wirelist:
@@ -82,36 +84,37 @@ class TheButton(ModuleSolver):
     name: Final = "The Button"
     id: Final = "BigButton"
     required_edgework: Final = (EdgeFlag.BATTERIES, EdgeFlag.INDICATORS)
+    aliases = ("Button",)
 
-    valid_colors: Final = {"red", "yellow", "blue", "white"}
-    valid_labels: Final = {"abort", "detonate", "hold", "press"}
+    valid_colors: Final = frozenset(("red", "yellow", "blue", "white"))
+    valid_labels: Final = frozenset(("abort", "detonate", "hold", "press"))
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What color is the button?")
         ask.talk('Type one of "red", "yellow", "blue", or "white", without quotes.')
-        color = ask.str_from_set(self.valid_colors)
+        color = yield from questions.str_from_set(self.valid_colors)
         ask.talk("What is the text on the label?")
         ask.talk('Type one of "abort", "detonate", "hold", or "press", without quotes.')
-        label = ask.str_from_set(self.valid_labels)
+        label = yield from questions.str_from_set(self.valid_labels)
         if color == "blue" and label == "abort":
-            self._hold()
+            yield from self._hold()
         elif self.bomb.batteries > 1 and label == "detonate":
             ask.talk("Press and immediately release the button.")
-        elif color == "white" and ("car", True) in self.bomb.indicators:
-            self._hold()
-        elif self.bomb.batteries > 2 and ("frk", True) in self.bomb.indicators:
+        elif color == "white" and self.bomb.has_indicator("car", lit=True):
+            yield from self._hold()
+        elif self.bomb.batteries > 2 and self.bomb.has_indicator("frk", lit=True):
             ask.talk("Press and immediately release the button.")
         elif color == "yellow":
-            self._hold()
+            yield from self._hold()
         elif color == "red" and label == "hold":
             ask.talk("Press and immediately release the button.")
         else:
-            self._hold()
+            yield from self._hold()
 
-    def _hold(self) -> None:
+    def _hold(self) -> questions.Asking[None]:
         ask.talk("Hold down the button. What color is the strip on the right?")
         ask.talk('Type one of "red", "yellow", "blue", or "white", without quotes.')
-        strip = ask.str_from_set(self.valid_colors)
+        strip = yield from questions.str_from_set(self.valid_colors)
         digit: int
         if strip == "blue":
             digit = 4
@@ -125,6 +128,15 @@ class TheButton(ModuleSolver):
         )
 
 
+def _symbol_columns(columns: Tuple[Tuple[str, ...], ...]) -> Dict[str, int]:
+    """Map each symbol to a bitmask of the columns it appears in."""
+    masks: Dict[str, int] = {}
+    for column_index, column in enumerate(columns):
+        for symbol in column:
+            masks[symbol] = masks.get(symbol, 0) | (1 << column_index)
+    return masks
+
+
 class Keypad(ModuleSolver):
     """Solver for vanilla Keypad."""
 
@@ -132,7 +144,7 @@ class Keypad(ModuleSolver):
     id: Final = "Keypad"
     required_edgework: Final = ()
 
-    valid_symbols: Final = {
+    valid_symbols: Final = frozenset((
         "copyright",
         "filled star",
         "hollow star",
@@ -160,8 +172,8 @@ class Keypad(ModuleSolver):
         "balloon",
         "upside down y",
         "bt",
-    }
-    columns: Final = {  # TODO: type hint this?
+    ))
+    columns: Final[Tuple[Tuple[str, ...], ...]] = (
         (
             "balloon",
             "at",
@@ -216,26 +228,41 @@ class Keypad(ModuleSolver):
             "n with hat",
             "omega",
         ),
-    }
-
-    def stage(self) -> None:
-        ask.talk("What symbols are on the keypad?")
-        symbols = ask.list_from_set(
-            self.valid_symbols, print_options=True, expected_len=4,
-        )
-        while all(any(sym not in col for sym in symbols) for col in self.columns):
-            ask.talk("I couldn't find a solution for those symbols.")
-            ask.talk("Please ensure you typed them correctly.")
-            ask.talk("What symbols are on the keypad?")
-            symbols = ask.list_from_set(
-                self.valid_symbols, print_options=True, expected_len=4,
+    )
+    # bit i of symbol_to_columns[symbol] is set if columns[i] contains symbol
+    symbol_to_columns: Final = _symbol_columns(columns)
+    all_columns: Final = (1 << len(columns)) - 1
+
+    def stage(self) -> questions.Asking[None]:
+        ask.talk("What symbols are on the keypad? (One per line.)")
+        symbols: List[str] = []
+        possible_columns = self.all_columns
+        # stop asking as soon as only one column fits
+        while possible_columns & (possible_columns - 1) or not symbols:
+            symbol = yield from questions.str_from_set(
+                self.valid_symbols, print_options=not symbols,
             )
-        for column in self.columns:
-            if all(sym in column for sym in symbols):
-                ask.talk("Press the keys in the following order:")
-                for symbol in column:
-                    if symbol in symbols:
-                        ask.talk(symbol.upper())
+            if symbol in symbols:
+                ask.talk("That symbol was already entered.")
+                continue
+            if not possible_columns & self.symbol_to_columns[symbol]:
+                ask.talk("I couldn't find a solution for those symbols.")
+                ask.talk("Please ensure you typed them correctly.")
+                ask.talk("What symbols are on the keypad? (One per line.)")
+                symbols = []
+                possible_columns = self.all_columns
+                continue
+            symbols.append(symbol)
+            possible_columns &= self.symbol_to_columns[symbol]
+        column = self.columns[possible_columns.bit_length() - 1]
+        if len(symbols) < 4:
+            ask.talk("Press the keys in this order, skipping any not on the keypad:")
+            symbols = list(column)
+        else:
+            ask.talk("Press the keys in the following order:")
+        for key in column:
+            if key in symbols:
+                ask.talk(key.upper())
 
 
 class SimonSays(ModuleSolver):
@@ -245,67 +272,115 @@ class SimonSays(ModuleSolver):
     id: Final = "Simon"
     required_edgework: Final = (EdgeFlag.SERIAL, EdgeFlag.STRIKES)
     total_stages = 5  # max number of stages
+    checkpoint_fields = ("color_sequence", "answers", "answers_key")
+
+    valid_colors: Final = frozenset(("red", "blue", "green", "yellow"))
+    letter_colors: Final = {"r": "red", "b": "blue", "g": "green", "y": "yellow"}
+    sequence_pattern: Final = re.compile("[rbgy]{{1,{0}}}".format(total_stages))
+    # simon_keys[serial has vowel, strikes up to 2][flashing color] is the one to press
+    simon_keys: Final = MappingProxyType({
+        (True, 0): MappingProxyType({
+            "red": "Blue", "blue": "Red", "green": "Yellow", "yellow": "Green",
+        }),
+        (True, 1): MappingProxyType({
+            "red": "Yellow", "blue": "Green", "green": "Blue", "yellow": "Red",
+        }),
+        (True, 2): MappingProxyType({
+            "red": "Green", "blue": "Red", "green": "Yellow", "yellow": "Blue",
+        }),
+        (False, 0): MappingProxyType({
+            "red": "Blue", "blue": "Yellow", "green": "Green", "yellow": "Red",
+        }),
+        (False, 1): MappingProxyType({
+            "red": "Red", "blue": "Blue", "green": "Yellow", "yellow": "Green",
+        }),
+        (False, 2): MappingProxyType({
+            "red": "Yellow", "blue": "Green", "green": "Blue", "yellow": "Red",
+        }),
+    })
 
-    valid_colors: Final = {"red", "blue", "green", "yellow"}
     color_sequence: List[str]
+    answers: List[str]  # the color to press for each color in color_sequence
+    answers_key: Tuple[bool, int]  # the simon_keys entry answers were made from
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         if self.current_stage == 1:
             ask.talk("What color is flashing?")
         else:
             ask.talk("What color is now flashing at the end of the sequence?")
         ask.talk('Type one of "red", "blue", "green", or "yellow", without quotes.')
-        new_color = ask.str_from_set(self.valid_colors)
-        self.color_sequence.append(new_color)
-        if self.bomb.serial_vowel:
-            if self.bomb.strikes == 0:
-                simon_key = {
-                    "red": "Blue", "blue": "Red", "green": "Yellow", "yellow": "Green",
-                }
-            elif self.bomb.strikes == 1:
-                simon_key = {
-                    "red": "Yellow", "blue": "Green", "green": "Blue", "yellow": "Red",
-                }
-            else:
-                simon_key = {
-                    "red": "Green", "blue": "Red", "green": "Yellow", "yellow": "Blue",
-                }
+        ask.talk('Or type the whole sequence by first letters, like "rgb".')
+        response = yield from questions.str_from_func(self._valid_response)
+        if response in self.valid_colors:
+            self.color_sequence.append(response)
         else:
-            if self.bomb.strikes == 0:
-                simon_key = {
-                    "red": "Blue", "blue": "Yellow", "green": "Green", "yellow": "Red",
-                }
-            elif self.bomb.strikes == 1:
-                simon_key = {
-                    "red": "Red", "blue": "Blue", "green": "Yellow", "yellow": "Green",
-                }
-            else:
-                simon_key = {
-                    "red": "Yellow", "blue": "Green", "green": "Blue", "yellow": "Red",
-                }
+            sequence = [self.letter_colors[letter] for letter in response]
+            if sequence[:len(self.answers)] != self.color_sequence[:len(self.answers)]:
+                self.answers.clear()
+            self.color_sequence = sequence
+            self.current_stage = len(sequence)
+        self._update_answers()
         ask.talk("Press the following colors in order:")
-        for color in self.color_sequence:
-            ask.talk(simon_key[color])
+        for color in self.answers:
+            ask.talk(color)
 
     def custom_data_init(self) -> None:
         self.color_sequence = []
+        self.answers = []
+        self.answers_key = (False, -1)
 
     def custom_data_clear(self) -> None:
         self.color_sequence = []
+        self.answers = []
 
-    def solve(self) -> None:
+    def solving(self) -> questions.Asking[None]:
         self.announce()
         while self.do_stage():
-            self.stage()
-            self.check_strike()
+            yield from self.run_stage()
+            yield from self.check_strike()
+            self.bomb_solver.handle_stage()
             if self.current_stage >= 3:
-                if self.check_solve():
+                if (yield from self.check_solve()):
                     return
         self.reset_stages()
 
-    def on_this_struck(self) -> None:
-        super().on_this_struck()
-        self.color_sequence.pop()
+    def _valid_response(self, response: str) -> bool:
+        """
+        Whether a response is a color, or a whole sequence of first letters
+        at least as long as the stages reached so far.
+        """
+        if response in self.valid_colors:
+            return True
+        return (
+            self.sequence_pattern.fullmatch(response) is not None
+            and len(response) >= self.current_stage
+        )
+
+    def _update_answers(self) -> None:
+        """Bring answers up to date, redoing them all only if the key changed."""
+        key = (self.bomb.serial_vowel, min(self.bomb.strikes, 2))
+        if key != self.answers_key:
+            self.answers_key = key
+            self.answers.clear()
+        self.answers = self.answers[:len(self.color_sequence)]
+        simon_key = self.simon_keys[key]
+        self.answers.extend(
+            simon_key[color] for color in self.color_sequence[len(self.answers):]
+        )
+
+
+def _label_ranks(
+    label_to_buttons: Dict[str, Tuple[str, ...]],
+) -> Dict[str, Dict[str, int]]:
+    """
+    Map each key label to the rank of every label that could be the answer.
+    Lower ranks win, and the key label itself ranks after its whole list.
+    """
+    ranks: Dict[str, Dict[str, int]] = {}
+    for key_label, buttons in label_to_buttons.items():
+        ranks[key_label] = {button: rank for rank, button in enumerate(buttons)}
+        ranks[key_label][key_label] = len(buttons)
+    return ranks
 
 
 class WhosOnFirst(ModuleSolver):
@@ -316,7 +391,7 @@ class WhosOnFirst(ModuleSolver):
     required_edgework: Final = ()
     total_stages = 3
 
-    valid_displays: Final = {
+    valid_displays: Final = frozenset((
         "yes",
         "first",
         "display",
@@ -345,8 +420,8 @@ class WhosOnFirst(ModuleSolver):
         "see",
         "c",
         "cee",
-    }
-    valid_labels: Final = {
+    ))
+    valid_labels: Final = frozenset((
         "ready",
         "first",
         "no",
@@ -375,7 +450,7 @@ class WhosOnFirst(ModuleSolver):
         "hold",
         "sure",
         "like",
-    }
+    ))
     display_to_index: Final = {
         "yes": 2,
         "first": 1,
@@ -564,19 +639,38 @@ class WhosOnFirst(ModuleSolver):
             "you",
         ),
     }
+    # label_ranks[key_label][label] is label's place in the key label's list
+    label_ranks: Final = _label_ranks(label_to_buttons)
+    button_positions: Final = (
+        "top left",
+        "top right",
+        "middle left",
+        "middle right",
+        "bottom left",
+        "bottom right",
+    )
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         ask.talk('What text is on the display? (If there is no text, type "Empty".)')
-        display = ask.str_from_set(self.valid_displays)
-        ask.talk("What are the button labels, in reading order?")
-        labels = ask.list_from_set(self.valid_labels, expected_len=6)
+        display = yield from questions.str_from_set(self.valid_displays)
         label_index = self.display_to_index[display]
-        key_label = labels[label_index]
+        ask.talk(
+            "What is the label of the {0} button?".format(
+                self.button_positions[label_index],
+            ),
+        )
+        key_label = yield from questions.str_from_set(self.valid_labels)
+        ranks = self.label_ranks[key_label]
         answer_label = key_label
-        for button in self.label_to_buttons[key_label]:
-            if button in labels:
-                answer_label = button
+        for position_index, position in enumerate(self.button_positions):
+            if not ranks[answer_label]:  # nothing else can come first
                 break
+            if position_index == label_index:
+                continue
+            ask.talk("What is the label of the {0} button?".format(position))
+            label = yield from questions.str_from_set(self.valid_labels)
+            if ranks.get(label, len(ranks)) < ranks[answer_label]:
+                answer_label = label
         ask.talk("Press the button labeled {0}.".format(answer_label.upper()))
 
 
@@ -593,6 +687,7 @@ class Memory(ModuleSolver):
     required_edgework: Final = ()
     total_stages = 5
     reset_stages_on_strike = True
+    checkpoint_fields = ("presses",)
 
     presses: List[_MemoryStage]
 
@@ -602,15 +697,15 @@ class Memory(ModuleSolver):
     def custom_data_clear(self) -> None:
         self.presses = []
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What number is on the display?")
-        display = int(ask.str_from_regex(r"[1-4]"))
+        display = int((yield from questions.str_from_regex(r"[1-4]")))
         ask.talk("What numbers are on the buttons, in reading order?")
-        buttons = ask.str_from_regex(r"[1-4]{4}")
+        buttons = yield from questions.str_from_regex(r"[1-4]{4}")
         while any(char not in buttons for char in "1234"):
             ask.talk("There should be one of each number on the buttons.")
             ask.talk("What numbers are on the buttons, in reading order?")
-            buttons = ask.str_from_regex(r"[1-4]{4}")
+            buttons = yield from questions.str_from_regex(r"[1-4]{4}")
         stage: _MemoryStage
         if self.current_stage == 1:
             stage = self._stage_1(display, buttons)
@@ -702,13 +797,13 @@ class MorseCode(ModuleSolver):
         "beats": "600",
     }
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What Morse Code sequence is flashing?")
-        word = morse.ask_word()
+        word = yield from morse.asking_word()
         while word not in self.word_to_freq:
             ask.talk("That word isn't in my table.")
             ask.talk("What Morse Code sequence is flashing?")
-            word = morse.ask_word()
+            word = yield from morse.asking_word()
         ask.talk("Respond at frequency 3.{0} MHz.".format(self.word_to_freq[word]))
 
 
@@ -740,21 +835,37 @@ class ComplicatedWires(ModuleSolver):
         ),
     )
 
-    def stage(self) -> None:
+    # bits of a wire's code, so that its Venn diagram entry is table[code]
+    wire_bits: Final[Dict[str, int]] = {"r": 8, "b": 4, "s": 2, "l": 1}
+    wire_codes: Final = 1 << len(wire_bits)  # one per combination of bits
+
+    _cut_table: Optional[Tuple[bool, ...]]
+
+    def post_init(self, edgework: Edgework, bomb_solver: BombSolver) -> None:
+        super().post_init(edgework, bomb_solver)
+        self._cut_table = None  # compiled once the edgework is known
+
+    def stage(self) -> questions.Asking[None]:
         ask.talk("What wires are on the module?")
         ask.talk("For each wire, include its colors, any of (R)ed, (B)lue, or (W)hite,")
         ask.talk("whether the LED above it is (L)it, and whether a (S)tar is present.")
         ask.talk("Input each wire as a string of the parenthesized letters above.")
-        wirelist = ask.list_from_regex(r"[rbwls]+")
-        for wire in wirelist:
-            if self.cut(wire):
+        wirelist = yield from questions.list_from_regex(r"[rbwls]+")
+        for wire, cut in zip(wirelist, self.cut_panel(wirelist)):
+            if cut:
                 ask.talk("Cut wire {0}.".format(wire.upper()))
             else:
                 ask.talk("Do not cut wire {0}.".format(wire.upper()))
 
-    def cut(self, wire: str) -> bool:
-        """Determine whether a given wire must be cut."""
-        action = self.venn_diagram["r" in wire]["b" in wire]["s" in wire]["l" in wire]
+    def wire_code(self, wire: str) -> int:
+        """The 4-bit code of a wire: red, blue, star, and LED, high bit first."""
+        code = 0
+        for letter in wire:
+            code |= self.wire_bits.get(letter, 0)
+        return code
+
+    def action_result(self, action: str) -> bool:
+        """Determine whether a Venn diagram action letter means to cut."""
         if action == "C":
             return True
         if action == "D":
@@ -767,6 +878,27 @@ class ComplicatedWires(ModuleSolver):
             return self.bomb.batteries >= 2
         raise RuntimeError("Invalid Venn Diagram action letter")
 
+    @property
+    def cut_table(self) -> Tuple[bool, ...]:
+        """Whether to cut each wire, indexed by wire code, for this bomb's edgework."""
+        if self._cut_table is None:
+            self._cut_table = tuple(
+                self.action_result(
+                    self.venn_diagram[code >> 3][code >> 2 & 1][code >> 1 & 1][code & 1],
+                )
+                for code in range(self.wire_codes)
+            )
+        return self._cut_table
+
+    def cut(self, wire: str) -> bool:
+        """Determine whether a given wire must be cut."""
+        return self.cut_table[self.wire_code(wire)]
+
+    def cut_panel(self, wires: Iterable[str]) -> List[bool]:
+        """Determine whether each of a panel's wires must be cut."""
+        table = self.cut_table
+        return [table[self.wire_code(wire)] for wire in wires]
+
 
 class _SequenceWire(NamedTuple):
     color: str
@@ -780,6 +912,7 @@ class WireSequence(ModuleSolver):
     id: Final = "WireSequence"
     required_edgework: Final = ()
     total_stages = 4
+    checkpoint_fields = ("wire_counts", "last_stage_counts")
 
     cut_table: Final[Dict[str, Tuple[str, ...]]] = {
         "red": ("c", "b", "a", "ac", "b", "ac", "abc", "ab", "b"),
@@ -798,22 +931,19 @@ class WireSequence(ModuleSolver):
         self.wire_counts.clear()
         self.last_stage_counts.clear()
 
-    def on_this_struck(self) -> None:
-        self.last_stage_counts.clear()
-
-    def ask_wires(self) -> Tuple[_SequenceWire, ...]:
+    def ask_wires(self) -> questions.Asking[Tuple[_SequenceWire, ...]]:
         """Get a set of wires from the user."""
         ask.talk("What wires are on the panel, in order by their left plug?")
         ask.talk("Input their color followed by the letter")
         ask.talk('they\'re plugged into, like "red C".')
-        wirelist = ask.list_from_func(self._check_wire_text)
+        wirelist = yield from questions.list_from_func(self._check_wire_text)
         return tuple(_SequenceWire(*wire.split()) for wire in wirelist)
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         # canonize last_stage_counts before starting new stage
         self.wire_counts.update(self.last_stage_counts)
         self.last_stage_counts.clear()
-        wires = self.ask_wires()
+        wires = yield from self.ask_wires()
         for wire in wires:
             self.last_stage_counts[wire.color] += 1
             wire_count = self.wire_counts[wire.color] + self.last_stage_counts[wire.color]
@@ -1092,6 +1222,10 @@ class Maze(ModuleSolver):
             maze.Wall(10, 7),
         ),
     )
+    # one BitMaze per maze, for solve_maze_cached to find its path table by
+    bit_mazes: Final = tuple(
+        maze.BitMaze.from_walls(grid.Dimensions(6, 6), walls) for walls in mazes
+    )
     mark_to_maze: Dict[grid.Coord, Tuple[maze.Wall, ...]] = {
         grid.Coord(1, 0): mazes[0],
         grid.Coord(2, 5): mazes[0],
@@ -1113,22 +1247,22 @@ class Maze(ModuleSolver):
         grid.Coord(4, 0): mazes[8],
     }
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         while True:
             ask.talk("What coordinate contains the white light?")
-            start = maze.Node(*grid.ask_coord())
+            start = maze.Node(*(yield from grid.asking_coord()))
             ask.talk("What coordinate contains the red triangle?")
-            goal = maze.Node(*grid.ask_coord())
+            goal = maze.Node(*(yield from grid.asking_coord()))
             ask.talk("What coordinate contains a circular marking?")
             ask.talk("(You may use either one.)")
-            marking = grid.ask_coord()
+            marking = yield from grid.asking_coord()
             while marking not in self.mark_to_maze:
                 ask.talk("That doesn't fit any of the mazes.")
                 ask.talk("What coordinate contains a circular marking?")
                 ask.talk("(You may use either one.)")
-                marking = grid.ask_coord()
-            walls = self.mark_to_maze[marking]
-            path = maze.solve_maze(grid.Dimensions(6, 6), start, goal, walls)
+                marking = yield from grid.asking_coord()
+            bit_maze = self.bit_mazes[self.mazes.index(self.mark_to_maze[marking])]
+            path = maze.solve_maze_cached(bit_maze.size, start, goal, bit_maze)
             if not path:
                 ask.talk("Something went wrong and I couldn't find a path.")
                 continue
@@ -1145,7 +1279,7 @@ class Password(ModuleSolver):
     id: Final = "Password"
     required_edgework: Final = ()
 
-    valid_words: Final = {
+    valid_words: Final = frozenset((
         "about",
         "after",
         "again",
@@ -1181,26 +1315,30 @@ class Password(ModuleSolver):
         "world",
         "would",
         "write",
-    }
+    ))
+
+    word_index: Final = lexicon.PositionIndex(valid_words)
 
-    def stage(self) -> None:
+    def stage(self) -> questions.Asking[None]:
         while True:
-            possible_words: List[str] = list(self.valid_words)
-            for column_index in range(5):
+            candidates = self.word_index.all_words
+            columns_left = list(range(self.word_index.length))
+            while columns_left:
+                # ask about whichever column narrows the words down the most
+                column_index = self.word_index.best_position(candidates, columns_left)
+                columns_left.remove(column_index)
                 ask.talk("What letters are in column {0}?".format(column_index + 1))
-                letters = ask.str_from_regex(r"[a-z]{6}")
+                letters = yield from questions.str_from_regex(r"[a-z]{6}")
                 while len(set(letters)) != 6:  # all letters should be unique
                     ask.talk("There should be 6 unique letters in the column.")
                     ask.talk("What letters are in column {0}?".format(column_index + 1))
-                    letters = ask.str_from_regex(r"[a-z]{6}")
-                possible_words = [  # filter
-                    word for word in possible_words if word[column_index] in letters
-                ]
-                if len(possible_words) == 1:
-                    answer = possible_words[0].upper()
+                    letters = yield from questions.str_from_regex(r"[a-z]{6}")
+                candidates = self.word_index.matching(candidates, column_index, letters)
+                if candidates.bit_count() == 1:
+                    answer = self.word_index.words_in(candidates)[0].upper()
                     ask.talk('Enter the password "{0}".'.format(answer))
                     return
-                if not possible_words:
+                if not candidates:
                     break
             # no valid word or multiple valid words
             ask.talk("Something went wrong. Let's start over.")
@@ -1,7 +1,9 @@
 """Basic Hypothesis test suite for ktane.ask."""
 
+from re import fullmatch
+from string import ascii_lowercase
 from string import digits as digits_str
-from typing import Set
+from typing import FrozenSet, List, Set
 from unittest.mock import patch
 
 from hypothesis import assume, given
@@ -79,9 +81,46 @@ def test_positive_int(data_obj: st.DataObject) -> None:
             raise
 
 
+@given(st.lists(st.text(alphabet=ascii_lowercase, min_size=1)))
+def test_scripted_answers(answers: List[str]) -> None:
+    """Test that a scripted answer source replays its answers in order, then stops."""
+    with ask.answer_source(ask.scripted_answers(answers)):
+        for answer in answers:
+            assert ask.str_from_regex(r"[a-z]+") == answer
+        try:
+            ask.str_from_regex(r"[a-z]+")
+        except EOFError:
+            return
+    raise AssertionError("Scripted answers did not run out.")
+
+
+@given(st.frozensets(st.text()), st.text(), st.booleans())
+def test_set_validator(
+    valid_strings: FrozenSet[str], answer: str, case_sensitive: bool,
+) -> None:
+    """Test that set validators match set membership, and are made once per set."""
+    validator = ask.set_validator(valid_strings, case_sensitive=case_sensitive)
+    assert ask.set_validator(valid_strings, case_sensitive=case_sensitive) is validator
+    if not case_sensitive:
+        valid_strings = frozenset(string.lower() for string in valid_strings)
+        answer = answer.lower()
+    assert bool(validator(answer)) == (answer in valid_strings)
+
+
+@given(st.text(alphabet="ab1", max_size=6))
+def test_regex_validator(answer: str) -> None:
+    """Test that regex validators fully match, and are made once per pattern."""
+    validator = ask.regex_validator(r"[a-z]+[0-9]?")
+    assert ask.regex_validator(r"[a-z]+[0-9]?") is validator
+    assert bool(validator(answer)) == bool(fullmatch(r"[a-z]+[0-9]?", answer))
+
+
 if __name__ == "__main__":
     # TODO: pytest can suppress output i think
     ask.ENABLE_PRINTING = False  # type: ignore[misc] #disable printing for the test
     test_str_from_set()
     test_list_from_set()
     test_positive_int()
+    test_scripted_answers()
+    test_set_validator()
+    test_regex_validator()
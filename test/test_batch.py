@@ -0,0 +1,72 @@
+"""Basic Hypothesis test suite for ktane.batch."""
+
+from typing import Optional, Tuple
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane import batch
+
+from .strategies import serial_numbers
+
+_WORKERS = 2
+
+
+def _wires(
+    wires: str, serial: str, *, struck: bool = False, max_strikes: Optional[int] = None,
+) -> batch.BombSpec:
+    """A bomb with only a Wires module, struck or not once it's cut."""
+    answers = (wires, "y") if struck else (wires, "n", "y")
+    return batch.BombSpec(
+        modules=("Wires",), answers=answers, serial=serial, max_strikes=max_strikes,
+    )
+
+
+_SPECS = (
+    _wires("rrr", "ab1cd2"),
+    _wires("bybk", "ab1cd3"),
+    batch.BombSpec(modules=("Not a module",), answers=()),
+    _wires("rwyb", "ab1cd3", struck=True, max_strikes=1),
+    _wires("ykwbr", "xy9zz4"),
+)
+
+
+def _comparable(bomb_result: batch.BombResult) -> Tuple[object, ...]:
+    """Everything in a result that doesn't depend on timing."""
+    return (
+        bomb_result.spec_index,
+        bomb_result.outcome,
+        bomb_result.instructions,
+        bomb_result.strikes,
+        bomb_result.error,
+    )
+
+
+@given(serial_numbers(), st.from_regex(r"[rybwk]{3,6}", fullmatch=True))
+def test_solve_bomb(serial: str, wires: str) -> None:
+    """Test that ktane.batch.solve_bomb defuses a fully scripted bomb."""
+    spec = batch.BombSpec(
+        modules=("Wires",), answers=(wires, "n", "y"), serial=serial,
+    )
+    bomb_result = batch.solve_bomb(spec)
+    assert bomb_result.outcome == batch.DEFUSED
+    assert bomb_result.solves == 1
+    assert bomb_result.strikes == 0
+    assert bomb_result.instructions[-2].startswith("Cut the ")
+
+
+def test_solve_bombs() -> None:
+    """Test that ktane.batch.solve_bombs solves each bomb as solve_bomb would."""
+    expected = [
+        _comparable(batch.solve_bomb(spec, index)) for index, spec in enumerate(_SPECS)
+    ]
+    by_index = sorted(map(_comparable, batch.solve_bombs(_SPECS, max_workers=_WORKERS)))
+    assert by_index == expected
+    # with one bomb pending at a time, results can only come back in order
+    in_order = batch.solve_bombs(_SPECS, max_workers=_WORKERS, max_pending=1)
+    assert list(map(_comparable, in_order)) == expected
+
+
+if __name__ == "__main__":
+    test_solve_bomb()
+    test_solve_bombs()
@@ -1,14 +1,20 @@
 """Basic Hypothesis test suite for ktane.directors."""
 
-from typing import List
+import os
+import pickletools  # noqa: S403 # only walks checkpoints the test wrote itself
+from tempfile import TemporaryDirectory
+from typing import Callable, Deque, Final, List, Sequence, Tuple
 from unittest.mock import patch
 
+import pytest
 from hypothesis import HealthCheck, given, settings
 from hypothesis import strategies as st
 
-from ktane import directors
+from ktane import ask, directors, questions, vanilla
+from ktane.mods.t_mods import TurnTheKeys
 
 from .mocks import MockAsk, mock_talk
+from .strategies import indicator_lists, port_plate_lists
 
 
 @given(st.lists(st.sampled_from(directors.EdgeFlag)), st.data())
@@ -28,5 +34,284 @@ def test_edgework(edgeflags: List[directors.EdgeFlag], data_obj: st.DataObject)
     assert isinstance(edgework.serial_first_letter, str)
 
 
+def _check_indicator_counts(
+    edgework: directors.Edgework, indicators: directors.IndicatorList,
+) -> None:
+    """Check the indicator counts against a direct count of the indicators."""
+    assert edgework.indicator_count() == len(indicators)
+    for lit in (True, False):
+        expected = [label for label, is_lit in indicators if is_lit == lit]
+        assert edgework.indicator_count(lit) == len(expected)
+        assert all(edgework.has_indicator(label, lit) for label in expected)
+
+
+def _check_port_counts(
+    edgework: directors.Edgework, port_plates: directors.PortPlateList,
+) -> None:
+    """Check the port and plate counts against a direct count of the plates."""
+    ports = [port for plate in port_plates for port in plate]
+    assert edgework.port_count() == len(ports)
+    for port in directors.Port:
+        assert edgework.port_count(port) == ports.count(port)
+        assert edgework.has_port(port) == (port in ports)
+    shapes = [frozenset(plate) for plate in port_plates]
+    assert edgework.plate_count() == len(port_plates)
+    for shape in shapes + [frozenset()]:
+        assert edgework.plate_count(shape) == shapes.count(shape)
+
+
+@given(indicator_lists(), port_plate_lists(), port_plate_lists())
+def test_edgework_counts(
+    indicators: directors.IndicatorList,
+    port_plates: directors.PortPlateList,
+    old_plates: directors.PortPlateList,
+) -> None:
+    """Test that the edgework counts match a direct count of what was set."""
+    edgework = directors.Edgework()
+    edgework.post_init(indicators=(("old", True),), port_plates=old_plates)
+    edgework.indicators = indicators
+    edgework.port_plates = port_plates
+    _check_indicator_counts(edgework, indicators)
+    _check_port_counts(edgework, port_plates)
+
+
+def _no_stage(solver: directors.ModuleSolver) -> questions.Asking[None]:
+    """Ask nothing, as a stage of a module with nothing to do."""
+    yield from ()  # noqa: WPS353 # stages are generators
+
+
+def _solver(module_id: str, after: Tuple[str, ...]) -> directors.ModuleSolver:
+    """Return a module with nothing to do, or a Turn The Keys for the ID TTK."""
+    if module_id == "TTK":
+        return TurnTheKeys()
+    namespace = {
+        "name": module_id,
+        "id": module_id,
+        "required_edgework": (),
+        "solve_after": after,
+        "stage": _no_stage,
+    }
+    solver_class = type(module_id, (directors.ModuleSolver,), namespace, register=False)
+    return solver_class()  # type: ignore[no-any-return]
+
+
+def _pop_order(queue: directors.SolveQueue) -> List[str]:
+    """Pop every solver from the queue, finishing each, and return their IDs."""
+    order: List[str] = []
+    while queue:
+        solver = queue.pop()
+        order.append(str(solver.id))
+        queue.finish(solver)
+    return order
+
+
+@given(
+    st.permutations(range(8)), st.lists(st.tuples(st.integers(0, 7), st.integers(0, 7))),
+)
+def test_solve_queue(ranking: List[int], pairs: List[Tuple[int, int]]) -> None:
+    """Test that SolveQueue pops solvers in an order meeting every constraint."""
+    # only constrain lower-ranked modules to come first, so there are no cycles
+    edges = {(low, high) for low, high in pairs if ranking[low] < ranking[high]}
+    solvers = [
+        _solver(str(index), tuple(str(low) for low, high in edges if high == index))
+        for index in range(8)
+    ]
+    order = [int(module_id) for module_id in _pop_order(directors.SolveQueue(solvers))]
+    assert sorted(order) == list(range(8))
+    assert all(order.index(low) < order.index(high) for low, high in edges)
+    if not edges:
+        assert order == list(range(7, -1, -1))
+
+
+def test_solve_queue_cycle() -> None:
+    """Test that contradictory solve order constraints are rejected."""
+    with pytest.raises(ValueError):
+        directors.SolveQueue([_solver("a", ("b",)), _solver("b", ("a",))])
+
+
+def _resort_queue(
+    solver: directors.ModuleSolver, queue: Deque[directors.ModuleSolver],
+) -> Deque[directors.ModuleSolver]:
+    return queue
+
+
+def _blocking_solve(solver: directors.ModuleSolver) -> None:
+    """Solve without a solving generator, as solvers used to."""
+
+
+def test_resort_queue_rejected() -> None:
+    """Test that a solver still overriding the removed resort_queue hook is rejected."""
+    with pytest.raises(TypeError):
+        type(
+            "Resorting", (directors.ModuleSolver,), {"resort_queue": _resort_queue},
+            register=False,
+        )
+
+
+def test_blocking_solve_rejected() -> None:
+    """Test that a solver overriding solve without solving is rejected."""
+    with pytest.raises(TypeError):
+        type(
+            "Blocking", (directors.ModuleSolver,), {"solve": _blocking_solve},
+            register=False,
+        )
+
+
+@given(st.permutations(("Wires", "Keypad", "Maze", "Simon", "Blank", "TTK")))
+def test_turn_the_keys_order(module_ids: List[str]) -> None:
+    """Test that Turn The Keys comes after its required and before its banned solves."""
+    solvers = [_solver(module_id, ()) for module_id in module_ids]
+    order = _pop_order(directors.SolveQueue(solvers))
+    turn_the_keys = order.index(TurnTheKeys.id)
+    assert order.index("Wires") < turn_the_keys
+    assert order.index("Keypad") < turn_the_keys
+    assert order.index("Maze") > turn_the_keys
+    assert order.index("Simon") > turn_the_keys
+
+
+@given(st.lists(st.sampled_from(("Wires", "Keypad", "Maze", "TTK")), min_size=1))
+def test_empty_stages(module_ids: List[str]) -> None:
+    """Test that solvers whose stages ask nothing are solved too."""
+    solvers = [_solver(module_id, ()) for module_id in module_ids]
+    bomb = directors.BombSolver(*solvers)
+    output: List[str] = []
+    with ask.answer_source(ask.scripted_answers(("n", "y") * len(solvers))):
+        with ask.output_sink(output.append):
+            bomb.solve()
+    assert bomb.edgework.defused
+    assert output[-1] == "Bomb defused!"
+
+
+_SERIAL: Final = "ab1cd2"
+_CHECKPOINT_NAME: Final = "bomb.checkpoint"
+_MEMORY_STAGES: Final = 5
+# each Memory stage asks for the display, the buttons, and whether it struck
+_ANSWERS_PER_STAGE: Final = 3
+_MEMORY_BUTTONS: Final = "1234"
+_NO_STRIKE: Final = "n"
+_WIRES_ANSWERS: Final = ("y", "rrr", _NO_STRIKE, "y")
+_ANSWERS: Final = ("1", _MEMORY_BUTTONS, _NO_STRIKE) * _MEMORY_STAGES + _WIRES_ANSWERS
+
+
+def _new_bomb() -> directors.BombSolver:
+    """Return a bomb whose Memory stages are checkpointed before its Wires."""
+    return directors.BombSolver(vanilla.Wires(), vanilla.Memory())
+
+
+def _presses(answers: Sequence[str], run: Callable[[], object]) -> List[str]:
+    """Run with scripted answers, collecting each instruction to press something."""
+    output: List[str] = []
+    try:
+        with ask.answer_source(ask.scripted_answers(answers)):
+            with ask.output_sink(output.append):
+                run()
+    except EOFError:
+        pass  # noqa: WPS420 # the expert walked away partway through
+    return [line for line in output if line.startswith("Press")]
+
+
+@given(
+    st.lists(
+        st.sampled_from(_MEMORY_BUTTONS),
+        min_size=_MEMORY_STAGES,
+        max_size=_MEMORY_STAGES,
+    ),
+    st.integers(0, _MEMORY_STAGES * _ANSWERS_PER_STAGE - 1),
+)
+def test_resume(displays: List[str], crash_after: int) -> None:
+    """Test that a bomb resumed from a checkpoint carries on where it stopped."""
+    answers = [
+        answer
+        for display in displays
+        for answer in (display, _MEMORY_BUTTONS, _NO_STRIKE)
+    ]
+    answers.extend(_WIRES_ANSWERS)  # then solve Wires
+    # a stage is checkpointed once its strike question is answered
+    stages_done = crash_after // _ANSWERS_PER_STAGE
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, _CHECKPOINT_NAME)
+        presses = _presses(
+            answers[:crash_after],
+            lambda: _new_bomb().solve(serial=_SERIAL, checkpoint_path=path),
+        )[:stages_done]
+        presses.extend(
+            _presses(
+                answers[_ANSWERS_PER_STAGE * stages_done:],
+                lambda: directors.BombSolver.resume(path),
+            ),
+        )
+    assert presses == _presses(answers, lambda: _new_bomb().solve(serial=_SERIAL))
+
+
+def _progress(bomb: directors.BombSolver) -> Tuple[object, ...]:
+    """Everything about a bomb's progress that a checkpoint should restore."""
+    return (
+        bomb.edgework.strikes,
+        bomb.edgework.solves,
+        tuple((solver.solved_count, solver.current_stage) for solver in bomb.solvers),
+    )
+
+
+def _read_checkpoint(path: str) -> bytes:
+    """Return everything written to a checkpoint file."""
+    with open(path, "rb") as checkpoint_file:
+        return checkpoint_file.read()
+
+
+def _record_ends(path: str) -> List[int]:
+    """Return the byte offset of the end of each pickled record in a checkpoint."""
+    record_ends: List[int] = []
+    with open(path, "rb") as checkpoint_file:
+        size = os.fstat(checkpoint_file.fileno()).st_size
+        while checkpoint_file.tell() < size:
+            list(pickletools.genops(checkpoint_file))  # read to the end of the record
+            record_ends.append(checkpoint_file.tell())
+    return record_ends
+
+
+def _load_cut(path: str, written: bytes, cut: int) -> Tuple[object, ...]:
+    """Load a checkpoint file cut short at the given byte."""
+    with open(path, "wb") as checkpoint_file:
+        checkpoint_file.write(written[:cut])
+    return _progress(directors.BombSolver.load_checkpoint(path))
+
+
+def test_checkpoint() -> None:
+    """Test that a checkpoint restores all the progress made on the bomb."""
+    bomb = _new_bomb()
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, _CHECKPOINT_NAME)
+        _presses(_ANSWERS, lambda: bomb.solve(serial=_SERIAL, checkpoint_path=path))
+        assert _progress(directors.BombSolver.load_checkpoint(path)) == _progress(bomb)
+
+
+@given(st.data())
+def test_torn_checkpoint(data_obj: st.DataObject) -> None:
+    """Test that a checkpoint cut off partway through a record loads the ones before."""
+    with TemporaryDirectory() as directory:
+        path = os.path.join(directory, _CHECKPOINT_NAME)
+        _presses(
+            _ANSWERS, lambda: _new_bomb().solve(serial=_SERIAL, checkpoint_path=path),
+        )
+        written = _read_checkpoint(path)
+        cut = data_obj.draw(st.integers(0, len(written)))
+        complete = [end for end in _record_ends(path) if end <= cut]
+        if complete:
+            assert _load_cut(path, written, cut) == _load_cut(path, written, complete[-1])
+        else:
+            with pytest.raises(ValueError):
+                _load_cut(path, written, cut)
+
+
 if __name__ == "__main__":
     test_edgework()
+    test_edgework_counts()
+    test_solve_queue()
+    test_solve_queue_cycle()
+    test_resort_queue_rejected()
+    test_blocking_solve_rejected()
+    test_turn_the_keys_order()
+    test_empty_stages()
+    test_resume()
+    test_checkpoint()
+    test_torn_checkpoint()
@@ -0,0 +1,55 @@
+"""Tests that the ktane package imports solvers only when they are used."""
+
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+from typing import Final, List
+
+_VANILLA: Final = "ktane.vanilla"
+
+
+def _modules_after(code: str, prefix: str = "ktane") -> List[str]:
+    """The modules under prefix loaded by running some code in a fresh interpreter."""
+    code = "\n".join((
+        code,
+        "import json, sys",
+        "modules = [m for m in sys.modules if m.startswith({0!r})]".format(prefix),
+        "print(json.dumps(sorted(modules)))",
+    ))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, check=True, env=env, text=True,
+    ).stdout
+    return json.loads(output)  # type: ignore[no-any-return]
+
+
+def test_lazy_imports() -> None:
+    """Test that solver modules are imported on first use, and only then."""
+    assert _modules_after("import ktane") == [
+        "ktane",
+        "ktane.ask",
+        "ktane.directors",
+        "ktane.questions",
+        "ktane.registry",
+        "ktane.solverutils",
+        "ktane.solverutils.serial",
+        "ktane.trace",
+    ]
+    # importlib.metadata is slow to import, and only needed to load every solver
+    assert "importlib.metadata" not in _modules_after("import ktane", "importlib")
+    loaded = _modules_after("from ktane.mods.t_mods import TurnTheKeys")
+    assert "ktane.mods.t_mods" in loaded
+    assert "ktane.mods.c_mods" not in loaded
+    assert _VANILLA not in loaded
+    loaded = _modules_after("import ktane; ktane.vanilla.Wires")
+    assert _VANILLA in loaded
+    assert "ktane.mods" not in loaded
+    loaded = _modules_after("import ktane; ktane.module_pools.ALL_SOLVABLE")
+    assert set(loaded).issuperset({"ktane.mods.a_mods", "ktane.mods.w_mods", _VANILLA})
+    loaded = _modules_after("from ktane import registry; registry.get('crazy talk')")
+    assert set(loaded).issuperset({"ktane.mods.c_mods", _VANILLA})
+
+
+if __name__ == "__main__":
+    test_lazy_imports()
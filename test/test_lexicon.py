@@ -0,0 +1,68 @@
+"""Basic Hypothesis test suite for ktane.solverutils.lexicon."""
+
+from string import ascii_lowercase
+from typing import List, Set
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane.solverutils import lexicon
+
+
+@given(
+    st.sets(st.text(alphabet="abcdef", min_size=5, max_size=5), min_size=1),
+    st.lists(st.sets(st.sampled_from(ascii_lowercase)), min_size=5, max_size=5),
+)
+def test_position_index(words: Set[str], columns: List[Set[str]]) -> None:
+    """Test that lexicon.PositionIndex narrows words down like a plain filter."""
+    index = lexicon.PositionIndex(words)
+    candidates = index.all_words
+    expected = sorted(words)
+    for position, letters in enumerate(columns):
+        candidates = index.matching(candidates, position, letters)
+        expected = [word for word in expected if word[position] in letters]
+        assert index.words_in(candidates) == expected
+
+
+@given(
+    st.sets(st.text(alphabet="abcd", max_size=6)), st.text(alphabet="abcd", max_size=6),
+)
+def test_anagram_index(words: Set[str], letters: str) -> None:
+    """Test that lexicon.AnagramIndex finds exactly the anagrams of some letters."""
+    index = lexicon.AnagramIndex(words)
+    expected = sorted(word for word in words if sorted(word) == sorted(letters))
+    assert list(index.anagrams(letters)) == expected
+    assert index.is_scramble(letters) == bool(expected)
+
+
+def _without_ignored(text: str) -> str:
+    """Text as PhraseIndex sees it when told to ignore spaces and commas."""
+    return text.replace(" ", "").replace(",", "")
+
+
+@given(
+    st.sets(st.text(alphabet="ab ,.", max_size=6)), st.text(alphabet="ab ,.", max_size=4),
+)
+def test_phrase_index(phrases: Set[str], prefix: str) -> None:
+    """Test that lexicon.PhraseIndex completes prefixes like a plain search."""
+    normalized = {_without_ignored(phrase): phrase for phrase in phrases}
+    index = lexicon.PhraseIndex(normalized.values(), ignored=" ,")
+    expected = sorted(
+        phrase
+        for key, phrase in normalized.items()
+        if key.startswith(_without_ignored(prefix))
+    )
+    assert sorted(index.completions(prefix)) == expected
+    assert index.completion_count(prefix) == len(expected)
+    assert index.has_prefix(prefix) == bool(expected)
+    if len(expected) == 1:
+        assert index.resolve(prefix) == expected[0]
+    else:
+        assert index.resolve(prefix) is None
+    assert index.exact(prefix) == normalized.get(_without_ignored(prefix))
+
+
+if __name__ == "__main__":
+    test_position_index()
+    test_anagram_index()
+    test_phrase_index()
@@ -0,0 +1,68 @@
+"""Test suite for ktane.solverutils.maze."""
+
+from itertools import product
+from typing import FrozenSet, List, Tuple
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane.solverutils import grid, maze
+from ktane.vanilla import Maze
+
+_SIZE = grid.Dimensions(6, 6)
+_CELLS = tuple(maze.Node(row, col) for row, col in product(range(6), repeat=2))
+
+
+def test_cached_matches_search() -> None:
+    """Test that maze.solve_maze_cached agrees with maze.solve_maze on vanilla mazes."""
+    for walls, bit_maze in zip(Maze.mazes, Maze.bit_mazes):
+        for start, goal in product(_CELLS, _CELLS):
+            assert maze.solve_maze_cached(_SIZE, start, goal, bit_maze) == (
+                maze.solve_maze(_SIZE, start, goal, walls)
+            )
+
+
+def test_bit_maze_matches_tuple() -> None:
+    """Test that maze.solve_maze gives the same paths for BitMaze and tuple walls."""
+    for walls in Maze.mazes:
+        bit_maze = maze.BitMaze.from_walls(_SIZE, walls)
+        for start, goal in product(_CELLS, _CELLS):
+            assert maze.solve_maze(_SIZE, start, goal, bit_maze) == (
+                maze.solve_maze(_SIZE, start, goal, walls)
+            )
+
+
+def _is_connected(path: List[maze.Point], neighbors: maze.NeighborFunc) -> bool:
+    """Whether each point on path neighbors the one before it."""
+    return all(
+        point in set(neighbors(previous)) for previous, point in zip(path, path[1:])
+    )
+
+
+@given(
+    st.tuples(*(st.integers(min_value=1, max_value=5) for _ in range(3))),
+    st.frozensets(st.tuples(*(st.integers(min_value=0, max_value=4) for _ in range(3)))),
+)
+def test_find_path_3d(
+    shape: Tuple[int, int, int], blocked: FrozenSet[Tuple[int, int, int]],
+) -> None:
+    """Test that every maze.find_path mode finds equally short valid 3D paths."""
+    start, goal = (0, 0, 0), (shape[0] - 1, shape[1] - 1, shape[2] - 1)
+    neighbors = maze.grid_neighbors(
+        shape, lambda _, neighbor: neighbor in blocked - {start, goal},
+    )
+    paths = [
+        maze.find_path(start, goal, neighbors),
+        maze.find_path(start, goal, neighbors, heuristic=maze.no_heuristic),
+        maze.find_path(start, goal, neighbors, bidirectional=True),
+    ]
+    assert len({len(path) for path in paths}) == 1
+    for path in filter(None, paths):
+        assert (path[0], path[-1]) == (start, goal)
+        assert _is_connected(path, neighbors)
+
+
+if __name__ == "__main__":
+    test_cached_matches_search()
+    test_bit_maze_matches_tuple()
+    test_find_path_3d()
@@ -0,0 +1,56 @@
+"""Basic Hypothesis test suite for ktane.solverutils.morse."""
+
+from typing import List, Tuple
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane.solverutils import morse
+from ktane.vanilla import MorseCode
+
+# Units for dots, in any time unit, and how far each timing may stray from exact.
+_SHORTEST_UNIT = 0.05
+_LONGEST_UNIT = 2
+_MIN_JITTER = 0.9
+_MAX_JITTER = 1.1
+_MAX_START = 40  # how far into the signal listening starts
+_TIMINGS = 200  # how much of the signal is listened to
+
+
+def _signal(word: str, unit: float) -> List[Tuple[bool, float]]:
+    """The (lit, duration) timings of one repeat of a word, ending in a word gap."""
+    timings: List[Tuple[bool, float]] = []
+    for char in word:
+        for symbol in morse.MORSE_ALPHABET[char]:
+            timings.append((True, unit if symbol == "." else 3 * unit))
+            timings.append((False, unit))
+        timings[-1] = (False, 3 * unit)
+    timings[-1] = (False, 7 * unit)
+    return timings
+
+
+def _noisy(
+    signal: List[Tuple[bool, float]], jitter: List[float],
+) -> List[Tuple[bool, float]]:
+    return [(lit, duration * scale) for (lit, duration), scale in zip(signal, jitter)]
+
+
+@given(
+    st.sampled_from(sorted(MorseCode.word_to_freq)),
+    st.floats(min_value=_SHORTEST_UNIT, max_value=_LONGEST_UNIT),
+    st.integers(min_value=0, max_value=_MAX_START),
+    st.lists(
+        st.floats(min_value=_MIN_JITTER, max_value=_MAX_JITTER),
+        min_size=_TIMINGS,
+        max_size=_TIMINGS,
+    ),
+)
+def test_decode_timings(word: str, unit: float, start: int, jitter: List[float]) -> None:
+    """Test that morse.decode_timings hears the right word from a noisy signal."""
+    loop = _signal(word, unit)
+    signal = (loop * 3)[start % len(loop):]
+    assert morse.decode_timings(_noisy(signal, jitter), MorseCode.word_to_freq) == word
+
+
+if __name__ == "__main__":
+    test_decode_timings()
@@ -0,0 +1,107 @@
+"""Basic Hypothesis test suite for ktane.questions."""
+
+from functools import partial
+from typing import Final, Iterator, List, Sequence, Tuple
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane import ask, questions, vanilla
+from ktane.directors import BombSolver, Edgework
+
+_memory_stages = st.lists(
+    st.tuples(st.sampled_from("1234"), st.permutations("1234")),
+    min_size=5,
+    max_size=5,
+)
+
+
+_MemoryStages = List[Tuple[str, List[str]]]
+_AGAIN: Final = "Again?"
+_AGAIN_PROMPT: Final = "Again? (y/n) "  # how yes_no prompts with _AGAIN
+
+
+def _memory_answers(stages: _MemoryStages) -> List[str]:
+    """Every answer to solve Memory without a strike."""
+    answers = [
+        answer
+        for display, buttons in stages
+        for answer in (display, "".join(buttons), "n")
+    ]
+    return answers + ["y"]
+
+
+def _memory() -> vanilla.Memory:
+    solver = vanilla.Memory()
+    solver.post_init(Edgework(), BombSolver(solver))
+    return solver
+
+
+def _blocking_output(answers: List[str]) -> List[str]:
+    """Solve Memory with the answers, blocking, and return everything it said."""
+    output: List[str] = []
+    with ask.answer_source(ask.scripted_answers(answers)):
+        with ask.output_sink(output.append):
+            _memory().solve()
+    return output
+
+
+def _converse_in_turn(
+    conversations: Sequence[questions.Conversation],
+    all_answers: Sequence[List[str]],
+) -> List[List[str]]:
+    """Send each conversation its next answer in turn, and return what each said."""
+    outputs = [list(conversation.output) for conversation in conversations]
+    for answer_pair in zip(*all_answers):
+        for conversation, output, answer in zip(conversations, outputs, answer_pair):
+            assert conversation.question is not None
+            conversation.send(answer)
+            output.extend(conversation.output)
+    return outputs
+
+
+@given(_memory_stages, _memory_stages)
+def test_conversation(first_stages: _MemoryStages, second_stages: _MemoryStages) -> None:
+    """Test that two solvers stepped in turn in one thread say what they would alone."""
+    all_answers = (_memory_answers(first_stages), _memory_answers(second_stages))
+    solvers = (_memory(), _memory())
+    conversations = [questions.Conversation(solver.solving()) for solver in solvers]
+    outputs = _converse_in_turn(conversations, all_answers)
+    assert all(stepped.finished for stepped in conversations)
+    assert all(solver.all_solved for solver in solvers)
+    assert outputs == [_blocking_output(answers) for answers in all_answers]
+
+
+def _ask_again(times: int) -> questions.Asking[List[bool]]:
+    """Ask the same yes/no question the given number of times."""
+    replies: List[bool] = []
+    for _ in range(times):
+        replies.append((yield from questions.yes_no(_AGAIN)))
+    return replies
+
+
+def _answer_next(answers: Iterator[str], asked: List[str], prompt: str) -> str:
+    """Record the prompt asked, and answer with the next answer."""
+    asked.append(prompt)
+    return next(answers)
+
+
+@given(st.lists(st.sampled_from("yn"), min_size=1, max_size=6), st.data())
+def test_recorded_replayed(answers: List[str], data_obj: st.DataObject) -> None:
+    """Test that replayed answers skip their questions, and the rest are asked."""
+    expected = [answer == "y" for answer in answers]
+    record: List[str] = []
+    with ask.answer_source(ask.scripted_answers(answers)):
+        assert ask.drive(questions.recorded(_ask_again(len(answers)), record)) == expected
+    assert record == answers
+    replay_count = data_obj.draw(st.integers(0, len(answers)))
+    asked: List[str] = []
+    with ask.answer_source(partial(_answer_next, iter(answers[replay_count:]), asked)):
+        replay = questions.replayed(_ask_again(len(answers)), answers[:replay_count])
+        assert ask.drive(replay) == expected
+    assert tuple(asked) == (_AGAIN_PROMPT,) * (len(answers) - replay_count)
+
+
+if __name__ == "__main__":
+    test_conversation()
+    test_recorded_replayed()
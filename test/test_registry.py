@@ -0,0 +1,45 @@
+"""Basic Hypothesis test suite for ktane.registry."""
+
+from typing import Dict, Type
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane import module_pools, registry
+from ktane.directors import ModuleSolver
+from ktane.mods.t_mods import TurnTheKeys
+
+
+def _namespace(name: str) -> Dict[str, object]:
+    """The class namespace of a solver whose name and ID are both name."""
+    return {"name": name, "id": name, "required_edgework": ()}
+
+
+@given(st.sampled_from(module_pools.ALL_SOLVABLE), st.booleans())
+def test_lookup(solver: Type[ModuleSolver], upper: bool) -> None:
+    """Test that every solver is found by its ID, and by its name in any case."""
+    name = str(solver.name).upper() if upper else str(solver.name).lower()
+    assert registry.get(str(solver.id)) is solver
+    assert registry.get(name) is solver
+    assert registry.get(name.replace(" ", "")) is solver
+    assert solver in registry.solvers()
+
+
+def test_registration() -> None:
+    """Test aliases, unknown modules, and solvers that clash with registered ones."""
+    assert registry.get("ttk") is TurnTheKeys
+    with pytest.raises(KeyError):
+        registry.get("Not A Module")
+    clashing = dict(_namespace("Keys"), aliases=("TTK",))
+    with pytest.raises(ValueError, match="'ttk'"):
+        type("Keys", (ModuleSolver,), clashing)
+    with pytest.raises(KeyError):
+        registry.get("Keys")  # nothing is registered when any key clashes
+    unregistered = type("Maze", (ModuleSolver,), _namespace("Maze"), register=False)
+    assert registry.get("Maze") is not unregistered
+
+
+if __name__ == "__main__":
+    test_lookup()
+    test_registration()
@@ -0,0 +1,48 @@
+"""Basic Hypothesis test suite for ktane.solverutils.serial."""
+
+from string import ascii_lowercase, digits
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane.solverutils.serial import SerialInfo
+
+from .strategies import serial_numbers
+
+
+def test_serial_info() -> None:
+    """Test SerialInfo on a known serial, and on one with a non-ASCII digit."""
+    serial_info = SerialInfo.from_serial("ab1cd4")
+    assert serial_info.digits == "14"
+    assert serial_info.letters == "abcd"
+    assert serial_info.digit_sum == 5
+    assert serial_info.letter_positions == (1, 2, 3, 4)
+    assert serial_info.first_digit == "1"
+    assert serial_info.last_digit == "4"
+    assert serial_info.first_letter == "a"
+    assert not serial_info.odd
+    assert serial_info.vowel
+    serial_info = SerialInfo.from_serial("x²yz37")
+    assert serial_info.digits == "37"
+    assert serial_info.digit_sum == 10
+    assert serial_info.odd
+    assert not serial_info.vowel
+
+
+@given(st.one_of(serial_numbers(), st.text(max_size=8)))
+def test_any_serial(serial: str) -> None:
+    """Test that SerialInfo handles any text, counting only ASCII digits as digits."""
+    serial_info = SerialInfo.from_serial(serial)
+    assert serial_info.digits == "".join(char for char in serial if char in digits)
+    assert serial_info.digit_sum == sum(map(int, serial_info.digits))
+    assert serial_info.first_digit == serial_info.digits[:1]
+    assert serial_info.last_digit == serial_info.digits[-1:]
+    assert serial_info.odd == (serial_info.last_digit in {"1", "3", "5", "7", "9"})
+    positions = serial_info.letter_positions
+    assert all(0 <= position <= len(ascii_lowercase) for position in positions)
+    assert len(serial_info.letter_positions) == len(serial_info.letters)
+
+
+if __name__ == "__main__":
+    test_serial_info()
+    test_any_serial()
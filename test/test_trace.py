@@ -0,0 +1,136 @@
+"""Basic Hypothesis test suite for ktane.trace."""
+
+import json
+from time import sleep
+from typing import List, Sequence, Tuple
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane import ask, questions, trace, vanilla
+from ktane.directors import BombSolver
+
+_US_PER_SECOND = 1e6
+_MEMORY_STAGES = 5
+_THINK_SECONDS = 0.002  # how long the expert takes over each answer
+
+_displays = st.lists(
+    st.sampled_from("1234"), min_size=_MEMORY_STAGES, max_size=_MEMORY_STAGES,
+)
+
+
+def _memory_answers(displays: Sequence[str]) -> List[str]:
+    """Every answer to solve a Memory bomb without a strike."""
+    answers = [answer for display in displays for answer in (display, "1234", "n")]
+    return answers + ["y"]
+
+
+def _traced_bomb(answers: List[str]) -> trace.Tracer:
+    """Solve a Memory bomb with scripted answers, and return the tracer used."""
+    with trace.tracing() as tracer:
+        with ask.answer_source(ask.scripted_answers(answers)):
+            with ask.output_sink(lambda message: None):
+                BombSolver(vanilla.Memory()).solve()
+        return tracer
+
+
+def _end(recorded: trace.Span) -> float:
+    return recorded.start + recorded.duration
+
+
+def _within(inner: trace.Span, outer: trace.Span) -> bool:
+    """Whether one span lies entirely within another."""
+    return outer.start <= inner.start and _end(inner) <= _end(outer)
+
+
+@given(_displays)
+def test_tracing(displays: List[str]) -> None:
+    """Test that tracing a bomb records nested module, stage, and input spans."""
+    tracer = _traced_bomb(_memory_answers(displays))
+    names = [span.name for span in tracer.spans]
+    assert names[-2:] == ["Memory", "bomb"]
+    assert names.count("stage") == _MEMORY_STAGES
+    inputs = [span for span in tracer.spans if span.category == trace.INPUT]
+    assert len(inputs) == len(_memory_answers(displays))
+    assert inputs[0].args["question"] == "What number is on the display?"
+    bomb = tracer.spans[-1]
+    assert all(_within(span, bomb) for span in tracer.spans)
+    totals = tracer.totals()
+    assert totals[trace.INPUT] + totals[trace.COMPUTE] == pytest.approx(
+        bomb.duration / _US_PER_SECOND,
+    )
+    assert names == [
+        event["name"] for event in json.loads(tracer.to_json())["traceEvents"]
+    ]
+    assert trace.span("untraced") is trace.span("also untraced")
+
+
+def _nested(spans: List[trace.Span]) -> bool:
+    """Whether every two spans either nest or don't overlap at all."""
+    return all(
+        _end(first) <= second.start
+        or _end(second) <= first.start
+        or _within(second, first)
+        or _within(first, second)
+        for first in spans
+        for second in spans
+    )
+
+
+def _converse_in_turn(
+    answers: List[str],
+) -> Tuple[trace.Tracer, List[questions.Conversation]]:
+    """
+    Solve two Memory bombs in one thread, sending each answer to each in turn,
+    and return the tracer used and the conversations.
+    """
+    with trace.tracing() as tracer:
+        bombs = (BombSolver(vanilla.Memory()), BombSolver(vanilla.Memory()))
+        conversations = [questions.Conversation(bomb.solving()) for bomb in bombs]
+        for answer in answers:
+            for conversation in conversations:
+                conversation.send(answer)
+        return tracer, conversations
+
+
+def _track_spans(tracer: trace.Tracer, track: int) -> List[trace.Span]:
+    return [span for span in tracer.spans if span.thread == track]
+
+
+@given(_displays)
+def test_interleaved_tracing(displays: List[str]) -> None:
+    """Test that conversations stepped in turn each get their own nested spans."""
+    tracer, conversations = _converse_in_turn(_memory_answers(displays))
+    assert all(stepped.finished for stepped in conversations)
+    tracks = {span.thread for span in tracer.spans}
+    assert tracks == {id(stepped) for stepped in conversations}
+    for track in tracks:
+        spans = _track_spans(tracer, track)
+        assert [span.name for span in spans].count("stage") == _MEMORY_STAGES
+        assert _nested(spans)
+
+
+def _slow_conversation(answers: List[str]) -> trace.Tracer:
+    """Solve a Memory bomb as a conversation, taking a while over every answer."""
+    with trace.tracing() as tracer:
+        conversation = questions.Conversation(BombSolver(vanilla.Memory()).solving())
+        for answer in answers:
+            sleep(_THINK_SECONDS)
+            conversation.send(answer)
+        return tracer
+
+
+def test_conversation_input() -> None:
+    """Test that the time until a conversation's question is answered counts as input."""
+    answers = _memory_answers(("1",) * _MEMORY_STAGES)
+    totals = _slow_conversation(answers).totals()
+    think_seconds = _THINK_SECONDS * len(answers)
+    assert totals[trace.INPUT] >= think_seconds
+    assert totals[trace.COMPUTE] < think_seconds
+
+
+if __name__ == "__main__":
+    test_tracing()
+    test_interleaved_tracing()
+    test_conversation_input()
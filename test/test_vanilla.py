@@ -0,0 +1,276 @@
+"""Basic Hypothesis test suite for ktane.vanilla."""
+
+from functools import partial
+from itertools import chain, product, starmap
+from typing import Final, List, Tuple
+
+from hypothesis import given
+from hypothesis import strategies as st
+
+from ktane import ask, vanilla
+from ktane.directors import BombSolver, Edgework, Port, PortPlateList
+
+from .strategies import serial_numbers
+
+_WIRE_LETTERS: Final = "rbsl"  # red, blue, star and LED
+# every kind of wire, as a plain white one if it has none of the letters
+_WIRES: Final = tuple(
+    "".join(letters) or "w"
+    for letters in product(*(("", letter) for letter in _WIRE_LETTERS))
+)
+_SERIALS: Final = ("ab1cd3", "ab1cd4")
+_PORT_PLATES: Final = ((), ((Port.SERIAL,),), ((Port.PARALLEL,),))
+_MAX_BATTERIES: Final = 3
+
+
+def _venn_action(wire: str) -> str:
+    """The action letter for a wire, read straight from the Venn diagram."""
+    red, blue, star, led = (letter in wire for letter in _WIRE_LETTERS)
+    by_red = vanilla.ComplicatedWires.venn_diagram[red]
+    return by_red[blue][star][led]
+
+
+def _venn_cut(edgework: Edgework, wire: str) -> bool:
+    """Whether to cut a wire, read straight from the Venn diagram."""
+    return {
+        "C": True,
+        "D": False,
+        "S": edgework.serial[-1] in "02468",
+        "P": any(Port.PARALLEL in plate for plate in edgework.port_plates),
+        "B": edgework.batteries >= 2,
+    }[_venn_action(wire)]
+
+
+def _edgework(
+    serial: str, port_plates: PortPlateList, batteries: int,
+) -> Edgework:
+    """Return edgework with the given serial number, port plates and batteries."""
+    edgework = Edgework()
+    edgework.serial = serial
+    edgework.port_plates = port_plates
+    edgework.batteries = batteries
+    return edgework
+
+
+def test_complicated_wires() -> None:
+    """Test the compiled Complicated Wires table against every edgework and wire."""
+    all_edgework = product(_SERIALS, _PORT_PLATES, range(_MAX_BATTERIES + 1))
+    for edgework in starmap(_edgework, all_edgework):
+        solver = vanilla.ComplicatedWires()
+        solver.post_init(edgework, BombSolver(solver))
+        expected = [_venn_cut(edgework, wire) for wire in _WIRES]
+        assert solver.cut_panel(list(_WIRES)) == expected
+        # the white of a wire with other colors is ignored
+        assert expected == [solver.cut("{0}w".format(wire)) for wire in _WIRES]
+
+
+def _keypad_presses(symbols: List[str]) -> Tuple[int, List[str]]:
+    """
+    Run a Keypad stage, answering with symbols in order,
+    returning how many were asked for and the keys to press.
+    """
+    output: List[str] = []
+    answers = iter(symbols)
+    with ask.answer_source(lambda _: next(answers)):
+        with ask.output_sink(output.append):
+            ask.drive(vanilla.Keypad().stage())
+    asked = len(symbols) - len(list(answers))
+    press_index = [line.startswith("Press the keys") for line in output].index(True)
+    return asked, [key.lower() for key in output[press_index + 1:]]
+
+
+def _columns_fitting(symbols: List[str]) -> List[int]:
+    """For each count of symbols entered, how many columns have them all."""
+    return [
+        sum(
+            all(symbol in column for symbol in symbols[:count])
+            for column in vanilla.Keypad.columns
+        )
+        for count in range(1, len(symbols) + 1)
+    ]
+
+
+@given(st.data())
+def test_keypad(data_obj: st.DataObject) -> None:
+    """
+    Test that Keypad asks for symbols until only one column has them all,
+    then gives the keys in column order, or the whole column if it stopped early.
+    """
+    for column in vanilla.Keypad.columns:
+        symbols: List[str] = data_obj.draw(st.permutations(column))[:4]
+        fitting = _columns_fitting(symbols)
+        asked, presses = _keypad_presses(symbols)
+        # shared symbols need more input, and it stops once one column is left
+        assert fitting[asked - 1] == 1
+        assert all(fits > 1 for fits in fitting[:asked - 1])
+        if asked < 4:
+            assert presses == list(column)
+        else:
+            assert presses == [symbol for symbol in column if symbol in symbols]
+
+
+def _expected_press(display: str, labels: List[str]) -> str:
+    """The label to press, found by going down the key label's whole list."""
+    key_label = labels[vanilla.WhosOnFirst.display_to_index[display]]
+    buttons = vanilla.WhosOnFirst.label_to_buttons[key_label]
+    return next((button for button in buttons if button in labels), key_label)
+
+
+def _read_panel(display: str, labels: List[str], output: List[str], prompt: str) -> str:
+    """Answer the last question asked, about the display or a button's label."""
+    question = [line for line in output if line.startswith("What")][-1]
+    if "display" in question:
+        return display
+    position = question.split(" of the ")[1].split(" button")[0]
+    return labels[vanilla.WhosOnFirst.button_positions.index(position)]
+
+
+@given(
+    st.sampled_from(sorted(vanilla.WhosOnFirst.valid_displays)),
+    st.permutations(sorted(vanilla.WhosOnFirst.valid_labels)),
+)
+def test_whos_on_first(display: str, all_labels: List[str]) -> None:
+    """Test that Who's on First gives the same answer as the full label list would."""
+    labels = all_labels[:6]
+    output: List[str] = []
+    with ask.answer_source(partial(_read_panel, display, labels, output)):
+        with ask.output_sink(output.append):
+            ask.drive(vanilla.WhosOnFirst().stage())
+    expected = _expected_press(display, labels)
+    assert output[-1] == "Press the button labeled {0}.".format(expected.upper())
+
+
+_simon_sequences = st.lists(
+    st.sampled_from(sorted(vanilla.SimonSays.valid_colors)), min_size=2, max_size=5,
+)
+
+
+def _simon_stage(solver: vanilla.SimonSays, response: str) -> List[str]:
+    """Run a Simon Says stage with one response, returning the colors to press."""
+    output: List[str] = []
+    with ask.answer_source(lambda _: response):
+        with ask.output_sink(output.append):
+            solver.do_stage()
+            ask.drive(solver.stage())
+    return output[output.index("Press the following colors in order:") + 1:]
+
+
+def _simon_solver(serial: str, flashes: List[str]) -> vanilla.SimonSays:
+    """Return a Simon Says solver that has had a stage for each color flashed."""
+    edgework = Edgework()
+    edgework.serial = serial
+    solver = vanilla.SimonSays()
+    solver.post_init(edgework, BombSolver(solver))
+    for flash in flashes:
+        _simon_stage(solver, flash)
+    return solver
+
+
+def _first_letters(colors: List[str]) -> str:
+    """The whole sequence typed by first letters."""
+    return "".join(color[0] for color in colors)
+
+
+@given(serial_numbers(), _simon_sequences, st.integers(0, 3))
+def test_simon_says(serial: str, colors: List[str], strikes: int) -> None:
+    """Test that Simon Says answers the same when the sequence is typed whole."""
+    one_by_one = _simon_solver(serial, colors[:-1])
+    one_by_one.bomb.strikes = strikes  # the answers so far must be redone
+    answers = _simon_stage(one_by_one, colors[-1])
+    key = (one_by_one.bomb.serial_vowel, min(strikes, 2))
+    simon_key = vanilla.SimonSays.simon_keys[key]
+    assert answers == [simon_key[flash] for flash in colors]
+    whole = _simon_solver(serial, [])
+    whole.bomb.strikes = strikes
+    assert _simon_stage(whole, _first_letters(colors)) == answers
+    assert whole.current_stage == len(colors)
+
+
+@given(serial_numbers(), _simon_sequences, st.data())
+def test_simon_says_short_sequence(
+    serial: str, colors: List[str], data_obj: st.DataObject,
+) -> None:
+    """Test that Simon Says refuses a whole sequence shorter than the stages so far."""
+    solver = _simon_solver(serial, colors[:-1])
+    letters = _first_letters(colors)
+    short = letters[:data_obj.draw(st.integers(1, len(colors) - 1))]
+    output: List[str] = []
+    with ask.answer_source(ask.scripted_answers([short, letters])):
+        with ask.output_sink(output.append):
+            solver.do_stage()
+            ask.drive(solver.stage())
+    assert any("is not a valid answer" in line for line in output)
+    assert solver.current_stage == len(colors)
+    assert solver.color_sequence == colors
+
+
+_ANSWER_NO: Final = "n"
+_ANSWER_YES: Final = "y"
+_MemoryStages = List[Tuple[str, List[str]]]
+
+
+def _memory_presses(answers: List[str]) -> List[str]:
+    """Solve Memory with scripted answers, returning what to press at each stage."""
+    solver = vanilla.Memory()
+    solver.post_init(Edgework(), BombSolver(solver))
+    output: List[str] = []
+    with ask.answer_source(ask.scripted_answers(answers)):
+        with ask.output_sink(output.append):
+            solver.solve()
+    assert solver.all_solved
+    return [line for line in output if line.startswith("Press")]
+
+
+@given(
+    st.lists(
+        st.tuples(st.sampled_from("1234"), st.permutations("1234")),
+        min_size=5,
+        max_size=5,
+    ),
+)
+def test_memory_replay(stages: _MemoryStages) -> None:
+    """Test that Memory stages repeated after a strike can be confirmed with a y."""
+    stage_answers = [
+        (display, "".join(buttons), _ANSWER_NO) for display, buttons in stages
+    ]
+    clean_run = _memory_presses([*chain.from_iterable(stage_answers), _ANSWER_YES])
+    struck_run = _memory_presses([
+        *stage_answers[0],
+        *stage_answers[1][:2],
+        _ANSWER_YES,  # strike at stage 2
+        *(_ANSWER_YES, _ANSWER_NO) * 2,  # both stages confirmed as the same
+        *chain.from_iterable(stage_answers[2:]),
+        _ANSWER_YES,
+    ])
+    assert struck_run == clean_run[:2] + clean_run
+
+
+@given(
+    st.lists(
+        st.sampled_from(sorted(vanilla.SimonSays.valid_colors)), min_size=3, max_size=3,
+    ),
+)
+def test_simon_says_strike(colors: List[str]) -> None:
+    """Test that a Simon Says stage struck without a reset is asked afresh."""
+    solver = vanilla.SimonSays()
+    solver.post_init(Edgework(), BombSolver(solver))
+    # strike at stage 1, then answer all three stages and solve
+    answers = [colors[0], _ANSWER_YES]
+    answers.extend(answer for color in colors for answer in (color, _ANSWER_NO))
+    answers.append(_ANSWER_YES)
+    output: List[str] = []
+    with ask.answer_source(ask.scripted_answers(answers)):
+        with ask.output_sink(output.append):
+            solver.solve()
+    assert solver.all_solved
+    assert not any(line.startswith("Last time") for line in output)
+
+
+if __name__ == "__main__":
+    test_complicated_wires()
+    test_keypad()
+    test_whos_on_first()
+    test_simon_says()
+    test_simon_says_short_sequence()
+    test_memory_replay()
+    test_simon_says_strike()